@@ -0,0 +1,175 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+📈 项目启动器 - 使用统计
+Aggregates: 项目总数/置顶数/总打开次数/IDE 分布/Top-K,随每次修改增量更新,不再每次全量扫描
+UsageLog:   按小时、按天累计的打开次数,查 "本周最常打开" 只需合计 7 个日桶
+"""
+
+import json
+import time
+import heapq
+from datetime import date, timedelta
+
+from persist import atomic_write_json
+
+TOP_K = 10
+# 小时桶保留 48 小时,日桶保留 90 天
+HOURLY_RETENTION = 48
+DAILY_RETENTION = 90
+SPARK_CHARS = '▁▂▃▄▅▆▇█'
+
+
+class Aggregates:
+    """项目的增量汇总 - touch() 在项目增加/修改后调用,discard() 在删除后调用"""
+    def __init__(self, projects, top_k=TOP_K):
+        self.top_k = top_k
+        self.total = 0
+        self.pinned = 0
+        self.total_opens = 0
+        self.ide_counts = {}
+        self._seen = {}
+        # Top-K 最小堆: [打开次数, 序号, 项目];序号保证次数相同时不去比较项目对象
+        self._heap = []
+        self._in_heap = {}
+        self._seq = 0
+        self._heap_stale = False
+        for project in projects:
+            self.touch(project)
+
+    def touch(self, project):
+        """按项目当前的值更新汇总(与上次记录的值做差)"""
+        key = id(project)
+        old = self._seen.get(key)
+        new = (project.ide, project.pinned, project.open_count)
+        if old == new:
+            return
+        if old is None:
+            self.total += 1
+        else:
+            self._apply(old, -1)
+        self._apply(new, 1)
+        self._seen[key] = new
+        self._update_top(project, old[2] if old else 0)
+
+    def discard(self, project):
+        """项目被删除"""
+        old = self._seen.pop(id(project), None)
+        if old is None:
+            return
+        self.total -= 1
+        self._apply(old, -1)
+        if id(project) in self._in_heap:
+            # Top-K 里少了一个,下次查询时重建
+            self._heap_stale = True
+
+    def _apply(self, values, sign):
+        ide, pinned, open_count = values
+        self.ide_counts[ide] = self.ide_counts.get(ide, 0) + sign
+        if not self.ide_counts[ide]:
+            del self.ide_counts[ide]
+        self.pinned += sign if pinned else 0
+        self.total_opens += sign * open_count
+
+    def _update_top(self, project, old_count):
+        count = project.open_count
+        entry = self._in_heap.get(id(project))
+        if entry is not None:
+            entry[0] = count
+            if count < old_count:
+                # 次数变小(如合并导入),堆外的项目可能更大
+                self._heap_stale = True
+            else:
+                heapq.heapify(self._heap)
+        elif len(self._heap) < self.top_k:
+            self._push(project, count)
+        elif count > self._heap[0][0]:
+            dropped = heapq.heappop(self._heap)
+            del self._in_heap[id(dropped[2])]
+            self._push(project, count)
+
+    def _push(self, project, count):
+        self._seq += 1
+        entry = [count, self._seq, project]
+        heapq.heappush(self._heap, entry)
+        self._in_heap[id(project)] = entry
+
+    def rebuild_top(self, projects):
+        """从项目列表重建 Top-K(只在堆失效时需要)"""
+        self._heap = []
+        self._in_heap = {}
+        for project in projects:
+            self._update_top(project, 0)
+        self._heap_stale = False
+
+    def top(self, projects, n=5):
+        """打开次数最多的 n 个项目(n <= top_k)"""
+        if self._heap_stale:
+            self.rebuild_top(projects)
+        ranked = sorted(self._heap, key=lambda entry: (-entry[0], entry[1]))
+        return [project for count, _, project in ranked[:n] if count > 0]
+
+
+class UsageLog:
+    """按小时/按天的打开次数: {'hourly': {小时: {路径: 次数}}, 'daily': {日期: {路径: 次数}}}"""
+    def __init__(self, log_file):
+        self.log_file = log_file
+        try:
+            with open(log_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            data = {}
+        self.hourly = data.get('hourly', {})
+        self.daily = data.get('daily', {})
+
+    def save(self):
+        atomic_write_json(self.log_file, {'hourly': self.hourly, 'daily': self.daily},
+                          separators=(',', ':'))
+
+    def record(self, path, when=None):
+        """记一次打开,顺带清理过期的桶"""
+        when = when or time.time()
+        hour = str(int(when // 3600))
+        day = date.fromtimestamp(when).isoformat()
+        bucket = self.hourly.setdefault(hour, {})
+        bucket[path] = bucket.get(path, 0) + 1
+        bucket = self.daily.setdefault(day, {})
+        bucket[path] = bucket.get(path, 0) + 1
+        self._prune(when)
+
+    def _prune(self, now):
+        oldest_hour = int(now // 3600) - HOURLY_RETENTION
+        for hour in [h for h in self.hourly if int(h) <= oldest_hour]:
+            del self.hourly[hour]
+        oldest_day = (date.fromtimestamp(now) - timedelta(days=DAILY_RETENTION)).isoformat()
+        for day in [d for d in self.daily if d <= oldest_day]:
+            del self.daily[day]
+
+    def _days(self, days, today=None):
+        today = today or date.today()
+        return [(today - timedelta(days=i)).isoformat() for i in range(days - 1, -1, -1)]
+
+    def top_since(self, days=7, limit=5):
+        """最近 days 天打开最多的项目: [(路径, 次数)]"""
+        totals = {}
+        for day in self._days(days):
+            for path, count in self.daily.get(day, {}).items():
+                totals[path] = totals.get(path, 0) + count
+        return heapq.nlargest(limit, totals.items(), key=lambda x: x[1])
+
+    def daily_totals(self, days=14):
+        """最近 days 天每天的打开次数(从早到晚)"""
+        return [sum(self.daily.get(day, {}).values()) for day in self._days(days)]
+
+    def last_hours(self, hours=24, now=None):
+        """最近 hours 小时的打开次数"""
+        current = int((now or time.time()) // 3600)
+        return sum(sum(self.hourly.get(str(h), {}).values()) for h in range(current - hours + 1, current + 1))
+
+
+def format_sparkline(values):
+    """[0, 3, 1, ...] -> '▁▇▃...'"""
+    peak = max(values) if values else 0
+    if not peak:
+        return SPARK_CHARS[0] * len(values)
+    return ''.join(SPARK_CHARS[round(value * (len(SPARK_CHARS) - 1) / peak)] for value in values)
@@ -0,0 +1,460 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+🧩 项目启动器 - 核心组件(不依赖交互界面)
+ProjectStore:  配置与项目的加载/修改/延迟写回,统计汇总与使用记录
+ProjectSearch: 分面 + 关键词查询,匹配不到时先按编辑距离容错,再用 README 全文索引兜底
+Launcher:      用配置的 IDE 打开项目并记一次打开(同时记入最近打开 mru.json)
+open.py 的交互界面建在这三者之上;其他工具可以直接 import core 批量查询/打开,
+不必每次启动一个 open 进程,也不会加载 inquirer/prompt_toolkit
+"""
+
+import os
+import sys
+import json
+import time
+import threading
+from itertools import islice
+from datetime import datetime
+
+import metrics
+from persist import DebouncedWriter, atomic_write_json
+from project import load_projects, dump_projects
+from registry import Registry
+from analytics import Aggregates, UsageLog
+from facets import FacetIndex, parse_query
+from fuzzy import FuzzyIndex, max_edits
+from lookups import write_lookups
+from jump import write_jump_table
+from mru import RecentRing
+from predict import TransitionModel
+from supervisor import LaunchSupervisor, LaunchError, read_telemetry, summarize
+from paths import (CONFIG_DIR, CONFIG_FILE, IDE_CONFIG_FILE, TEXT_INDEX_FILE, REGISTRY_INDEX_FILE,
+                   REGISTRY_DETAIL_FILE, USAGE_FILE, LOOKUPS_FILE, JUMP_FILE, MRU_FILE,
+                   PREDICT_FILE, LAUNCH_LOG_FILE, LOCAL_IDE_CONFIG)
+
+# 默认配置
+DEFAULT_CONFIG = {
+    "settings": {
+        "default_ide": "idea",
+        "theme": "default",
+        "ide_paths": {
+            "idea": r"D:\code\IntelliJ IDEA 2024.3.5\bin\idea64.exe",
+            "vscode": r"C:\Program Files\Microsoft VS Code\Code.exe",
+            "webstorm": r"D:\code\webstorm\WebStorm 2025.1.4.1\bin\webstorm64.exe",
+            "cursor": "cursor"
+        }
+    },
+    "projects": []
+}
+
+
+def read_ide_config():
+    """读取 IDE 配置文件,优先级:本地 config.json > 用户目录;都没有或都读不了时返回 None"""
+    for config_file, label in ((LOCAL_IDE_CONFIG, '本地'), (IDE_CONFIG_FILE, '用户')):
+        if config_file.exists():
+            try:
+                with open(config_file, 'r', encoding='utf-8') as f:
+                    return dict(json.load(f))
+            except Exception as e:
+                print(f"⚠️  读取{label}配置失败: {e}", file=sys.stderr)
+    return None
+
+
+def load_ide_config(config=None):
+    """IDE 路径与默认 IDE,优先级:本地 config.json > 用户目录 > 默认;config 为已经读出的配置文件内容"""
+    if config is None:
+        config = read_ide_config()
+    if config is None:
+        return DEFAULT_CONFIG['settings']['ide_paths'], DEFAULT_CONFIG['settings']['default_ide']
+    return config.get('ide_paths', {}), config.get('default_ide', 'idea')
+
+
+def _config_stat():
+    """projects.json 的 (mtime_ns, 大小),用来发现外部修改"""
+    try:
+        st = os.stat(CONFIG_FILE)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def project_record(project):
+    """项目的热字段(不触发冷明细读取),供脚本模式/RPC 输出"""
+    return {
+        'name': project.name,
+        'alias': project.alias,
+        'path': project.path,
+        'ide': project.ide,
+        'tags': list(project.tags),
+        'pinned': project.pinned,
+        'open_count': project.open_count,
+    }
+
+
+class ProjectStore:
+    """
+    配置与项目列表
+    修改项目后调用 changed()/add()/remove() 维护统计汇总,再调用 save() 标记写回;
+    revision 每次 save() 递增,派生的排序/索引按它缓存
+    写回在后台线程里进行: 直接改项目字段/配置的地方要持有 lock(本类的方法自己会加锁)
+    """
+    def __init__(self):
+        # 加载 IDE 配置
+        self.ide_config = load_ide_config()
+        # 热索引 + 冷明细(projects.json 的派生缓存),启动时只解析热索引
+        self.registry = Registry(REGISTRY_INDEX_FILE, REGISTRY_DETAIL_FILE, CONFIG_FILE)
+        self._load()
+        # 设置了 metrics_file 时把运行指标写到那里(供 node_exporter 采集)
+        metrics.enable(self.settings.get('metrics_file'))
+        # 修改数据与写回共用的锁: 后台写回时不会读到改到一半的配置/使用记录
+        self.lock = threading.RLock()
+        # 配置延迟写回: 连续修改合并成一次原子写入(防抖/退出/收到信号时落盘)
+        self.writer = DebouncedWriter(self._write_config, lock=self.lock)
+
+        # 统计: 增量汇总(第一次使用时构建)与按小时/按天的打开记录
+        self._aggregates = None
+        self.usage = UsageLog(USAGE_FILE)
+        self.usage_writer = DebouncedWriter(self.usage.save, lock=self.lock)
+        # 最近打开的项目(open - / open recent 只读这个小文件)
+        self.mru = RecentRing(MRU_FILE)
+        self.mru_writer = DebouncedWriter(self.mru.save, lock=self.lock)
+        # 打开顺序/时段模型,用来预测接下来要打开的项目
+        self.predictor = TransitionModel(PREDICT_FILE)
+        self.predictor_writer = DebouncedWriter(self.predictor.save, lock=self.lock)
+
+        # 配置版本号,每次保存递增;排序结果/路径索引按版本缓存
+        self.revision = 0
+        self._sorted_cache = None
+        self._path_index = None
+
+    def _load(self):
+        """加载配置并套用 IDE 配置,记下 projects.json 此时的状态"""
+        ide_paths, default_ide = self.ide_config
+        with metrics.timer('promanager_config_load_seconds'):
+            self.config = self.load_config(default_ide)
+        metrics.set_gauge('promanager_projects', len(self.config['projects']))
+        self._disk_stat = _config_stat()
+        # 更新 IDE 配置
+        if 'settings' not in self.config:
+            self.config['settings'] = {}
+        self.config['settings']['ide_paths'] = ide_paths
+        self.config['settings']['default_ide'] = default_ide
+        # Shell 补全缓存/跳转表第一次使用前生成,之后随每次写回更新
+        if not LOOKUPS_FILE.exists() or not JUMP_FILE.exists():
+            self._write_lookups()
+
+    def _write_lookups(self):
+        """重写补全缓存与跳转表(顺序同主菜单;可能在后台写回线程里执行,所以不用排序缓存)"""
+        projects = sorted(self.config['projects'], key=lambda p: (not p.pinned, -p.open_count))
+        try:
+            write_lookups(LOOKUPS_FILE, projects)
+            write_jump_table(JUMP_FILE, projects)
+        except OSError:
+            pass
+
+    def reload_if_changed(self):
+        """
+        projects.json 被外部修改(手动编辑/另一个 open 进程)时重新加载,返回是否重新加载
+        本进程还有未写回的修改时以本进程为准,写回后再比较
+        """
+        with self.lock:
+            if self.writer.dirty or _config_stat() == self._disk_stat:
+                return False
+            self._load()
+            self.revision += 1
+            self._aggregates = None
+            # 另一个进程打开过项目,最近打开列表也一起更新
+            if not self.mru_writer.dirty:
+                self.mru.load()
+            if not self.predictor_writer.dirty:
+                self.predictor.load()
+            return True
+
+    def load_config(self, default_ide='idea'):
+        """加载配置(项目转成 Project 记录,缺失字段在这里一次补齐)"""
+        if not CONFIG_FILE.exists():
+            CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+            atomic_write_json(CONFIG_FILE, DEFAULT_CONFIG, indent=2)
+            config = DEFAULT_CONFIG.copy()
+            config['projects'] = []
+            return config
+
+        # 热索引有效时不解析 projects.json,项目的冷字段按需从明细文件读取
+        config = self.registry.load()
+        if config is not None:
+            return config
+
+        with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
+            config = json.load(f)
+        config['projects'] = load_projects(config.get('projects', []), default_ide)
+        # 重建热索引,下次启动走快速路径
+        self.registry.save(config)
+        return config
+
+    @property
+    def projects(self):
+        return self.config['projects']
+
+    @property
+    def settings(self):
+        return self.config['settings']
+
+    def save(self):
+        """保存配置(标记修改,稍后由 writer 合并写回)"""
+        with self.lock:
+            self.revision += 1
+            self.writer.mark_dirty()
+
+    def flush(self):
+        """立即写回未落盘的修改"""
+        self.writer.flush()
+        self.usage_writer.flush()
+        self.mru_writer.flush()
+        self.predictor_writer.flush()
+        metrics.flush()
+
+    def _write_config(self):
+        """把配置原子写回磁盘"""
+        start = time.perf_counter()
+        data = dict(self.config)
+        data['projects'] = dump_projects(self.config['projects'])
+        atomic_write_json(CONFIG_FILE, data, indent=2)
+        metrics.observe('promanager_config_save_seconds', time.perf_counter() - start)
+        metrics.set_gauge('promanager_projects', len(data['projects']))
+        self._disk_stat = _config_stat()
+        self.registry.save(self.config)
+        self._write_lookups()
+
+    def sorted_projects(self):
+        """获取排序后的项目(置顶 + 打开次数),按配置版本缓存"""
+        if self._sorted_cache and self._sorted_cache[0] == self.revision:
+            return list(self._sorted_cache[1])
+
+        projects = self.config['projects']
+        pinned = [p for p in projects if p.pinned]
+        unpinned = [p for p in projects if not p.pinned]
+
+        pinned.sort(key=lambda x: x.open_count, reverse=True)
+        unpinned.sort(key=lambda x: x.open_count, reverse=True)
+
+        self._sorted_cache = (self.revision, pinned + unpinned)
+        return pinned + unpinned
+
+    def path_index(self):
+        """路径 -> 项目(按配置版本缓存)"""
+        if not self._path_index or self._path_index[0] != self.revision:
+            self._path_index = (self.revision, {p.path: p for p in self.config['projects']})
+        return self._path_index[1]
+
+    def aggregates(self):
+        """统计汇总(第一次使用时扫描一遍,之后随修改增量更新)"""
+        if self._aggregates is None:
+            self._aggregates = Aggregates(self.config['projects'])
+        return self._aggregates
+
+    def stats(self):
+        """统计汇总(可直接序列化为 JSON)"""
+        stats = self.aggregates()
+        by_path = self.path_index()
+        return {
+            'total': stats.total,
+            'pinned': stats.pinned,
+            'total_opens': stats.total_opens,
+            'ide_counts': dict(stats.ide_counts),
+            'top': [{'name': p.name, 'path': p.path, 'open_count': p.open_count}
+                    for p in stats.top(self.projects, 5)],
+            'daily': self.usage.daily_totals(14),
+            'last_24h': self.usage.last_hours(24),
+            'weekly': [{'name': by_path[path].name, 'path': path, 'count': count}
+                       for path, count in self.usage.top_since(7, 5) if path in by_path],
+            'launches': self.launch_summary(),
+        }
+
+    def launch_summary(self):
+        """按 IDE 汇总启动遥测: 次数/失败数/Popen 耗时 p50、p95(毫秒)"""
+        return summarize(read_telemetry(LAUNCH_LOG_FILE))
+
+    def changed(self, project):
+        """项目新增或修改后调用,更新统计汇总"""
+        with self.lock:
+            if self._aggregates is not None:
+                self._aggregates.touch(project)
+
+    def add(self, project):
+        """追加项目(调用方随后 save())"""
+        with self.lock:
+            self.config['projects'].append(project)
+            self.changed(project)
+
+    def remove(self, project):
+        """删除项目(调用方随后 save())"""
+        with self.lock:
+            self.config['projects'].remove(project)
+            if self._aggregates is not None:
+                self._aggregates.discard(project)
+            self.mru.discard(project.path)
+            self.mru_writer.mark_dirty()
+            self.predictor.discard(project.path)
+            self.predictor_writer.mark_dirty()
+
+    def record_open(self, project, ide=None):
+        """记一次打开: 打开次数/最近打开时间/按小时按天的使用记录/最近打开列表"""
+        with self.lock:
+            project.open_count += 1
+            project.last_opened = datetime.now().isoformat()
+            self.usage.record(project.path)
+            self.usage_writer.mark_dirty()
+            self.mru.push(project.path, project.name, ide or project.ide)
+            self.mru_writer.mark_dirty()
+            self.predictor.record(project.path)
+            self.predictor_writer.mark_dirty()
+            self.changed(project)
+        metrics.inc('promanager_opens', (('ide', ide or project.ide),))
+
+    def predicted(self, limit=3):
+        """按打开顺序与时段预测接下来最可能打开的项目"""
+        by_path = self.path_index()
+        return [by_path[path] for path, _ in self.predictor.predict(limit) if path in by_path]
+
+
+class ProjectSearch:
+    """项目查询: ide:xxx tag:xxx pinned:yes 分面 + 关键词(名称/别名/描述)"""
+    def __init__(self, store):
+        self.store = store
+        self._facet_index = None
+        self._fuzzy_index = None
+        # README 全文索引(首次兜底搜索时才加载)
+        self._text_index = None
+
+    def facet_index(self):
+        """分面位图索引(配置变化后重建)"""
+        if self._facet_index is None or self._facet_index[0] != self.store.revision:
+            self._facet_index = (self.store.revision, FacetIndex(self.store.projects))
+        return self._facet_index[1]
+
+    def fuzzy_index(self):
+        """别名/名称词表的容错索引(配置变化后重建)"""
+        if self._fuzzy_index is None or self._fuzzy_index[0] != self.store.revision:
+            words = [w for p in self.store.projects for w in (p.alias_lower, p.name_lower) if w]
+            self._fuzzy_index = (self.store.revision, FuzzyIndex(words))
+        return self._fuzzy_index[1]
+
+    def text_index(self):
+        """README 全文索引(首次使用时加载;配置变化后增量刷新,增删的项目随之进出索引)"""
+        if self._text_index is None or self._text_index[0] != self.store.revision:
+            if self._text_index is None:
+                from textindex import TextIndex
+                index = TextIndex(TEXT_INDEX_FILE)
+            else:
+                index = self._text_index[1]
+            index.refresh([p.path for p in self.store.projects])
+            self._text_index = (self.store.revision, index)
+        return self._text_index[1]
+
+    def filter(self, query, candidates=None, limit=None):
+        """
+        按查询过滤项目(candidates 默认是排序后的全部项目)
+        关键词匹配不到时先找别名/名称打错字的项目,再用 README 全文索引兜底;
+        给了 limit 时凑够就停止扫描(输入即搜)
+        """
+        with metrics.timer('promanager_search_seconds'):
+            return self._filter(query, candidates, limit)
+
+    def _filter(self, query, candidates, limit):
+        if candidates is None:
+            candidates = self.store.sorted_projects()
+        facets, keyword = parse_query(query)
+        if facets:
+            allowed = {id(p) for p in self.facet_index().filter(facets)}
+            candidates = [p for p in candidates if id(p) in allowed]
+        if not keyword:
+            return candidates[:limit]
+
+        keyword_lower = keyword.lower()
+        matched = list(islice((p for p in candidates if p.matches(keyword_lower)), limit))
+
+        if not matched:
+            # 容错: shpo -> shop
+            matched = self.search_fuzzy(keyword_lower, candidates)[:limit]
+        if not matched:
+            # 兜底: README/描述全文搜索
+            matched = self.search_text(keyword, candidates)[:limit]
+        return matched
+
+    def filter_many(self, queries, candidates=None):
+        """批量查询: {查询: [项目]},排序结果与索引只准备一次"""
+        if candidates is None:
+            candidates = self.store.sorted_projects()
+        return {query: self.filter(query, candidates) for query in queries}
+
+    def search_fuzzy(self, keyword_lower, candidates):
+        """容错兜底 - 别名/名称与关键词的编辑距离在 max_edits() 以内,距离小的在前(同距离保持原顺序)"""
+        edits = max_edits(keyword_lower)
+        if not edits:
+            return []
+        distances = {word: dist for dist, word in self.fuzzy_index().search(keyword_lower, edits)}
+        if not distances:
+            return []
+        missing = edits + 1
+        scored = []
+        for p in candidates:
+            dist = min(distances.get(p.alias_lower, missing), distances.get(p.name_lower, missing))
+            if dist <= edits:
+                scored.append((dist, p))
+        scored.sort(key=lambda x: x[0])
+        return [p for _, p in scored]
+
+    def search_text(self, keyword, candidates):
+        """全文索引兜底 - 名称/别名/描述都没匹配到时,按 README 与清单描述的相关度排序"""
+        by_path = {p.path: p for p in candidates}
+        return [by_path[path] for path, _ in self.text_index().search(keyword) if path in by_path]
+
+
+class Launcher:
+    """
+    用项目的 IDE(或指定的 IDE)打开项目,成功后记一次打开
+    进程交给 LaunchSupervisor: 等过宽限期再判定成功,启动后立即出错退出的算打开失败
+    """
+    def __init__(self, store, supervisor=None):
+        self.store = store
+        self.supervisor = supervisor or LaunchSupervisor(LAUNCH_LOG_FILE)
+
+    def _spawn(self, project, ide):
+        return self.supervisor.spawn(ide, self.store.settings['ide_paths'].get(ide), project.path)
+
+    def launch(self, project, ide=None, save=True, wait=True):
+        """
+        打开一个项目;save=False 时由调用方统一保存
+        wait=False 时不等宽限期(常驻进程用),启动结果只记入遥测
+        """
+        ide = ide or project.ide
+        launch = self._spawn(project, ide)
+        if wait:
+            self.supervisor.settle([launch])
+            if launch.error():
+                raise LaunchError(launch.error())
+
+        self.store.record_open(project, ide)
+        if save:
+            self.store.save()
+
+    def launch_many(self, projects, ide=None):
+        """批量打开: 先全部启动,再一起等宽限期,最后统一保存一次;返回 [(项目, 错误或 None)]"""
+        errors = {}
+        started = []
+        for i, project in enumerate(projects):
+            try:
+                started.append((i, project, self._spawn(project, ide or project.ide)))
+            except LaunchError as e:
+                errors[i] = e
+        self.supervisor.settle([launch for _, _, launch in started])
+
+        for i, project, launch in started:
+            if launch.error():
+                errors[i] = LaunchError(launch.error())
+            else:
+                self.store.record_open(project, launch.ide)
+        if len(errors) < len(projects):
+            self.store.save()
+        return [(project, errors.get(i)) for i, project in enumerate(projects)]
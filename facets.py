@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+🏷️ 项目启动器 - 标签与分面筛选
+查询语法: ide:vscode tag:backend pinned:yes shop
+每个分面取值对应一个位图(Python 大整数),组合筛选就是按位与
+"""
+
+FACET_FIELDS = {
+    'ide': 'ide',
+    'tag': 'tag',
+    't': 'tag',
+    'pinned': 'pinned',
+    'pin': 'pinned',
+}
+TRUE_VALUES = {'yes', 'y', 'true', '1', 'on', '是'}
+
+
+def parse_tags(text):
+    """'Backend, web ,backend' -> ['backend', 'web']"""
+    tags = []
+    for tag in text.replace('，', ',').split(','):
+        tag = tag.strip().lower()
+        if tag and tag not in tags:
+            tags.append(tag)
+    return tags
+
+
+def parse_query(query):
+    """拆分查询: 返回 ([(分面, 值)], 剩余关键词)"""
+    facets = []
+    words = []
+    for word in query.split():
+        field, sep, value = word.partition(':')
+        field = FACET_FIELDS.get(field.lower()) if sep else None
+        if field and value:
+            value = value.lower()
+            if field == 'pinned':
+                value = 'yes' if value in TRUE_VALUES else 'no'
+            facets.append((field, value))
+        else:
+            words.append(word)
+    return facets, ' '.join(words)
+
+
+def _facet_values(project):
+    yield 'ide', project.ide
+    yield 'pinned', 'yes' if project.pinned else 'no'
+    for tag in project.tags:
+        yield 'tag', tag
+
+
+class FacetIndex:
+    """分面位图索引 - 第 i 位表示第 i 个项目"""
+    def __init__(self, projects):
+        self.projects = list(projects)
+        positions = {}
+        for i, project in enumerate(self.projects):
+            for field, value in _facet_values(project):
+                positions.setdefault((field, value), []).append(i)
+
+        # 先收集位置再一次性转成整数,避免逐位 |= 反复复制大整数
+        size = len(self.projects) // 8 + 1
+        self.bitmaps = {}
+        for key, ids in positions.items():
+            buf = bytearray(size)
+            for i in ids:
+                buf[i >> 3] |= 1 << (i & 7)
+            self.bitmaps[key] = int.from_bytes(buf, 'little')
+        self.all = (1 << len(self.projects)) - 1
+
+    def select(self, facets):
+        """同一分面内取并集,不同分面间取交集,返回位图"""
+        by_field = {}
+        for field, value in facets:
+            by_field[field] = by_field.get(field, 0) | self.bitmaps.get((field, value), 0)
+        result = self.all
+        for bitmap in by_field.values():
+            result &= bitmap
+        return result
+
+    def members(self, bitmap):
+        """位图 -> 项目列表(保持原顺序)"""
+        result = []
+        for byte_index, byte in enumerate(bitmap.to_bytes(len(self.projects) // 8 + 1, 'little')):
+            if byte:
+                base = byte_index << 3
+                for bit in range(8):
+                    if byte >> bit & 1:
+                        result.append(self.projects[base + bit])
+        return result
+
+    def filter(self, facets):
+        """按分面筛选项目"""
+        return self.members(self.select(facets))
+
+    def counts(self, field):
+        """某个分面下各取值的项目数: {值: 数量},按数量降序"""
+        counts = {value: bin(bitmap).count('1')
+                  for (f, value), bitmap in self.bitmaps.items() if f == field}
+        return dict(sorted(counts.items(), key=lambda x: x[1], reverse=True))
@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+🔎 项目启动器 - 文件名索引
+记录所有项目下的文件相对路径,回答 "这个文件在哪个项目里?"
+索引以 zlib 压缩后落盘,按目录指纹增量更新
+"""
+
+import os
+import json
+import time
+import zlib
+
+from persist import atomic_write
+from projscan import walk, dir_fingerprint, CACHE_TTL
+
+INDEX_VERSION = 1
+
+
+class FileIndex:
+    """跨项目文件名索引 - 每个项目一段 '\\n' 分隔的相对路径"""
+    def __init__(self, index_file, ttl=CACHE_TTL):
+        self.index_file = index_file
+        self.ttl = ttl
+        self.entries = {}
+        self._lower = {}
+        self.load()
+
+    def load(self):
+        """加载压缩索引,格式不对就当作空索引"""
+        try:
+            with open(self.index_file, 'rb') as f:
+                data = json.loads(zlib.decompress(f.read()).decode('utf-8'))
+            if data.get('version') == INDEX_VERSION:
+                self.entries = data.get('projects', {})
+        except (OSError, ValueError, zlib.error):
+            self.entries = {}
+        self._lower = {}
+
+    def save(self):
+        """压缩后写盘"""
+        data = json.dumps({'version': INDEX_VERSION, 'projects': self.entries},
+                          ensure_ascii=False, separators=(',', ':'))
+        try:
+            atomic_write(self.index_file, zlib.compress(data.encode('utf-8'), 6))
+        except OSError:
+            pass
+
+    def missing(self, paths):
+        """还没建索引的项目"""
+        return [path for path in paths if path not in self.entries]
+
+    def update(self, paths, check_all=True):
+        """
+        增量更新: 只重新扫描新增或指纹变化的项目,并移除已注销的项目
+        check_all=False 时只补建缺失项目,不做指纹检查(最快)
+        返回重新扫描的项目数
+        """
+        now = time.time()
+        stale = {}
+        for path in paths:
+            entry = self.entries.get(path)
+            if entry and not check_all:
+                continue
+            fp = dir_fingerprint(path)
+            if fp is None:
+                continue
+            if entry and entry.get('fp') == fp and now - entry.get('at', 0) < self.ttl:
+                continue
+            stale[path] = fp
+
+        registered = set(paths)
+        removed = [path for path in self.entries if path not in registered]
+        for path in removed:
+            del self.entries[path]
+
+        if stale:
+            files = {path: [] for path in stale}
+
+            def visit(root, dirpath, names):
+                rel = os.path.relpath(dirpath, root).replace(os.sep, '/')
+                prefix = '' if rel == '.' else rel + '/'
+                files[root].extend(prefix + name for name, _ in names)
+
+            walk(stale, visit)
+            for path, names in files.items():
+                names.sort()
+                self.entries[path] = {'fp': stale[path], 'at': now, 'files': '\n'.join(names)}
+
+        if stale or removed:
+            self._lower = {}
+            self.save()
+        return len(stale)
+
+    def search(self, fragment, limit=50, roots=None):
+        """
+        按文件名片段搜索(不区分大小写,只匹配文件名部分),返回 [(项目路径, 相对路径)]
+        roots 为当前登记的项目路径时,只搜这些项目(索引里可能还留着已删除的项目)
+        """
+        needle = fragment.lower().replace('\\', '/')
+        if not needle:
+            return []
+        results = []
+        for path, entry in self.entries.items():
+            if roots is not None and path not in roots:
+                continue
+            text = entry['files']
+            lower = self._lower.get(path)
+            if lower is None:
+                lower = self._lower[path] = text.lower()
+            if len(lower) != len(text):
+                # 个别字符转小写后长度会变,位置对不上时直接返回小写路径
+                text = lower
+
+            pos = lower.find(needle)
+            while pos != -1:
+                start = lower.rfind('\n', 0, pos) + 1
+                end = lower.find('\n', pos)
+                if end == -1:
+                    end = len(lower)
+                # 命中位置必须落在最后一个 '/' 之后(即文件名部分)
+                if '/' in needle or pos >= lower.rfind('/', start, end) + 1:
+                    results.append((path, text[start:end]))
+                    if len(results) >= limit:
+                        return results
+                    pos = lower.find(needle, end)
+                else:
+                    # 命中在目录部分: 同一行的文件名里可能还有(shop/shop.py)
+                    pos = lower.find(needle, pos + 1)
+        return results
+
+    def count(self):
+        """索引中的文件总数"""
+        return sum(entry['files'].count('\n') + 1 for entry in self.entries.values() if entry['files'])
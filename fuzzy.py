@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+🩹 项目启动器 - 容错匹配(打错字也能找到)
+FuzzyIndex 把别名/名称词表排好序,查询时按前缀逐个字母推进编辑距离的一行,
+相同前缀的行直接复用(等价于在前缀树上运行 Levenshtein 自动机);
+某个前缀的整行都超出距离上限时,用二分跳过所有以它开头的词,所以几万个词也只需访问很少的前缀
+距离按相邻字母颠倒算一次编辑(shpo -> shop 为 1)
+"""
+
+from bisect import bisect_right
+
+# 比任何实际字符都大,用来跳过同一前缀的所有词
+_PREFIX_END = '\U0010ffff'
+
+
+def max_edits(word):
+    """按关键词长度允许的编辑次数: 很短的词不做容错,免得什么都能匹配上"""
+    if len(word) < 3:
+        return 0
+    return 1 if len(word) <= 5 else 2
+
+
+class FuzzyIndex:
+    """有界编辑距离查询;words 为已转小写的词(重复的会去掉)"""
+    def __init__(self, words):
+        self.words = sorted(set(words))
+
+    def __len__(self):
+        return len(self.words)
+
+    def search(self, word, max_dist):
+        """与 word 的编辑距离不超过 max_dist 的词: [(距离, 词)],距离小的在前"""
+        words = self.words
+        width = len(word) + 1
+        # rows[i]: 当前前缀(prefix 的前 i 个字母)与 word 的距离行
+        rows = [list(range(width))]
+        prefix = ''
+        results = []
+        i = 0
+        while i < len(words):
+            candidate = words[i]
+            # 与上一个前缀相同的部分直接复用已经算好的行
+            common = 0
+            limit = min(len(prefix), len(candidate))
+            while common < limit and prefix[common] == candidate[common]:
+                common += 1
+            del rows[common + 1:]
+
+            pruned = False
+            for pos in range(common, len(candidate)):
+                row = self._next_row(rows, candidate, pos, word)
+                rows.append(row)
+                if min(row) > max_dist:
+                    # 这个前缀已经超出上限,以它开头的词都不用再看
+                    prefix = candidate[:pos + 1]
+                    i = bisect_right(words, prefix + _PREFIX_END, i)
+                    pruned = True
+                    break
+            if pruned:
+                continue
+
+            prefix = candidate
+            if rows[-1][-1] <= max_dist:
+                results.append((rows[-1][-1], candidate))
+            i += 1
+        results.sort()
+        return results
+
+    @staticmethod
+    def _next_row(rows, candidate, pos, word):
+        """prefix 多一个字母 candidate[pos] 之后的距离行(含相邻颠倒)"""
+        previous = rows[-1]
+        before = rows[-2] if pos > 0 else None
+        char = candidate[pos]
+        last_char = candidate[pos - 1] if pos > 0 else None
+        row = [pos + 1]
+        for j in range(1, len(word) + 1):
+            cost = previous[j - 1] + (word[j - 1] != char)
+            cost = min(cost, previous[j] + 1, row[j - 1] + 1)
+            if before is not None and j > 1 and word[j - 1] == last_char and word[j - 2] == char:
+                cost = min(cost, before[j - 2] + 1)
+            row.append(cost)
+        return row
@@ -0,0 +1,216 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+🌿 项目启动器 - Git 状态
+后台线程池并发查询分支/改动/领先落后/最后提交时间,
+结果按 .git/HEAD 与 index 的 mtime 缓存,不阻塞菜单显示
+"""
+
+import os
+import json
+import time
+import threading
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+from persist import atomic_write_json
+
+# 并发上限 / 单条 git 命令超时(秒) / 缓存有效期(秒)
+MAX_WORKERS = 8
+GIT_TIMEOUT = 3
+CACHE_TTL = 300
+
+
+def find_git_dir(path):
+    """返回项目的 .git 目录,支持 worktree/submodule 的 .git 文件"""
+    git = os.path.join(path, '.git')
+    if os.path.isdir(git):
+        return git
+    if os.path.isfile(git):
+        try:
+            with open(git, 'r', encoding='utf-8') as f:
+                line = f.readline().strip()
+            if line.startswith('gitdir:'):
+                gitdir = line[len('gitdir:'):].strip()
+                return os.path.normpath(os.path.join(path, gitdir))
+        except OSError:
+            pass
+    return None
+
+
+def _mtime(path):
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return 0
+
+
+def fingerprint(path):
+    """缓存键: .git/HEAD 与 .git/index 的 mtime,非 git 项目返回 None"""
+    git_dir = find_git_dir(path)
+    if not git_dir:
+        return None
+    return [_mtime(os.path.join(git_dir, 'HEAD')), _mtime(os.path.join(git_dir, 'index'))]
+
+
+def _run_git(path, args, timeout):
+    result = subprocess.run(['git', '-C', path] + args,
+                            stdout=subprocess.PIPE,
+                            stderr=subprocess.DEVNULL,
+                            stdin=subprocess.DEVNULL,
+                            timeout=timeout)
+    if result.returncode != 0:
+        return None
+    return result.stdout.decode('utf-8', errors='replace')
+
+
+def query_status(path, timeout=GIT_TIMEOUT):
+    """查询单个仓库的状态,失败返回 None"""
+    try:
+        out = _run_git(path, ['status', '--porcelain=v2', '--branch'], timeout)
+        if out is None:
+            return None
+
+        status = {'branch': '', 'dirty': False, 'ahead': 0, 'behind': 0, 'last_commit': 0}
+        for line in out.splitlines():
+            if line.startswith('# branch.head '):
+                status['branch'] = line[len('# branch.head '):]
+            elif line.startswith('# branch.ab '):
+                ahead, behind = line[len('# branch.ab '):].split()
+                status['ahead'] = int(ahead.lstrip('+'))
+                status['behind'] = int(behind.lstrip('-'))
+            elif line and not line.startswith('#'):
+                status['dirty'] = True
+
+        log = _run_git(path, ['log', '-1', '--format=%ct'], timeout)
+        if log and log.strip().isdigit():
+            status['last_commit'] = int(log.strip())
+        return status
+    except (OSError, subprocess.SubprocessError, ValueError):
+        return None
+
+
+def format_age(timestamp, now=None):
+    """把提交时间格式化为 '3天前' 这样的相对时间"""
+    if not timestamp:
+        return ''
+    seconds = max(0, int((now or time.time()) - timestamp))
+    if seconds < 60:
+        return "刚刚"
+    if seconds < 3600:
+        return f"{seconds // 60}分钟前"
+    if seconds < 86400:
+        return f"{seconds // 3600}小时前"
+    if seconds < 86400 * 30:
+        return f"{seconds // 86400}天前"
+    if seconds < 86400 * 365:
+        return f"{seconds // (86400 * 30)}个月前"
+    return f"{seconds // (86400 * 365)}年前"
+
+
+def status_key(status):
+    """不含提交时间的状态(分支/改动/领先落后),没有分支信息时为 None"""
+    if not status or not status.get('branch'):
+        return None
+    return (status['branch'], bool(status.get('dirty')), status.get('ahead', 0), status.get('behind', 0))
+
+
+def format_status(status, with_age=True):
+    """格式化为紧凑的一段文字: ⎇ main* ↑1↓2 3天前(with_age=False 时不带相对时间)"""
+    if not status or not status.get('branch'):
+        return ''
+    text = f"⎇ {status['branch'][:20]}"
+    if status.get('dirty'):
+        text += "*"
+    if status.get('ahead'):
+        text += f" ↑{status['ahead']}"
+    if status.get('behind'):
+        text += f" ↓{status['behind']}"
+    age = format_age(status.get('last_commit')) if with_age else ''
+    if age:
+        text += f" {age}"
+    return text
+
+
+class GitStatusCache:
+    """Git 状态缓存 - 立即返回已缓存的值,过期的在后台刷新"""
+    def __init__(self, cache_file, max_workers=MAX_WORKERS, timeout=GIT_TIMEOUT, ttl=CACHE_TTL):
+        self.cache_file = cache_file
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.ttl = ttl
+        self.entries = {}
+        self._pending = set()
+        self._lock = threading.Lock()
+        self._executor = None
+        self._dirty = False
+        self.load()
+
+    def load(self):
+        """加载缓存文件"""
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f)
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def save(self):
+        """保存缓存文件(只在有更新时写入)"""
+        with self._lock:
+            if not self._dirty:
+                return
+            data = dict(self.entries)
+            self._dirty = False
+        try:
+            atomic_write_json(self.cache_file, data)
+        except OSError:
+            pass
+
+    def get(self, path):
+        """返回缓存的状态(可能已过期),没有则返回 None"""
+        entry = self.entries.get(path)
+        return entry['status'] if entry else None
+
+    def is_fresh(self, path, fp=None):
+        """指纹一致且未超过 TTL 才算新鲜"""
+        entry = self.entries.get(path)
+        if not entry:
+            return False
+        if fp is None:
+            fp = fingerprint(path)
+        return entry.get('fp') == fp and time.time() - entry.get('at', 0) < self.ttl
+
+    def refresh(self, paths, on_update=None):
+        """在后台刷新过期的仓库状态,立即返回(指纹也在后台线程里取,不占用界面线程)"""
+        for path in paths:
+            with self._lock:
+                if path in self._pending:
+                    continue
+                self._pending.add(path)
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                        thread_name_prefix='git-status')
+            self._executor.submit(self._update, path, on_update)
+
+    def _update(self, path, on_update):
+        fp = fingerprint(path)
+        status = None
+        if fp is not None and not self.is_fresh(path, fp):
+            status = query_status(path, self.timeout)
+        with self._lock:
+            self._pending.discard(path)
+            if status is not None:
+                self.entries[path] = {'fp': fp, 'at': time.time(), 'status': status}
+                self._dirty = True
+            done = not self._pending
+        if status is not None and on_update:
+            on_update(path, status)
+        if done:
+            self.save()
+
+    def close(self):
+        """退出前调用: 取消还在排队的查询,不等正在运行的(最多 GIT_TIMEOUT),写回已有结果"""
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+        self.save()
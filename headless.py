@@ -0,0 +1,185 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+🤖 项目启动器 - 脚本模式(open --json / --no-interactive)
+结果逐行输出 JSON(NDJSON),不清屏、不等回车,也不加载 inquirer/prompt_toolkit;
+列表直接复用热索引与排序/查询缓存,适合脚本和看板频繁轮询
+出错时输出一行 {"error": ...} 并返回非零退出码
+"""
+
+import os
+import sys
+import json
+from datetime import datetime
+
+from core import ProjectStore, ProjectSearch, project_record
+from paths import CONFIG_FILE, STATS_CACHE_FILE, FILE_INDEX_FILE
+from project import Project
+
+# 触发脚本模式的参数(可以放在任意位置)
+FLAGS = ('--json', '--no-interactive')
+
+# 复用同一个编码器(json.dumps 带参数时每次都要新建一个)
+_encoder = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+
+
+def emit(obj):
+    """输出一行 JSON"""
+    sys.stdout.write(_encoder.encode(obj))
+    sys.stdout.write('\n')
+
+
+def cmd_list(store, search, args):
+    """open ls [查询] --json - 按主菜单顺序(置顶 + 打开次数)输出项目"""
+    query = ' '.join(args)
+    projects = search.filter(query) if query else store.sorted_projects()
+    for project in projects:
+        emit(project_record(project))
+    return 0
+
+
+def cmd_stats(store, search, args):
+    """open stats --json - 一行汇总;open stats size --json - 每个项目一行磁盘占用"""
+    if args and args[0].lower() == 'size':
+        from projscan import StatsCache, top_languages
+        projects = store.projects
+        sizes = StatsCache(STATS_CACHE_FILE).collect([p.path for p in projects])
+        ranked = sorted((p for p in projects if p.path in sizes),
+                        key=lambda x: sizes[x.path]['size'], reverse=True)
+        for project in ranked:
+            stats = sizes[project.path]
+            emit({
+                'name': project.name,
+                'path': project.path,
+                'size': stats['size'],
+                'files': stats['files'],
+                'languages': {lang: round(pct, 1) for lang, pct in top_languages(stats)},
+            })
+        return 0
+
+    emit(store.stats())
+    return 0
+
+
+def cmd_find(store, search, args):
+    """open find <文件名> --json - 每个命中的文件一行"""
+    fragment = ' '.join(args)
+    if not fragment:
+        emit({'error': '缺少文件名'})
+        return 2
+
+    from fileindex import FileIndex
+    index = FileIndex(FILE_INDEX_FILE)
+    paths = [p.path for p in store.projects]
+    if index.missing(paths):
+        index.update(paths, check_all=False)
+    by_path = store.path_index()
+    hits = index.search(fragment, roots=by_path)
+    if not hits and index.update(paths):
+        hits = index.search(fragment, roots=by_path)
+
+    for path, rel in hits:
+        emit({'name': by_path[path].name, 'path': path, 'file': rel})
+    return 0
+
+
+def cmd_add(store, search, args):
+    """open add [路径] --json - 按默认值添加(名称取目录名,IDE 取默认 IDE)"""
+    path = os.path.abspath(args[0] if args else os.getcwd())
+    if not os.path.exists(path):
+        emit({'error': f'路径不存在: {path}'})
+        return 1
+    existing = store.path_index().get(path)
+    if existing is not None:
+        emit({'error': f'该路径已存在: {existing.name}', 'path': path})
+        return 1
+
+    name = os.path.basename(path) or path
+    alias = name if all(p.alias != name for p in store.projects) else ''
+    project = Project(name=name, alias=alias, path=path,
+                      ide=store.settings['default_ide'],
+                      created_at=datetime.now().isoformat())
+    store.add(project)
+    store.save()
+    store.flush()
+    emit(project_record(project))
+    return 0
+
+
+def cmd_export(store, search, args):
+    """open export [文件] --json - 同 export,只是不输出提示"""
+    import transfer
+    target = args[0] if args else '-'
+    if target == '-':
+        transfer.export_projects(store.projects, sys.stdout)
+        return 0
+    with open(target, 'w', encoding='utf-8', newline='\n') as f:
+        count = transfer.export_projects(store.projects, f)
+    emit({'exported': count, 'file': target})
+    return 0
+
+
+def cmd_import(store, search, args):
+    """open import [文件] --json - 导入结果一行"""
+    import transfer
+    source = args[0] if args else '-'
+    if source == '-':
+        stream = open(sys.stdin.fileno(), 'r', encoding='utf-8', closefd=False)
+    else:
+        stream = open(source, 'r', encoding='utf-8')
+    with stream, store.lock:
+        result = transfer.import_projects(stream, store.projects, store.settings['default_ide'])
+        for project in result.added + result.merged:
+            store.changed(project)
+    if result.added or result.merged:
+        store.save()
+        store.flush()
+    emit({
+        'added': len(result.added),
+        'merged': len(result.merged),
+        'errors': [{'line': lineno, 'error': error} for lineno, error in result.errors],
+        'alias_conflicts': [{'line': lineno, 'alias': alias} for lineno, alias in result.alias_conflicts],
+    })
+    return 0
+
+
+def cmd_config(store, search, args):
+    """open config --json - 配置文件位置与设置"""
+    emit({'config_file': str(CONFIG_FILE), 'settings': store.settings})
+    return 0
+
+
+COMMANDS = {
+    'list': cmd_list,
+    'ls': cmd_list,
+    'stats': cmd_stats,
+    'find': cmd_find,
+    'add': cmd_add,
+    'export': cmd_export,
+    'import': cmd_import,
+    'config': cmd_config,
+}
+
+
+def main(args):
+    """args 已去掉 --json/--no-interactive;没有命令时等同 ls"""
+    cmd = args[0].lower() if args else 'ls'
+    handler = COMMANDS.get(cmd)
+    if handler is None:
+        emit({'error': f'脚本模式不支持的命令: {cmd}', 'commands': sorted(COMMANDS)})
+        return 2
+
+    try:
+        # 加载配置也在 try 里: projects.json 损坏时同样输出一行 {"error": ...}
+        store = ProjectStore()
+        search = ProjectSearch(store)
+        code = handler(store, search, args[1:])
+        sys.stdout.flush()
+        return code
+    except BrokenPipeError:
+        # 下游(head 等)提前关闭了管道: 不再输出,也不算错误
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 0
+    except (OSError, ValueError) as e:
+        emit({'error': str(e)})
+        return 1
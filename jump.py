@@ -0,0 +1,217 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+🦘 项目启动器 - 目录跳转(open cd <查询>)
+jump.tsv: 每行 路径\\t别名\\t名称\\t打开次数\\t最近打开(时间戳),每次写回配置时重新生成;
+open cd 只读这个文件,在导入任何较重的模块之前按 匹配程度 + frecency(次数 × 新近度)选出最佳项目,
+把路径打印出来交给 shell 函数去 cd(子进程改不了父 shell 的当前目录,所以需要 open init 的包装函数)
+"""
+
+import os
+import sys
+import time
+
+# frecency 的新近度权重: (距上次打开的秒数上限, 权重)
+RECENCY_WEIGHTS = ((3600, 4.0), (86400, 2.0), (7 * 86400, 0.5))
+OLD_WEIGHT = 0.25
+# 最多检查多少个候选目录是否还存在
+MAX_CHECKS = 50
+
+
+def _epoch(iso):
+    """ISO 时间 -> 时间戳(没有或解析失败时为 0)"""
+    if not iso:
+        return 0
+    from datetime import datetime
+    try:
+        return int(datetime.fromisoformat(iso).timestamp())
+    except (TypeError, ValueError):
+        return 0
+
+
+def write_jump_table(path, projects):
+    """重写跳转表(projects 按主菜单顺序,同分时靠前的优先)"""
+    from persist import atomic_write
+    lines = []
+    for project in projects:
+        fields = (project.path, project.alias, project.name)
+        if not project.path or any('\t' in f or '\n' in f for f in fields):
+            continue
+        lines.append('\t'.join(fields + (str(project.open_count), str(_epoch(project.last_opened)))))
+    atomic_write(path, ''.join(line + '\n' for line in lines))
+
+
+def read_jump_table(path):
+    """[(路径, 别名, 名称, 打开次数, 最近打开)],文件不存在时返回 None"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = f.read()
+    except OSError:
+        return None
+    entries = []
+    for line in data.splitlines():
+        parts = line.split('\t')
+        if len(parts) == 5:
+            entries.append((parts[0], parts[1], parts[2], int(parts[3] or 0), int(parts[4] or 0)))
+    return entries
+
+
+def frecency(count, last, now):
+    """打开次数 × 新近度权重(同 zoxide: 一小时内 ×4,一天内 ×2,一周内 ×0.5,更早 ×0.25)"""
+    if not count:
+        return 0.0
+    age = now - last
+    for limit, weight in RECENCY_WEIGHTS:
+        if age < limit:
+            return count * weight
+    return count * OLD_WEIGHT
+
+
+def matcher(query):
+    """
+    为查询生成打分函数 f(路径, 别名, 名称) -> 匹配程度(越大越好,0 为不匹配):
+    5 别名相同 / 4 名称或目录名相同 / 3 前缀 / 2 包含 / 1 字母按顺序出现(模糊)
+    多个关键词时按 zoxide 的规则: 依次出现在路径中,且最后一个出现在目录名里
+    """
+    words = query.lower().split()
+    if len(words) > 1:
+        def multi(path, alias, name):
+            path_lower = path.lower()
+            position = 0
+            for word in words:
+                position = path_lower.find(word, position)
+                if position < 0:
+                    return 0
+                position += len(word)
+            return 2 if words[-1] in _basename(path_lower) else 0
+        return multi
+
+    word = words[0]
+    import re
+    # 模糊匹配: 字母按顺序出现在同一个字段里(字段之间用 \0 隔开)
+    fuzzy = re.compile('[^\0]*?'.join(map(re.escape, word)))
+
+    def single(path, alias, name):
+        alias, name, base = alias.lower(), name.lower(), _basename(path.lower())
+        joined = f"{alias}\0{name}\0{base}"
+        if word not in joined:
+            return 1 if fuzzy.search(joined) else 0
+        if alias and alias == word:
+            return 5
+        if word == name or word == base:
+            return 4
+        if alias.startswith(word) or name.startswith(word) or base.startswith(word):
+            return 3
+        return 2
+    return single
+
+
+def _basename(path):
+    return os.path.basename(path.rstrip('\\/'))
+
+
+def rank(query, entries, now=None):
+    """按 (匹配程度, frecency) 排序的候选 [(路径, 匹配程度, frecency)]"""
+    if not query.split():
+        return []
+    score_match = matcher(query)
+    now = now or time.time()
+    scored = []
+    for order, (path, alias, name, count, last) in enumerate(entries):
+        tier = score_match(path, alias, name)
+        if tier:
+            scored.append((-tier, -frecency(count, last, now), order, path))
+    if not scored:
+        scored = _score_typos(query, entries, now)
+    scored.sort()
+    return [(path, -tier, -score) for tier, score, _, path in scored]
+
+
+def _score_typos(query, entries, now):
+    """
+    一个都没匹配上时的容错: 别名/名称/目录名与查询的编辑距离在 max_edits() 以内(shpo -> shop)
+    匹配程度记为 1 - 编辑距离,排在所有正常匹配之后
+    """
+    from fuzzy import FuzzyIndex, max_edits
+    word = ' '.join(query.lower().split())
+    edits = max_edits(word)
+    if not edits:
+        return []
+    fields = [(alias.lower(), name.lower(), _basename(path.lower())) for path, alias, name, _, _ in entries]
+    index = FuzzyIndex(w for words in fields for w in words if w)
+    distances = {w: dist for dist, w in index.search(word, edits)}
+    scored = []
+    for order, ((path, _, _, count, last), words) in enumerate(zip(entries, fields)):
+        dist = min(distances.get(w, edits + 1) for w in words)
+        if dist <= edits:
+            scored.append((dist - 1, -frecency(count, last, now), order, path))
+    return scored
+
+
+def resolve(query, entries, now=None):
+    """最佳的、目录仍然存在的项目路径(只检查排名靠前的 MAX_CHECKS 个);没有时返回 None"""
+    for path, _, _ in rank(query, entries, now)[:MAX_CHECKS]:
+        if os.path.isdir(path):
+            return path
+    return None
+
+
+POSIX_INIT = '''# open cd 的 shell 集成 (open init {shell} 生成): open cd <查询> 直接切换当前目录
+open() {{
+    if [ "$1" = cd ] && [ $# -gt 1 ]; then
+        shift
+        local dir
+        dir="$(command open cd "$@")" && builtin cd -- "$dir"
+    else
+        command open "$@"
+    fi
+}}
+'''
+
+FISH_INIT = '''# open cd 的 shell 集成 (open init fish 生成): open cd <查询> 直接切换当前目录
+function open --wraps open
+    if test "$argv[1]" = cd; and test (count $argv) -gt 1
+        set -l dir (command open cd $argv[2..-1]); and builtin cd -- $dir
+    else
+        command open $argv
+    end
+end
+'''
+
+
+def init_script(shell):
+    """shell 包装函数,shell 不支持时返回 None"""
+    if shell in ('bash', 'zsh'):
+        return POSIX_INIT.format(shell=shell)
+    if shell == 'fish':
+        return FISH_INIT
+    return None
+
+
+def main(args, table_file):
+    """open cd <查询> / open init <shell>;返回退出码"""
+    cmd = args[0].lower()
+    if cmd == 'init':
+        script = init_script(args[1].lower() if len(args) > 1 else '')
+        if script is None:
+            print("💡 用法: open init bash|zsh|fish", file=sys.stderr)
+            return 2
+        sys.stdout.write(script)
+        return 0
+
+    query = ' '.join(args[1:])
+    if not query:
+        print("💡 用法: open cd <查询>", file=sys.stderr)
+        return 2
+    entries = read_jump_table(table_file)
+    if entries is None:
+        # 还没有生成过跳转表: 加载一次项目(会顺带写出跳转表)
+        from core import ProjectStore
+        ProjectStore()
+        entries = read_jump_table(table_file) or []
+    path = resolve(query, entries)
+    if path is None:
+        print(f"❌ 找不到匹配 '{query}' 的项目", file=sys.stderr)
+        return 1
+    print(path)
+    return 0
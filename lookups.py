@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+⌨️ 项目启动器 - Shell 补全
+completions.txt: 每行一个项目别名/名称(按主菜单顺序),每次写回配置时重新生成;
+open completions bash|zsh|fish 输出的补全函数只读这个文件,按 Tab 时不启动 Python
+"""
+
+from persist import atomic_write
+
+# 第一个参数可补全的子命令
+COMMANDS = ('list', 'ls', 'cd', 'recent', 'rm', 'add', 'find', 'stats', 'export', 'import',
+            'style', 'config', 'serve', 'completions', 'init', 'help')
+# 后面跟项目别名/名称的子命令
+PROJECT_COMMANDS = ('list', 'ls', 'cd')
+SHELLS = ('bash', 'zsh', 'fish')
+
+
+def lookup_words(projects):
+    """补全词: 别名优先,其次名称,去重后保持顺序(含空白/换行的名称跳过)"""
+    seen = set()
+    words = []
+    for project in projects:
+        for word in (project.alias, project.name):
+            if word and word not in seen and not any(ch.isspace() for ch in word):
+                seen.add(word)
+                words.append(word)
+    return words
+
+
+def write_lookups(path, projects):
+    """重写补全缓存文件"""
+    words = lookup_words(projects)
+    atomic_write(path, ''.join(word + '\n' for word in words))
+
+
+BASH_SCRIPT = r'''# open 命令补全 (open completions bash 生成;项目列表读自 {lookups})
+_open_complete() {{
+    local cur=${{COMP_WORDS[COMP_CWORD]}}
+    if [ "$COMP_CWORD" -eq 1 ]; then
+        COMPREPLY=($(compgen -W "{commands}" -- "$cur"))
+        return
+    fi
+    case ${{COMP_WORDS[1]}} in
+        {project_commands})
+            local IFS=$'\n'
+            [ -r "{lookups}" ] && COMPREPLY=($(compgen -W "$(< "{lookups}")" -- "$cur")) ;;
+        stats) COMPREPLY=($(compgen -W "size" -- "$cur")) ;;
+        completions|init) COMPREPLY=($(compgen -W "{shells}" -- "$cur")) ;;
+    esac
+}}
+complete -o default -F _open_complete open
+'''
+
+ZSH_SCRIPT = r'''#compdef open
+# open 命令补全 (open completions zsh 生成;项目列表读自 {lookups})
+_open() {{
+    if (( CURRENT == 2 )); then
+        compadd -- {commands}
+        return
+    fi
+    case $words[2] in
+        {project_commands})
+            [[ -r "{lookups}" ]] && compadd -- "${{(@f)$(<"{lookups}")}}" ;;
+        stats) compadd -- size ;;
+        completions|init) compadd -- {shells} ;;
+        *) _files ;;
+    esac
+}}
+# 放在 fpath 里自动加载时直接补全,被 source 时注册
+if [[ "$funcstack[1]" == "_open" ]]; then
+    _open "$@"
+else
+    compdef _open open
+fi
+'''
+
+FISH_SCRIPT = r'''# open 命令补全 (open completions fish 生成;项目列表读自 {lookups})
+complete -c open -f
+complete -c open -n __fish_use_subcommand -a "{commands}"
+complete -c open -n "__fish_seen_subcommand_from {project_commands}" -a "(cat '{lookups}' 2>/dev/null)"
+complete -c open -n "__fish_seen_subcommand_from stats" -a size
+complete -c open -n "__fish_seen_subcommand_from completions init" -a "{shells}"
+complete -c open -n "__fish_seen_subcommand_from add import export" -F
+'''
+
+
+def completion_script(shell, lookups_file):
+    """生成 shell 的补全脚本,shell 不支持时返回 None"""
+    template = {'bash': BASH_SCRIPT, 'zsh': ZSH_SCRIPT, 'fish': FISH_SCRIPT}.get(shell)
+    if template is None:
+        return None
+    return template.format(
+        lookups=lookups_file,
+        commands=' '.join(COMMANDS),
+        project_commands=('|' if shell != 'fish' else ' ').join(PROJECT_COMMANDS),
+        shells=' '.join(SHELLS),
+    )
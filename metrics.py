@@ -0,0 +1,247 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+📏 项目启动器 - 运行指标(供 node_exporter 的 textfile collector 采集)
+计数/直方图/仪表先累计在内存里(只加锁改几个数字,不碰磁盘),
+第一笔记录后 FLUSH_INTERVAL 秒或进程退出时合并写一次: 读出文件里已有的累计值,加上本进程的增量,
+整个文件原子替换,所以多次运行的 open 进程累计在同一份指标里(读-合并-写期间持有旁边 .lock 文件的 flock)
+在 projects.json 的 settings 里设置 "metrics_file"(如 /var/lib/node_exporter/textfile/promanager.prom)后启用
+"""
+
+import re
+import time
+import threading
+from bisect import bisect_left
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:
+    # Windows 没有 flock: 同时退出的两个进程可能有一方的增量被覆盖
+    fcntl = None
+
+# 第一笔记录之后多久写盘(秒);常驻进程里持续有记录时也按这个间隔写
+FLUSH_INTERVAL = 5.0
+# 耗时直方图的桶上限(秒)
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+# 指标族名 -> (类型, 说明);计数器的样本名是族名加 _total
+METRICS = {
+    'promanager_opens': ('counter', '按 IDE 统计的项目打开次数'),
+    'promanager_launches': ('counter', '按 IDE 与启动结果统计的启动次数'),
+    'promanager_launch_spawn_seconds': ('histogram', '启动 IDE 进程(Popen)的耗时'),
+    'promanager_search_seconds': ('histogram', '一次项目查询(每次按键)的耗时'),
+    'promanager_config_load_seconds': ('histogram', '加载项目配置的耗时'),
+    'promanager_config_save_seconds': ('histogram', '写回项目配置的耗时'),
+    'promanager_projects': ('gauge', '项目数'),
+}
+
+_SAMPLE = re.compile(r'^([a-zA-Z_:][a-zA-Z0-9_:]*)(?:\{(.*)\})?\s+(\S+)$')
+_LABEL = re.compile(r'([a-zA-Z_][a-zA-Z0-9_]*)="((?:[^"\\]|\\.)*)"')
+
+
+class Metrics:
+    """
+    本进程的指标增量
+    counters:   {(名称, 标签): 值}
+    histograms: {(名称, 标签): [各桶累计数..., +Inf 桶, 总和]}(+Inf 桶即总次数)
+    gauges:     {(名称, 标签): 当前值}(写盘时覆盖文件里的值)
+    """
+    def __init__(self):
+        self.metrics_file = None
+        self.writer = None
+        self._lock = threading.Lock()
+        self.counters = {}
+        self.histograms = {}
+        self.gauges = {}
+
+    def enable(self, metrics_file):
+        """设置指标文件并开始写盘;没有配置时指标只留在内存里"""
+        if not metrics_file or self.writer is not None:
+            return
+        from persist import DebouncedWriter
+        self.metrics_file = metrics_file
+        self.writer = DebouncedWriter(self._write, delay=FLUSH_INTERVAL)
+        if self.counters or self.histograms or self.gauges:
+            self.writer.mark_dirty()
+
+    def inc(self, name, labels=(), value=1):
+        key = (name, labels)
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+        self._touch()
+
+    def set(self, name, value, labels=()):
+        with self._lock:
+            self.gauges[(name, labels)] = value
+        self._touch()
+
+    def observe(self, name, seconds, labels=()):
+        key = (name, labels)
+        with self._lock:
+            buckets = self.histograms.get(key)
+            if buckets is None:
+                buckets = self.histograms[key] = [0] * (len(LATENCY_BUCKETS) + 2)
+            for i in range(bisect_left(LATENCY_BUCKETS, seconds), len(LATENCY_BUCKETS) + 1):
+                buckets[i] += 1
+            buckets[-1] += seconds
+        self._touch()
+
+    @contextmanager
+    def timer(self, name, labels=()):
+        """with metrics.timer('promanager_xxx_seconds'): ... 记一次耗时"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, labels)
+
+    def _touch(self):
+        # 只在第一笔记录时开始计时: 持续有记录时也按 FLUSH_INTERVAL 写盘,而不是一直往后推
+        if self.writer is not None and not self.writer.dirty:
+            self.writer.mark_dirty()
+
+    def _write(self):
+        """把增量合并进指标文件(原子替换),成功后清空增量"""
+        with self._lock:
+            counters, histograms, gauges = self.counters, self.histograms, self.gauges
+            self.counters, self.histograms, self.gauges = {}, {}, {}
+        try:
+            from persist import atomic_write
+            # 多个 open 进程可能同时写: 读-合并-写整段持有锁文件,免得互相覆盖增量
+            with _file_lock(str(self.metrics_file) + '.lock'):
+                total_counters, total_histograms, total_gauges = read_metrics(self.metrics_file)
+                for key, value in counters.items():
+                    total_counters[key] = total_counters.get(key, 0) + value
+                for key, buckets in histograms.items():
+                    merged = total_histograms.get(key)
+                    total_histograms[key] = buckets if merged is None else [a + b for a, b in zip(merged, buckets)]
+                total_gauges.update(gauges)
+                atomic_write(self.metrics_file, render(total_counters, total_histograms, total_gauges))
+        except OSError:
+            # 没写成: 增量放回去,下次再合并
+            with self._lock:
+                for key, value in counters.items():
+                    self.counters[key] = self.counters.get(key, 0) + value
+                for key, buckets in histograms.items():
+                    current = self.histograms.get(key)
+                    self.histograms[key] = buckets if current is None else [a + b for a, b in zip(current, buckets)]
+                for key, value in gauges.items():
+                    self.gauges.setdefault(key, value)
+            raise
+
+
+@contextmanager
+def _file_lock(lock_file):
+    """独占锁(flock);指标文件本身会被原子替换,所以锁在旁边单独的文件上"""
+    if fcntl is None:
+        yield
+        return
+    with open(lock_file, 'a') as f:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def _format_labels(labels, extra=''):
+    parts = [f'{name}="{_escape(value)}"' for name, value in labels]
+    if extra:
+        parts.append(extra)
+    return '{' + ','.join(parts) + '}' if parts else ''
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _unescape(value):
+    return re.sub(r'\\(.)', lambda m: '\n' if m.group(1) == 'n' else m.group(1), value)
+
+
+def _format_number(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def render(counters, histograms, gauges):
+    """指标文本(Prometheus 文本格式: HELP/TYPE 行用族名,计数器的样本名带 _total)"""
+    samples = {}
+    for (name, labels), value in counters.items():
+        samples.setdefault(name, []).append(f"{name}_total{_format_labels(labels)} {_format_number(value)}")
+    for (name, labels), value in gauges.items():
+        samples.setdefault(name, []).append(f"{name}{_format_labels(labels)} {_format_number(value)}")
+    for (name, labels), buckets in histograms.items():
+        lines = samples.setdefault(name, [])
+        for bound, count in zip(LATENCY_BUCKETS + ('+Inf',), buckets):
+            le = 'le="%s"' % bound
+            lines.append(f"{name}_bucket{_format_labels(labels, le)} {count}")
+        lines.append(f"{name}_sum{_format_labels(labels)} {_format_number(buckets[-1])}")
+        lines.append(f"{name}_count{_format_labels(labels)} {buckets[-2]}")
+
+    out = []
+    for name in sorted(samples):
+        kind, help_text = METRICS.get(name, ('untyped', ''))
+        out.append(f"# HELP {name} {help_text}")
+        out.append(f"# TYPE {name} {kind}")
+        out.extend(samples[name])
+    return '\n'.join(out) + '\n'
+
+
+def read_metrics(metrics_file):
+    """读回 render() 写出的文件: (counters, histograms, gauges);文件不存在时全为空"""
+    counters, histograms, gauges = {}, {}, {}
+    try:
+        with open(metrics_file, 'r', encoding='utf-8') as f:
+            lines = f.read().splitlines()
+    except FileNotFoundError:
+        return counters, histograms, gauges
+
+    bounds = {str(bound): i for i, bound in enumerate(LATENCY_BUCKETS)}
+    bounds['+Inf'] = len(LATENCY_BUCKETS)
+    for line in lines:
+        match = _SAMPLE.match(line)
+        if not match:
+            continue
+        sample, label_text, value = match.groups()
+        labels = [(k, _unescape(v)) for k, v in _LABEL.findall(label_text or '')]
+        try:
+            value = float(value)
+        except ValueError:
+            continue
+
+        name, suffix = sample, ''
+        for ending, kind in (('_total', 'counter'), ('_bucket', 'histogram'), ('_sum', 'histogram'),
+                             ('_count', 'histogram')):
+            if sample.endswith(ending) and METRICS.get(sample[:-len(ending)], ('',))[0] == kind:
+                name, suffix = sample[:-len(ending)], ending
+                break
+        kind = METRICS.get(name, ('',))[0]
+        if kind == 'histogram':
+            le = dict(labels).get('le')
+            key = (name, tuple(label for label in labels if label[0] != 'le'))
+            buckets = histograms.setdefault(key, [0] * (len(LATENCY_BUCKETS) + 2))
+            if suffix == '_bucket' and le in bounds:
+                buckets[bounds[le]] = int(value)
+            elif suffix == '_sum':
+                buckets[-1] = value
+        elif kind == 'counter':
+            counters[(name, tuple(labels))] = int(value) if value.is_integer() else value
+        elif kind == 'gauge':
+            gauges[(name, tuple(labels))] = int(value) if value.is_integer() else value
+    return counters, histograms, gauges
+
+
+# 进程内共用一份
+_default = Metrics()
+enable = _default.enable
+inc = _default.inc
+set_gauge = _default.set
+observe = _default.observe
+timer = _default.timer
+
+
+def flush():
+    """立即写盘(未启用时什么都不做)"""
+    if _default.writer is not None:
+        _default.writer.flush()
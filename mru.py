@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+🕘 项目启动器 - 最近打开(MRU)
+mru.json 只保存最近打开的 MRU_SIZE 个项目(路径/名称/IDE/时间),每次打开时移到最前,满了挤掉最旧的;
+open - (重新打开上一个项目) 与 open recent (列出最近 N 个) 只读这个小文件,不加载/排序整个项目列表
+"""
+
+import sys
+import json
+import time
+
+MRU_SIZE = 20
+
+
+class RecentRing:
+    """固定容量的最近打开记录,entries[0] 是最近一次: [路径, 名称, IDE, 时间戳]"""
+    def __init__(self, mru_file, size=MRU_SIZE):
+        self.mru_file = mru_file
+        self.size = size
+        self.load()
+
+    def load(self):
+        """从磁盘读入(文件不存在或损坏时为空)"""
+        try:
+            with open(self.mru_file, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f).get('entries', [])[:self.size]
+        except (OSError, ValueError, AttributeError):
+            self.entries = []
+
+    def push(self, path, name, ide, when=None):
+        """记一次打开: 移到最前(已有的同一路径先去掉)"""
+        self.discard(path)
+        self.entries.insert(0, [path, name, ide, int(when or time.time())])
+        del self.entries[self.size:]
+
+    def discard(self, path):
+        """项目被删除"""
+        self.entries = [entry for entry in self.entries if entry[0] != path]
+
+    def latest(self, n=None):
+        return self.entries[:n]
+
+    def save(self):
+        from persist import atomic_write_json
+        atomic_write_json(self.mru_file, {'entries': self.entries}, separators=(',', ':'))
+
+
+def print_recent(ring, n, as_json=False):
+    """open recent [N] [--json]"""
+    entries = ring.latest(n)
+    if as_json:
+        for path, name, ide, when in entries:
+            print(json.dumps({'path': path, 'name': name, 'ide': ide, 'opened_at': when},
+                             ensure_ascii=False, separators=(',', ':')))
+        return 0
+    if not entries:
+        print("📭 还没有打开记录")
+        return 0
+
+    from gitstatus import format_age
+    now = time.time()
+    print(f"\n🕘 最近打开的 {len(entries)} 个项目:\n")
+    for i, (path, name, ide, when) in enumerate(entries, 1):
+        print(f"  {i:2d}. {name:20s} {ide.upper():9s} {format_age(when, now):8s} {path}")
+    print("\n💡 open - 重新打开最近一个项目")
+    return 0
+
+
+def reopen_last(ring):
+    """open - : 直接用上次的 IDE 启动,之后再去记打开次数(不让用户等项目列表加载)"""
+    entries = ring.latest(1)
+    if not entries:
+        print("📭 还没有打开记录")
+        return 1
+    path, name, ide, _ = entries[0]
+
+    from core import load_ide_config, LaunchSupervisor, LaunchError, ProjectStore
+    from paths import LAUNCH_LOG_FILE
+    ide_paths, _ = load_ide_config()
+    print(f"\n🚀 正在用 {ide.upper()} 打开 {name}")
+    print(f"📁 {path}")
+    supervisor = LaunchSupervisor(LAUNCH_LOG_FILE)
+    try:
+        launch = supervisor.spawn(ide, ide_paths.get(ide), path)
+    except LaunchError as e:
+        print(f"❌ 打开失败: {e}")
+        return 1
+    supervisor.settle([launch])
+    if launch.error():
+        print(f"❌ 打开失败: {launch.error()}")
+        return 1
+    print("✅ 已打开!")
+    sys.stdout.flush()
+
+    # IDE 已经在启动,这里再加载项目记一次打开(打开次数/最近打开/使用记录/MRU)
+    store = ProjectStore()
+    project = store.path_index().get(path)
+    if project is not None:
+        store.record_open(project, ide)
+        store.save()
+    return 0
+
+
+def main(args, mru_file):
+    """open - / open recent [N] [--json];返回退出码"""
+    ring = RecentRing(mru_file)
+    if args[0] == '-':
+        return reopen_last(ring)
+
+    rest = [arg for arg in args[1:] if arg not in ('--json', '--no-interactive')]
+    try:
+        n = int(rest[0]) if rest else 10
+    except ValueError:
+        print("💡 用法: open recent [数量]")
+        return 2
+    return print_recent(ring, n, as_json=len(rest) != len(args) - 1)
@@ -7,11 +7,57 @@
 
 import os
 import sys
-import json
+
+# open cd <查询> / open init <shell>: 只读跳转表,赶在加载其他模块之前完成
+if __name__ == '__main__' and len(sys.argv) > 1 and sys.argv[1].lower() in ('cd', 'init'):
+    import jump
+    # 即 paths.JUMP_FILE;这里不导入 paths,省掉 pathlib 连带的 re/fnmatch
+    sys.exit(jump.main(sys.argv[1:], os.path.join(os.path.expanduser('~'), '.project-manager', 'jump.tsv')))
+
+# open - / open recent [数量]: 只读最近打开列表(mru.json),不加载/排序整个项目列表
+if __name__ == '__main__' and len(sys.argv) > 1 and sys.argv[1].lower() in ('-', 'recent'):
+    import mru
+    sys.exit(mru.main(sys.argv[1:], os.path.join(os.path.expanduser('~'), '.project-manager', 'mru.json')))
+
+import atexit
+import shutil
 import subprocess
-from pathlib import Path
 from datetime import datetime
 
+from screen import Screen, display_width, truncate, pad
+from snapshot import MenuSnapshot
+from paths import (CONFIG_FILE, MENU_SNAPSHOT_FILE, GIT_CACHE_FILE, STATS_CACHE_FILE, FILE_INDEX_FILE,
+                   LOOKUPS_FILE)
+
+# 差量渲染器: 所有页面的标题/分隔线/列表都经由它输出
+screen = Screen()
+
+# 冷启动直接进入主菜单时,先画出上次保存的菜单快照,再去加载 inquirer 等较重的依赖
+menu_snapshot = MenuSnapshot(MENU_SNAPSHOT_FILE, CONFIG_FILE)
+if __name__ == '__main__' and len(sys.argv) == 1 and screen.enabled and sys.stdin.isatty():
+    menu_snapshot.paint(screen, shutil.get_terminal_size())
+
+# 脚本模式(--json / --no-interactive): 逐行输出 JSON,不清屏不等回车,也不加载下面的交互界面
+if __name__ == '__main__' and ('--json' in sys.argv or '--no-interactive' in sys.argv):
+    import headless
+    sys.exit(headless.main([arg for arg in sys.argv[1:] if arg not in headless.FLAGS]))
+
+# open serve [端口] - 本地 JSON-RPC 服务(自己持有项目存储,同样不需要 inquirer 与交互界面)
+if __name__ == '__main__' and len(sys.argv) > 1 and sys.argv[1].lower() == 'serve':
+    import server
+    sys.exit(server.main(sys.argv[2:]))
+
+from core import ProjectStore, ProjectSearch, Launcher, LaunchError
+from gitstatus import GitStatusCache, format_status, format_age, status_key
+from projscan import StatsCache, format_size, top_languages
+from fileindex import FileIndex
+from facets import parse_tags
+from pager import Pager
+from project import Project
+from analytics import format_sparkline
+from lookups import completion_script, SHELLS
+import transfer
+
 try:
     import inquirer
     from inquirer.themes import Theme
@@ -32,7 +78,7 @@ except Exception as e:
 
 # 导入主题
 try:
-    from themes import get_theme, list_themes, THEME_DESCRIPTIONS
+    from themes import get_theme, compile_palette, list_themes, THEME_DESCRIPTIONS
     HAS_THEMES = True
 except ImportError:
     HAS_THEMES = False
@@ -50,6 +96,14 @@ except ImportError:
     def get_theme(name='default'):
         return CustomTheme()
     
+    def compile_palette(theme):
+        from collections import namedtuple
+        Palette = namedtuple('Palette', ['name', 'accent_color', 'text_color', 'dim_color'])
+        return Palette(type(theme).__name__,
+                       getattr(theme, 'accent_color', '\033[95m'),
+                       getattr(theme, 'text_color', '\033[37m'),
+                       getattr(theme, 'dim_color', '\033[90m'))
+    
     class CustomTheme:
         """内置默认主题(当 themes.py 不存在时)"""
         def __init__(self):
@@ -58,60 +112,11 @@ except ImportError:
             self.dim_color = '\033[90m'
 
 try:
-    from prompt_toolkit import prompt
-    from prompt_toolkit.completion import Completer, Completion
-    from prompt_toolkit.document import Document
+    from picker import ProjectPicker
     HAS_PROMPT_TOOLKIT = True
 except ImportError:
     HAS_PROMPT_TOOLKIT = False
 
-# 配置文件路径
-CONFIG_DIR = Path.home() / '.project-manager'
-CONFIG_FILE = CONFIG_DIR / 'projects.json'
-IDE_CONFIG_FILE = CONFIG_DIR / 'ide_config.json'
-
-# 尝试从当前目录加载 IDE 配置
-SCRIPT_DIR = Path(__file__).parent
-LOCAL_IDE_CONFIG = SCRIPT_DIR / 'config.json'
-
-# 默认配置
-DEFAULT_CONFIG = {
-    "settings": {
-        "default_ide": "idea",
-        "theme": "default",
-        "ide_paths": {
-            "idea": r"D:\code\IntelliJ IDEA 2024.3.5\bin\idea64.exe",
-            "vscode": r"C:\Program Files\Microsoft VS Code\Code.exe",
-            "webstorm": r"D:\code\webstorm\WebStorm 2025.1.4.1\bin\webstorm64.exe",
-            "cursor": "cursor"
-        }
-    },
-    "projects": []
-}
-
-def load_ide_config():
-    """加载 IDE 配置,优先级:本地 config.json > 用户目录 > 默认"""
-    # 1. 优先读取脚本目录的 config.json
-    if LOCAL_IDE_CONFIG.exists():
-        try:
-            with open(LOCAL_IDE_CONFIG, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-                return config.get('ide_paths', {}), config.get('default_ide', 'idea')
-        except Exception as e:
-            print(f"⚠️  读取本地配置失败: {e}")
-    
-    # 2. 读取用户目录的配置
-    if IDE_CONFIG_FILE.exists():
-        try:
-            with open(IDE_CONFIG_FILE, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-                return config.get('ide_paths', {}), config.get('default_ide', 'idea')
-        except Exception as e:
-            print(f"⚠️  读取用户配置失败: {e}")
-    
-    # 3. 使用默认配置
-    return DEFAULT_CONFIG['settings']['ide_paths'], DEFAULT_CONFIG['settings']['default_ide']
-
 # IDE 图标和颜色
 IDE_ICONS = {
     "idea": "💡",
@@ -129,188 +134,179 @@ IDE_COLORS = {
 }
 COLOR_RESET = "\033[0m"
 
+# 各 shell 补全脚本的安装位置(提示用)
+COMPLETION_TARGETS = {
+    'bash': 'open completions bash > ~/.local/share/bash-completion/completions/open',
+    'zsh': 'open completions zsh > ~/.zfunc/_open  (并在 .zshrc 中 fpath+=~/.zfunc)',
+    'fish': 'open completions fish > ~/.config/fish/completions/open.fish',
+}
+
+# 行渲染缓存上限,超过后整体清空(项目数通常远小于此)
+ROW_CACHE_SIZE = 8192
+
+
+def clear_screen():
+    """开始新的一屏(差量重绘,不再调用 cls/clear)"""
+    screen.clear()
+
 
 def print_banner(title, width=70):
     """打印漂亮的 Banner"""
-    padding = (width - len(title) - 4) // 2
-    print("\n╔" + "═" * width + "╗")
-    print("║" + " " * padding + title + " " * (width - padding - len(title)) + "║")
-    print("╚" + "═" * width + "╝")
+    title_width = display_width(title)
+    padding = (width - title_width - 4) // 2
+    screen.print("\n╔" + "═" * width + "╗")
+    screen.print("║" + " " * padding + title + " " * max(0, width - padding - title_width) + "║")
+    screen.print("╚" + "═" * width + "╝")
 
 
-def print_separator(width=70):
+def print_separator(width=70, newline=False):
     """打印分隔线"""
-    print("─" * width)
-
-
-class ProjectCompleter(Completer):
-    """项目自动补全器 - 实时过滤"""
-    def __init__(self, projects):
-        self.projects = projects
-    
-    def get_completions(self, document, complete_event):
-        text = document.text_before_cursor.lower()
-        
-        for project in self.projects:
-            # 匹配名称、别名、描述
-            name = project['name']
-            alias = project.get('alias', '')
-            remark = project.get('remark', '')
-            
-            if (text in name.lower() or 
-                text in alias.lower() or 
-                text in remark.lower()):
-                
-                display = f"{name}"
-                if alias and alias != name:
-                    display += f" ({alias})"
-                if remark:
-                    display += f" - {remark[:30]}"
-                
-                yield Completion(
-                    text=alias or name,
-                    start_position=-len(text),
-                    display=display
-                )
+    screen.print(("\n" if newline else "") + "─" * width)
 
 
 class ProjectManager:
     def __init__(self):
-        self.config = self.load_config()
-        # 加载 IDE 配置并更新
-        ide_paths, default_ide = load_ide_config()
-        if 'settings' not in self.config:
-            self.config['settings'] = {}
-        self.config['settings']['ide_paths'] = ide_paths
-        self.config['settings']['default_ide'] = default_ide
+        # 菜单快照要记录写回后的配置 mtime,所以先于配置写回注册(atexit 后注册的先执行)
+        atexit.register(self._save_snapshot)
+        # 核心组件: 配置与项目 / 查询 / 打开
+        self.store = ProjectStore()
+        self.search = ProjectSearch(self.store)
+        self.launcher = Launcher(self.store)
+        self.config = self.store.config
         
         # 加载主题
         theme_name = self.config.get('settings', {}).get('theme', 'default')
         self.theme = get_theme(theme_name)
+        self.palette = compile_palette(self.theme)
+        
+        # 行渲染缓存: (项目显示字段, Git 状态, 调色板) -> 已格式化的行
+        self._row_cache = {}
+        
+        # Git 状态缓存(后台刷新,退出前写回)
+        self.git = GitStatusCache(GIT_CACHE_FILE)
+        atexit.register(self.git.close)
+        
+        # 主菜单筛选条件与按配置版本缓存的筛选结果
+        self.menu_filter = ''
+        self._menu_cache = None
     
-    def load_config(self):
-        """加载配置"""
-        if not CONFIG_FILE.exists():
-            CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-            with open(CONFIG_FILE, 'w', encoding='utf-8') as f:
-                json.dump(DEFAULT_CONFIG, f, indent=2, ensure_ascii=False)
-            return DEFAULT_CONFIG.copy()
-        
-        with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
-            return json.load(f)
+    def _save_snapshot(self):
+        """退出时保存主菜单快照(只在渲染之后配置没有再改过时)"""
+        store = getattr(self, 'store', None)
+        if store is not None:
+            menu_snapshot.save(store.revision)
     
     def save_config(self):
-        """保存配置"""
-        with open(CONFIG_FILE, 'w', encoding='utf-8') as f:
-            json.dump(self.config, f, indent=2, ensure_ascii=False)
+        """保存配置(标记修改,稍后合并写回)"""
+        self.store.save()
     
     def get_sorted_projects(self):
         """获取排序后的项目(置顶 + 打开次数)"""
-        projects = self.config['projects']
-        pinned = [p for p in projects if p.get('pinned', False)]
-        unpinned = [p for p in projects if not p.get('pinned', False)]
-        
-        pinned.sort(key=lambda x: x.get('open_count', 0), reverse=True)
-        unpinned.sort(key=lambda x: x.get('open_count', 0), reverse=True)
-        
-        return pinned + unpinned
+        return self.store.sorted_projects()
+    
+    def filter_projects(self, query, candidates):
+        """按查询过滤项目(分面 + 关键词,匹配不到时全文兜底)"""
+        return self.search.filter(query, candidates)
+    
+    def format_facet_summary(self):
+        """分面汇总: 各 IDE / 置顶 / 标签的项目数"""
+        index = self.search.facet_index()
+        dim = self.palette.dim_color
+        
+        parts = [" · ".join(f"{IDE_ICONS.get(ide, '📁')} {ide} {count}"
+                            for ide, count in index.counts('ide').items())]
+        pinned = index.counts('pinned').get('yes', 0)
+        if pinned:
+            parts.append(f"⭐ {pinned}")
+        tags = list(index.counts('tag').items())[:8]
+        if tags:
+            parts.append(" ".join(f"#{tag} {count}" for tag, count in tags))
+        return f"{dim}{' | '.join(parts)}{COLOR_RESET}"
     
     def format_project_display(self, project, with_color=True):
-        """格式化项目显示"""
-        pin = "⭐" if project.get('pinned', False) else "  "
-        ide_key = project.get('ide', 'idea')
-        ide = IDE_ICONS.get(ide_key, '📁')
-        name = project.get('alias', project['name'])[:30]
-        count = project.get('open_count', 0)
-        remark = project.get('remark', '')[:40]
+        """格式化项目显示(按项目热字段 + Git 状态 + 主题缓存,重绘时大多直接命中)"""
+        # Git 状态只用缓存值,不阻塞;提交的相对时间每次现算,不进缓存
+        status = self.git.get(project.path)
+        git_key = status_key(status)
+        tags = project.tags[:3]
+        display = self._row_cache.get(self._row_key(project, tags, git_key, with_color))
+        if display is None:
+            display = self._render_row(project, tags, status if git_key else None, with_color)
+            if len(self._row_cache) >= ROW_CACHE_SIZE:
+                self._row_cache.clear()
+            # 渲染时已经读过描述,按读过之后的键存,下次直接命中
+            self._row_cache[self._row_key(project, tags, git_key, with_color)] = display
+        
+        age = format_age(status.get('last_commit')) if git_key else ''
+        if age:
+            display += f"{self.palette.dim_color} {age}{COLOR_RESET}" if with_color else f" {age}"
+        return display
+    
+    def _row_key(self, project, tags, git_key, with_color):
+        """
+        行缓存的键: 只取这个项目自己的字段,打开/修改别的项目不影响它的缓存行
+        描述是冷字段: 还没加载过就不可能被改过,不为算键去加载它
+        """
+        remark = None if project.pending_detail else project.remark
+        return (project.path, project.pinned, project.ide, project.name, project.alias,
+                project.open_count, tags, remark, git_key, with_color, self.palette)
+    
+    def _render_row(self, project, tags, status, with_color):
+        """一行的固定部分(缓存未命中时才会读取描述)"""
+        pin = "⭐" if project.pinned else "  "
+        ide = IDE_ICONS.get(project.ide, '📁')
+        name = pad(truncate(project.display_name, 30), 30)
+        remark = truncate(project.remark, 40)
         
         # 应用颜色
         if with_color:
-            color = IDE_COLORS.get(ide_key, "")
-            display = f"{pin} {ide} {color}{name:<30}{COLOR_RESET} "
+            color = IDE_COLORS.get(project.ide, "")
+            display = f"{pin} {ide} {color}{name}{COLOR_RESET} "
         else:
-            display = f"{pin} {ide} {name:<30} "
+            display = f"{pin} {ide} {name} "
         
         if remark:
             display += f"[{remark}] "
-        display += f"(打开{count}次)"
-        
+        if tags:
+            display += " ".join(f"#{t}" for t in tags) + " "
+        display += f"(打开{project.open_count}次)"
+        
+        git = format_status(status, with_age=False)
+        if git:
+            if with_color:
+                display += f" {self.palette.dim_color}{git}{COLOR_RESET}"
+            else:
+                display += f" {git}"
         return display
     
-    def open_project(self, project):
-        """打开项目"""
-        ide = project.get('ide', self.config['settings']['default_ide'])
-        ide_path = self.config['settings']['ide_paths'].get(ide)
-        
-        if not ide_path:
-            print(f"\n❌ 未配置 {ide.upper()} 路径")
-            input("\n按回车继续...")
-            return False
-        
-        project_path = project['path']
+    def open_project(self, project, ide=None):
+        """打开项目(ide 默认为项目自己的 IDE)"""
+        ide = ide or project.ide
         
         print(f"\n{IDE_ICONS.get(ide, '📁')} 正在用 {ide.upper()} 打开...")
-        print(f"📂 {project['name']}")
-        print(f"📁 {project_path}")
+        print(f"📂 {project.name}")
+        print(f"📁 {project.path}")
         
         try:
-            if ide == 'cursor':
-                subprocess.Popen([ide_path, project_path], 
-                               shell=True,
-                               stdout=subprocess.DEVNULL,
-                               stderr=subprocess.DEVNULL)
-            else:
-                subprocess.Popen([ide_path, project_path],
-                               stdout=subprocess.DEVNULL,
-                               stderr=subprocess.DEVNULL)
-            
-            # 更新打开次数
-            project['open_count'] = project.get('open_count', 0) + 1
-            project['last_opened'] = datetime.now().isoformat()
-            self.save_config()
-            
-            print("✅ 已打开!")
-            return True
-        except Exception as e:
+            self.launcher.launch(project, ide)
+        except LaunchError as e:
             print(f"❌ 打开失败: {e}")
             return False
-    
-    def open_project_silent(self, project):
-        """静默打开项目(用于批量打开)"""
-        ide = project.get('ide', self.config['settings']['default_ide'])
-        ide_path = self.config['settings']['ide_paths'].get(ide)
         
-        if not ide_path:
-            return False
-        
-        try:
-            if ide == 'cursor':
-                subprocess.Popen([ide_path, project['path']], 
-                               shell=True,
-                               stdout=subprocess.DEVNULL,
-                               stderr=subprocess.DEVNULL)
-            else:
-                subprocess.Popen([ide_path, project['path']],
-                               stdout=subprocess.DEVNULL,
-                               stderr=subprocess.DEVNULL)
-            
-            # 更新打开次数
-            project['open_count'] = project.get('open_count', 0) + 1
-            project['last_opened'] = datetime.now().isoformat()
-            return True
-        except:
-            return False
+        print("✅ 已打开!")
+        return True
     
     def show_main_menu(self):
-        """主菜单 - 交互式选择项目"""
+        """主菜单 - 交互式选择项目(大列表分页显示)"""
+        pager = Pager([], page_size=self._menu_page_size(), key=lambda p: p.display_name)
+        
         while True:
-            os.system('cls' if os.name == 'nt' else 'clear')
-            
-            projects = self.get_sorted_projects()
+            clear_screen()
             
-            if not projects:
+            if not self.config['projects']:
                 print_banner("🚀 项目启动器", 70)
-                print("\n📭 还没有项目\n")
+                screen.print("\n📭 还没有项目\n")
+                screen.flush()
                 
                 questions = [
                     inquirer.List('action',
@@ -332,28 +328,67 @@ class ProjectManager:
                     self.open_config()
                 continue
             
+            # 筛选结果与分面汇总按配置版本缓存,重绘时不再全量扫描
+            key = (self.store.revision, self.menu_filter)
+            if not self._menu_cache or self._menu_cache[0] != key:
+                projects = self.get_sorted_projects()
+                if self.menu_filter:
+                    projects = self.filter_projects(self.menu_filter, projects)
+                pinned_count = sum(1 for p in projects if p.pinned)
+                # 按打开顺序/时段预测的下一个项目(筛选时不显示)
+                predicted = [] if self.menu_filter else self.store.predicted()
+                self._menu_cache = (key, projects, pinned_count, self.format_facet_summary(), predicted)
+                pager.reset(projects)
+            _, projects, pinned_count, summary, predicted = self._menu_cache
+            
+            # 后台刷新当前页(含缓冲区)的 Git 状态,本次先显示缓存值,下次重绘时补全
+            self.git.refresh([p.path for p in pager.window()])
+            
             # 显示项目列表
             print_banner("🚀 项目启动器", 70)
+            screen.print(summary)
+            if self.menu_filter:
+                screen.print(f"🔎 筛选: {self.menu_filter} (共 {len(projects)} 个)")
+            screen.flush()
             
-            # 构建选项
+            # 构建选项 - 只格式化当前页
             choices = []
             
-            # 分组显示
-            pinned = [p for p in projects if p.get('pinned', False)]
-            unpinned = [p for p in projects if not p.get('pinned', False)]
-            
-            if pinned:
-                choices.append(inquirer.Separator('\n⭐ 置顶项目'))
-                for p in pinned:
-                    choices.append((self.format_project_display(p), p))
-            
-            if unpinned:
-                choices.append(inquirer.Separator('\n📌 全部项目'))
-                for p in unpinned:
-                    choices.append((self.format_project_display(p), p))
+            # 预测的项目放在第一页最上面,光标默认停在最可能的那个上
+            predicted = predicted if pager.page == 0 else []
+            if predicted:
+                choices.append(inquirer.Separator('\n🔮 接下来可能打开'))
+                choices.extend((self.format_project_display(p), p) for p in predicted)
+            
+            for i, p in pager.visible():
+                if i == 0 and pinned_count:
+                    choices.append(inquirer.Separator('\n⭐ 置顶项目'))
+                if i == pinned_count:
+                    choices.append(inquirer.Separator('\n📌 全部项目'))
+                choices.append((self.format_project_display(p), p))
+            
+            # 记下第一页(未筛选)的样子,退出时存为快照,下次启动先画它
+            if pager.page == 0 and not self.menu_filter:
+                rows = [f"   {self.format_project_display(p)}" for _, p in pager.visible()]
+                menu_snapshot.update(screen.last_frame, rows, [p.path for _, p in pager.visible()],
+                                     self.store.revision)
+            
+            # 翻页
+            if pager.page_count > 1:
+                choices.append(inquirer.Separator(f'\n📄 第 {pager.page + 1}/{pager.page_count} 页 (共 {len(projects)} 个)'))
+                choices.extend([
+                    ('⬇️  下一页', 'next_page'),
+                    ('⬆️  上一页', 'prev_page'),
+                    ('🔤 按首字母跳转', 'jump'),
+                ])
             
             # 底部操作
             choices.append(inquirer.Separator('\n' + '─' * 70))
+            choices.extend([
+                ('🏷️  筛选项目', 'filter'),
+            ])
+            if self.menu_filter:
+                choices.append(('🧹 清除筛选', 'clear_filter'))
             choices.extend([
                 ('➕ 添加新项目', 'add'),
                 ('📊 查看统计', 'stats'),
@@ -365,6 +400,7 @@ class ProjectManager:
                 inquirer.List('project',
                             message="选择项目 (↑↓ 选择, Enter 打开, Ctrl+C 退出)",
                             choices=choices,
+                            default=predicted[0] if predicted else None,
                             carousel=True)
             ]
             
@@ -382,11 +418,23 @@ class ProjectManager:
                     break
                 elif selected == 'add':
                     self.add_project()
+                elif selected == 'next_page':
+                    pager.next_page()
+                elif selected == 'prev_page':
+                    pager.prev_page()
+                elif selected == 'jump':
+                    letter = input("\n🔤 首字母: ").strip()
+                    if letter:
+                        pager.jump_to_letter(letter)
+                elif selected == 'filter':
+                    self.menu_filter = input("\n🏷️  筛选 (如 ide:vscode tag:backend pinned:yes shop): ").strip()
+                elif selected == 'clear_filter':
+                    self.menu_filter = ''
                 elif selected == 'stats':
                     self.show_stats()
                 elif selected == 'config':
                     self.open_config()
-                elif isinstance(selected, dict):
+                elif isinstance(selected, Project):
                     # 选中了项目,显示项目操作菜单
                     self.show_project_menu(selected)
             
@@ -397,33 +445,43 @@ class ProjectManager:
                 print(f"\n❌ 错误: {e}")
                 input("\n按回车继续...")
     
+    def _menu_page_size(self):
+        """主菜单每页行数 - 按终端高度估算,留出标题与操作项的位置"""
+        lines = shutil.get_terminal_size((100, 40)).lines
+        return max(10, lines - 16)
+    
     def show_project_menu(self, project):
         """项目操作菜单"""
         while True:
-            os.system('cls' if os.name == 'nt' else 'clear')
-            
-            print_banner(f"📁 {project['name']}", 70)
-            print(f"\n别名: {project.get('alias', '-')}")
-            print(f"路径: {project['path']}")
-            print(f"IDE:  {IDE_ICONS.get(project.get('ide', 'idea'), '📁')} {project.get('ide', 'idea').upper()}")
-            print(f"描述: {project.get('remark', '-')}")
-            print(f"打开: {project.get('open_count', 0)} 次")
-            print(f"置顶: {'是 ⭐' if project.get('pinned', False) else '否'}")
+            clear_screen()
+            
+            print_banner(f"📁 {project.name}", 70)
+            screen.print(f"\n别名: {project.alias or '-'}")
+            screen.print(f"路径: {project.path}")
+            screen.print(f"IDE:  {IDE_ICONS.get(project.ide, '📁')} {project.ide.upper()}")
+            screen.print(f"描述: {project.remark or '-'}")
+            screen.print(f"打开: {project.open_count} 次")
+            screen.print(f"置顶: {'是 ⭐' if project.pinned else '否'}")
+            screen.print(f"标签: {', '.join(project.tags) or '-'}")
+            git = format_status(self.git.get(project.path))
+            if git:
+                screen.print(f"Git:  {git}")
+            screen.flush()
             
             # 构建操作选项
             choices = [
-                (f"🚀 用 {project.get('ide', 'idea').upper()} 打开", 'open_default'),
+                (f"🚀 用 {project.ide.upper()} 打开", 'open_default'),
             ]
             
             # 添加其他 IDE 选项
-            current_ide = project.get('ide', 'idea')
+            current_ide = project.ide
             for ide in ['idea', 'webstorm', 'cursor']:
                 if ide != current_ide:
                     choices.append((f"{IDE_ICONS[ide]} 用 {ide.upper()} 打开", f'open_{ide}'))
             
             choices.extend([
                 inquirer.Separator(''),
-                ('⭐ 置顶' if not project.get('pinned', False) else '📌 取消置顶', 'toggle_pin'),
+                ('⭐ 置顶' if not project.pinned else '📌 取消置顶', 'toggle_pin'),
                 ('✏️  编辑信息', 'edit'),
                 ('🗑️  删除项目', 'delete'),
                 inquirer.Separator(''),
@@ -450,24 +508,22 @@ class ProjectManager:
                     input("\n按回车继续...")
                     break
                 elif action.startswith('open_'):
-                    ide = action.replace('open_', '')
-                    original_ide = project['ide']
-                    project['ide'] = ide
-                    self.open_project(project)
-                    project['ide'] = original_ide
+                    self.open_project(project, action.replace('open_', ''))
                     input("\n按回车继续...")
                     break
                 elif action == 'toggle_pin':
-                    project['pinned'] = not project.get('pinned', False)
-                    self.save_config()
-                    status = "置顶" if project['pinned'] else "取消置顶"
+                    with self.store.lock:
+                        project.pinned = not project.pinned
+                        self.store.changed(project)
+                        self.save_config()
+                    status = "置顶" if project.pinned else "取消置顶"
                     print(f"\n✅ 已{status}")
                     input("\n按回车继续...")
                 elif action == 'edit':
                     self.edit_project(project)
                 elif action == 'delete':
                     if self.confirm_delete(project):
-                        self.config['projects'].remove(project)
+                        self.store.remove(project)
                         self.save_config()
                         print("\n✅ 已删除")
                         input("\n按回车继续...")
@@ -478,9 +534,10 @@ class ProjectManager:
     
     def add_project(self, path=None):
         """添加项目 - 简化版"""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        clear_screen()
         
         print_banner("➕ 添加新项目", 70)
+        screen.flush()
         
         # 获取路径
         if path is None:
@@ -495,8 +552,8 @@ class ProjectManager:
         
         # 检查是否已存在
         for p in self.config['projects']:
-            if p['path'] == path:
-                print(f"⚠️  该路径已存在: {p['name']}")
+            if p.path == path:
+                print(f"⚠️  该路径已存在: {p.name}")
                 input("\n按回车继续...")
                 return
         
@@ -514,6 +571,9 @@ class ProjectManager:
                 inquirer.Text('remark',
                             message="描述 (可选)",
                             default=""),
+                inquirer.Text('tags',
+                            message="标签 (可选,逗号分隔)",
+                            default=""),
                 inquirer.List('ide',
                             message="默认 IDE",
                             choices=[
@@ -535,24 +595,21 @@ class ProjectManager:
             # 检查别名是否重复
             alias = answers['alias'] or answers['name']
             for p in self.config['projects']:
-                if p.get('alias', '') == alias and alias:
+                if p.alias == alias and alias:
                     print(f"\n⚠️  别名 '{alias}' 已存在,请使用其他别名")
                     input("\n按回车继续...")
                     return
             
             # 创建项目
-            project = {
-                "name": answers['name'],
-                "alias": alias,
-                "path": path,
-                "ide": answers['ide'],
-                "remark": answers['remark'],
-                "pinned": False,
-                "open_count": 0,
-                "created_at": datetime.now().isoformat()
-            }
-            
-            self.config['projects'].append(project)
+            project = Project(name=answers['name'],
+                              alias=alias,
+                              path=path,
+                              ide=answers['ide'],
+                              remark=answers['remark'],
+                              tags=parse_tags(answers['tags']),
+                              created_at=datetime.now().isoformat())
+            
+            self.store.add(project)
             self.save_config()
             
             print(f"\n✅ 项目已添加: {answers['name']}")
@@ -564,21 +621,25 @@ class ProjectManager:
     
     def edit_project(self, project):
         """编辑项目"""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        clear_screen()
         
-        print_banner(f"✏️  编辑项目: {project['name']}", 70)
+        print_banner(f"✏️  编辑项目: {project.name}", 70)
+        screen.flush()
         
         try:
             questions = [
                 inquirer.Text('name',
                             message="项目名称",
-                            default=project['name']),
+                            default=project.name),
                 inquirer.Text('alias',
                             message="别名",
-                            default=project.get('alias', '')),
+                            default=project.alias),
                 inquirer.Text('remark',
                             message="描述",
-                            default=project.get('remark', '')),
+                            default=project.remark),
+                inquirer.Text('tags',
+                            message="标签 (逗号分隔)",
+                            default=', '.join(project.tags)),
                 inquirer.List('ide',
                             message="默认 IDE",
                             choices=[
@@ -587,17 +648,20 @@ class ProjectManager:
                                 ('🌊 WebStorm', 'webstorm'),
                                 ('⚡ Cursor', 'cursor')
                             ],
-                            default=project.get('ide', 'idea'))
+                            default=project.ide)
             ]
             
             answers = inquirer.prompt(questions, theme=self.theme)
             
             if answers:
-                project['name'] = answers['name']
-                project['alias'] = answers['alias']
-                project['remark'] = answers['remark']
-                project['ide'] = answers['ide']
-                self.save_config()
+                with self.store.lock:
+                    project.update(name=answers['name'],
+                                   alias=answers['alias'],
+                                   remark=answers['remark'],
+                                   tags=parse_tags(answers['tags']),
+                                   ide=answers['ide'])
+                    self.store.changed(project)
+                    self.save_config()
                 
                 print("\n✅ 已保存")
                 input("\n按回车继续...")
@@ -610,58 +674,113 @@ class ProjectManager:
         """确认删除"""
         questions = [
             inquirer.Confirm('confirm',
-                           message=f"确定要删除项目 '{project['name']}' 吗?",
+                           message=f"确定要删除项目 '{project.name}' 吗?",
                            default=False)
         ]
         
         answer = inquirer.prompt(questions, theme=self.theme)
         return answer and answer['confirm']
     
-    def show_stats(self):
+    def show_stats(self, show_all_sizes=False):
         """显示统计信息"""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        clear_screen()
         
         projects = self.config['projects']
         
         print_banner("📊 统计信息", 70)
         
         if not projects:
-            print("📭 还没有项目\n")
+            screen.print("📭 还没有项目\n")
         else:
-            total = len(projects)
-            pinned = len([p for p in projects if p.get('pinned', False)])
-            total_opens = sum(p.get('open_count', 0) for p in projects)
-            
-            # IDE 统计
-            ide_stats = {}
-            for p in projects:
-                ide = p.get('ide', 'idea')
-                ide_stats[ide] = ide_stats.get(ide, 0) + 1
+            # 汇总随修改增量维护,这里不再遍历所有项目
+            stats = self.store.aggregates()
+            top_projects = stats.top(projects, 5)
             
-            # 最常用项目
-            top_projects = sorted(projects, key=lambda x: x.get('open_count', 0), reverse=True)[:5]
+            screen.print(f"📁 总项目数:   {stats.total}")
+            screen.print(f"⭐ 置顶项目:   {stats.pinned}")
+            screen.print(f"🚀 总打开次数: {stats.total_opens}\n")
             
-            print(f"📁 总项目数:   {total}")
-            print(f"⭐ 置顶项目:   {pinned}")
-            print(f"🚀 总打开次数: {total_opens}\n")
-            
-            print("💡 IDE 分布:")
-            for ide, count in ide_stats.items():
+            screen.print("💡 IDE 分布:")
+            for ide, count in stats.ide_counts.items():
                 emoji = IDE_ICONS.get(ide, '📁')
-                print(f"  {emoji} {ide.upper():10s}: {count} 个")
+                screen.print(f"  {emoji} {ide.upper():10s}: {count} 个")
             
-            if top_projects and total_opens > 0:
-                print("\n🔥 最常用项目:")
+            if top_projects:
+                screen.print("\n🔥 最常用项目:")
                 for i, p in enumerate(top_projects, 1):
-                    if p.get('open_count', 0) > 0:
-                        emoji = IDE_ICONS.get(p.get('ide', 'idea'), '📁')
-                        print(f"  {i}. {emoji} {p['name']:20s} - {p.get('open_count', 0)} 次")
+                    emoji = IDE_ICONS.get(p.ide, '📁')
+                    screen.print(f"  {i}. {emoji} {p.name:20s} - {p.open_count} 次")
+            
+            self._print_usage_trends()
+            self._print_launch_stats()
+            screen.flush()
+            self._print_size_stats(projects, show_all_sizes)
+            screen.invalidate()
         
-        print("\n" + "─" * 70)
+        print_separator(newline=True)
+        screen.flush()
         input("\n按回车返回...")
     
+    def _print_usage_trends(self):
+        """按天/按小时的使用趋势(只读汇总桶)"""
+        usage = self.store.usage
+        daily = usage.daily_totals(14)
+        if not any(daily):
+            return
+        screen.print(f"\n📈 近 14 天: {format_sparkline(daily)}  (共 {sum(daily)} 次, 最近 24 小时 {usage.last_hours(24)} 次)")
+        
+        weekly = usage.top_since(7, 5)
+        if weekly:
+            by_path = self.store.path_index()
+            screen.print("\n📅 本周最常打开:")
+            for i, (path, count) in enumerate(weekly, 1):
+                p = by_path.get(path)
+                if p:
+                    screen.print(f"  {i}. {IDE_ICONS.get(p.ide, '📁')} {p.name:20s} - {count} 次")
+    
+    def _print_launch_stats(self):
+        """按 IDE 的启动结果与耗时(launches.ndjson)"""
+        summary = self.store.launch_summary()
+        if not summary:
+            return
+        screen.print("\n🩺 启动情况:")
+        for ide, item in summary.items():
+            emoji = IDE_ICONS.get(ide, '📁')
+            latency = ""
+            if item['spawn_ms_p50'] is not None:
+                latency = f", 启动耗时 p50 {item['spawn_ms_p50']:.1f}ms / p95 {item['spawn_ms_p95']:.1f}ms"
+            failed = f", ❌ 失败 {item['failed']} 次" if item['failed'] else ""
+            screen.print(f"  {emoji} {ide.upper():10s}: {item['launches']} 次{failed}{latency}")
+    
+    def _print_size_stats(self, projects, show_all=False):
+        """磁盘占用与语言分布(按大小排序)"""
+        print("\n⏳ 正在统计项目大小...", end="\r", flush=True)
+        sizes = StatsCache(STATS_CACHE_FILE).collect([p.path for p in projects])
+        print(" " * 30, end="\r")
+        
+        ranked = sorted((p for p in projects if p.path in sizes),
+                        key=lambda x: sizes[x.path]['size'], reverse=True)
+        if not ranked:
+            return
+        
+        total_size = sum(sizes[p.path]['size'] for p in ranked)
+        total_files = sum(sizes[p.path]['files'] for p in ranked)
+        print(f"\n💾 磁盘占用: {format_size(total_size)} / {total_files} 个文件 (不含 node_modules/target 等)")
+        
+        shown = ranked if show_all else ranked[:10]
+        for i, p in enumerate(shown, 1):
+            stats = sizes[p.path]
+            emoji = IDE_ICONS.get(p.ide, '📁')
+            langs = ", ".join(f"{lang} {pct:.0f}%" for lang, pct in top_languages(stats))
+            print(f"  {i:2d}. {emoji} {p.name:20s} {format_size(stats['size']):>10s} {stats['files']:>7d} 个文件  {langs}")
+        
+        if len(ranked) > len(shown):
+            print(f"  ... 还有 {len(ranked) - len(shown)} 个项目 (open stats size 查看全部)")
+    
     def open_config(self):
         """打开配置文件"""
+        # 先把未落盘的修改写回,编辑器里看到的才是最新配置
+        self.store.flush()
         print(f"\n📁 配置文件: {CONFIG_FILE}")
         try:
             if os.name == 'nt':
@@ -681,17 +800,18 @@ class ProjectManager:
             input("\n按回车继续...")
             return
         
-        os.system('cls' if os.name == 'nt' else 'clear')
+        clear_screen()
         print_banner("🎨 选择主题", 70)
         
         # 列出所有主题
-        print("\n📋 可用主题:\n")
+        screen.print("\n📋 可用主题:\n")
         choices = []
         for name, desc in THEME_DESCRIPTIONS.items():
             choices.append((f"{desc}", name))
         
         current_theme = self.config.get('settings', {}).get('theme', 'default')
         
+        screen.flush()
         questions = [
             inquirer.List('theme',
                         message=f"当前主题: {current_theme}",
@@ -706,13 +826,15 @@ class ProjectManager:
                 new_theme = answer['theme']
                 
                 # 更新配置
-                if 'settings' not in self.config:
-                    self.config['settings'] = {}
-                self.config['settings']['theme'] = new_theme
-                self.save_config()
+                with self.store.lock:
+                    if 'settings' not in self.config:
+                        self.config['settings'] = {}
+                    self.config['settings']['theme'] = new_theme
+                    self.save_config()
                 
                 # 更新当前主题
                 self.theme = get_theme(new_theme)
+                self.palette = compile_palette(self.theme)
                 
                 print(f"\n✅ 主题已切换为: {new_theme}")
                 print("💡 新主题将在下次运行时生效")
@@ -723,9 +845,58 @@ class ProjectManager:
             input("\n按回车继续...")
 
 
+    def pick_projects(self, title, candidates, multi_select=True, initial_query=''):
+        """
+        选择项目 - 全屏实时过滤(每按一个键重新过滤,带预览),返回选中列表,取消返回 None
+        没有 prompt_toolkit 或不在终端中时降级为 inquirer 多选
+        """
+        if HAS_PROMPT_TOOLKIT and sys.stdin.isatty() and sys.stdout.isatty():
+            picker = ProjectPicker(candidates,
+                                   search=lambda query: self.filter_projects(query, candidates),
+                                   render_row=lambda p: self.format_project_display(p, with_color=False),
+                                   render_preview=self.format_project_preview,
+                                   title=title,
+                                   multi_select=multi_select,
+                                   initial_query=initial_query)
+            return picker.run()
+        
+        if initial_query:
+            candidates = self.filter_projects(initial_query, candidates)
+        choices = [(self.format_project_display(p), p) for p in candidates]
+        try:
+            if multi_select:
+                question = inquirer.Checkbox('projects', message=title, choices=choices)
+            else:
+                question = inquirer.List('projects', message=title, choices=choices, carousel=True)
+            answer = inquirer.prompt([question], theme=self.theme)
+        except KeyboardInterrupt:
+            return None
+        if not answer:
+            return None
+        return answer['projects'] if multi_select else [answer['projects']]
+    
+    def format_project_preview(self, project):
+        """预览窗格内容"""
+        ide = project.ide
+        lines = [
+            f"📁 {project.name}",
+            "",
+            f"别名: {project.alias or '-'}",
+            f"路径: {project.path}",
+            f"IDE:  {IDE_ICONS.get(ide, '📁')} {ide.upper()}",
+            f"描述: {project.remark or '-'}",
+            f"标签: {', '.join(project.tags) or '-'}",
+            f"打开: {project.open_count} 次",
+        ]
+        if project.last_opened:
+            lines.append(f"最近: {project.last_opened[:16].replace('T', ' ')}")
+        git = format_status(self.git.get(project.path))
+        if git:
+            lines.append(f"Git:  {git}")
+        return "\n".join(lines)
+    
     def quick_remove_batch(self):
         """批量选择删除项目 - 类似 open ls 的交互方式"""
-        selected_projects = []
         all_projects = self.get_sorted_projects()
         
         if not all_projects:
@@ -733,108 +904,10 @@ class ProjectManager:
             input("\n按回车继续...")
             return
         
-        while True:
-            os.system('cls' if os.name == 'nt' else 'clear')
-            print_banner("🗑️  批量删除项目", 70)
-            
-            # 显示所有项目列表(应用主题颜色)
-            accent = getattr(self.theme, 'accent_color', '\033[95m')
-            text = getattr(self.theme, 'text_color', '\033[37m')
-            dim = getattr(self.theme, 'dim_color', '\033[90m')
-            reset = '\033[0m'
-            
-            print(f"\n{accent}📋 所有项目:{reset}\n")
-            for p in all_projects[:15]:
-                alias = f"{dim}({p.get('alias', '')}){reset}" if p.get('alias') else ""
-                remark = f"{dim}- {p.get('remark', '')}{reset}" if p.get('remark') else ""
-                ide = IDE_ICONS.get(p.get('ide', 'idea'), '📁')
-                pin = "⭐" if p.get('pinned', False) else "  "
-                name_color = accent if p.get('pinned', False) else text
-                print(f"{pin} {ide} {name_color}{p['name']}{reset} {alias} {remark}")
-            
-            if len(all_projects) > 15:
-                print(f"{dim}  ... 还有 {len(all_projects) - 15} 个项目{reset}")
-            
-            print("\n" + "─" * 70)
-            
-            # 显示已选择要删除的项目(应用主题色)
-            if selected_projects:
-                print(f"\n{accent}❌ 待删除 {len(selected_projects)} 个项目:{reset}")
-                for i, p in enumerate(selected_projects, 1):
-                    ide_emoji = IDE_ICONS.get(p.get('ide', 'idea'), '📁')
-                    alias_display = f" {dim}({p.get('alias', '')}){reset}" if p.get('alias') and p.get('alias') != p['name'] else ""
-                    print(f"  {accent}{i}.{reset} {ide_emoji} {text}{p['name']}{reset}{alias_display}")
-                print("\n" + "─" * 70)
-            
-            # 输入搜索
-            print(f"\n💡 输入项目名搜索 | 直接回车{accent}删除{reset}已选项目 | Ctrl+C 退出\n")
-            
-            try:
-                search_input = prompt("🔍 搜索: ", 
-                                     completer=ProjectCompleter([p for p in all_projects if p not in selected_projects])).strip()
-                
-                if not search_input:
-                    # 直接回车,删除已选项目
-                    break
-                
-                # 搜索匹配(排除已选)
-                # 精确匹配别名或名称
-                exact_match = None
-                for p in all_projects:
-                    if p not in selected_projects:
-                        if (p.get('alias', '').lower() == search_input.lower() or 
-                            p['name'].lower() == search_input.lower()):
-                            exact_match = p
-                            break
-                
-                if exact_match:
-                    # 精确匹配,直接添加
-                    selected_projects.append(exact_match)
-                    continue
-                
-                # 模糊匹配
-                search_lower = search_input.lower()
-                matched = [p for p in all_projects 
-                          if (search_lower in p['name'].lower() or 
-                              search_lower in p.get('alias', '').lower() or
-                              search_lower in p.get('remark', '').lower())
-                          and p not in selected_projects]
-                
-                if not matched:
-                    print(f"\n❌ 找不到匹配 '{search_input}' 的未选项目")
-                    input("\n按回车继续...")
-                    continue
-                elif len(matched) == 1:
-                    # 只有1个匹配,直接添加
-                    selected_projects.append(matched[0])
-                    continue
-                else:
-                    # 多个匹配,显示选择列表
-                    os.system('cls' if os.name == 'nt' else 'clear')
-                    print_banner(f"🔍 搜索: {search_input} (共 {len(matched)} 个)", 70)
-                    
-                    if selected_projects:
-                        print(f"\n❌ 待删除: {', '.join([p['name'] for p in selected_projects])}\n")
-                    
-                    choices = [(self.format_project_display(p), p) for p in matched]
-                    
-                    questions = [
-                        inquirer.List('project',
-                                    message="↑↓ 选择项目,回车添加到删除列表",
-                                    choices=choices,
-                                    carousel=True)
-                    ]
-                    
-                    answer = inquirer.prompt(questions, theme=self.theme)
-                    
-                    if answer and answer['project']:
-                        selected_projects.append(answer['project'])
-            
-            except KeyboardInterrupt:
-                print("\n\n❌ 已取消")
-                return
-            except EOFError:
-                break
+        selected_projects = self.pick_projects("🗑️  批量删除项目 - Tab 选择要删除的项目,Enter 确认", all_projects)
+        if selected_projects is None:
+            print("\n❌ 已取消")
+            return
         
         # 删除选中的项目
         if not selected_projects:
@@ -843,31 +916,34 @@ class ProjectManager:
             return
         
         # 确认并删除
-        os.system('cls' if os.name == 'nt' else 'clear')
+        clear_screen()
         print_banner(f"⚠️  确认删除 {len(selected_projects)} 个项目", 70)
         
-        print("\n❌ 将要删除的项目:\n")
+        screen.print("\n❌ 将要删除的项目:\n")
         for i, p in enumerate(selected_projects, 1):
-            ide_emoji = IDE_ICONS.get(p.get('ide', 'idea'), '📁')
-            alias_display = f"({p.get('alias', '')})" if p.get('alias') and p.get('alias') != p['name'] else ""
-            remark = f"- {p.get('remark', '')}" if p.get('remark') else ""
-            print(f"  {i}. {ide_emoji} {p['name']}{alias_display} {remark}")
-        
-        print("\n" + "─" * 70)
-        print("⚠️  警告: 删除操作无法撤销!")
-        print("─" * 70)
+            ide_emoji = IDE_ICONS.get(p.ide, '📁')
+            alias_display = f"({p.alias})" if p.alias and p.alias != p.name else ""
+            remark = f"- {p.remark}" if p.remark else ""
+            screen.print(f"  {i}. {ide_emoji} {p.name}{alias_display} {remark}")
+        
+        print_separator(newline=True)
+        screen.print("⚠️  警告: 删除操作无法撤销!")
+        print_separator()
+        screen.flush()
         confirm = input("\n按回车或输入 yes 确认删除 (输入 n 取消): ").strip().lower()
         
+        # 后面的逐项输出长度不定,屏幕可能滚动,下一帧整屏重画
+        screen.invalidate()
         if confirm != 'n':
             print(f"\n🗑️  正在删除 {len(selected_projects)} 个项目...\n")
             
             success_count = 0
             for i, project in enumerate(selected_projects, 1):
-                ide_emoji = IDE_ICONS.get(project.get('ide', 'idea'), '📁')
-                print(f"[{i}/{len(selected_projects)}] {ide_emoji} {project['name']}...", end=" ", flush=True)
+                ide_emoji = IDE_ICONS.get(project.ide, '📁')
+                print(f"[{i}/{len(selected_projects)}] {ide_emoji} {project.name}...", end=" ", flush=True)
                 
                 try:
-                    self.config['projects'].remove(project)
+                    self.store.remove(project)
                     print("✅")
                     success_count += 1
                 except:
@@ -882,9 +958,8 @@ class ProjectManager:
         
         input("\n按回车继续...")
 
-    def quick_open_batch(self):
-        """批量选择打开项目 - 简化流程"""
-        selected_projects = []
+    def quick_open_batch(self, keyword=''):
+        """批量选择打开项目 - 简化流程(keyword 为初始过滤条件)"""
         all_projects = self.get_sorted_projects()
         
         if not all_projects:
@@ -892,108 +967,17 @@ class ProjectManager:
             input("\n按回车继续...")
             return
         
-        while True:
-            os.system('cls' if os.name == 'nt' else 'clear')
-            print_banner("🚀 批量选择项目", 70)
-            
-            # 显示所有项目列表(应用主题颜色)
-            accent = getattr(self.theme, 'accent_color', '\033[95m')
-            text = getattr(self.theme, 'text_color', '\033[37m')
-            dim = getattr(self.theme, 'dim_color', '\033[90m')
-            reset = '\033[0m'
-            
-            print(f"\n{accent}📋 所有项目:{reset}\n")
-            for p in all_projects[:15]:
-                alias = f"{dim}({p.get('alias', '')}){reset}" if p.get('alias') else ""
-                remark = f"{dim}- {p.get('remark', '')}{reset}" if p.get('remark') else ""
-                ide = IDE_ICONS.get(p.get('ide', 'idea'), '📁')
-                pin = "⭐" if p.get('pinned', False) else "  "
-                name_color = accent if p.get('pinned', False) else text
-                print(f"{pin} {ide} {name_color}{p['name']}{reset} {alias} {remark}")
-            
-            if len(all_projects) > 15:
-                print(f"{dim}  ... 还有 {len(all_projects) - 15} 个项目{reset}")
-            
-            print("\n" + "─" * 70)
-            
-            # 显示已选择的项目(应用主题色)
-            if selected_projects:
-                print(f"\n{accent}✅ 已选择 {len(selected_projects)} 个项目:{reset}")
-                for i, p in enumerate(selected_projects, 1):
-                    ide_emoji = IDE_ICONS.get(p.get('ide', 'idea'), '📁')
-                    alias_display = f" {dim}({p.get('alias', '')}){reset}" if p.get('alias') and p.get('alias') != p['name'] else ""
-                    print(f"  {accent}{i}.{reset} {ide_emoji} {text}{p['name']}{reset}{alias_display}")
-                print("\n" + "─" * 70)
-            
-            # 输入搜索
-            print("\n💡 输入项目名搜索 | 直接回车打开已选项目 | Ctrl+C 退出\n")
-            
-            try:
-                search_input = prompt("🔍 搜索: ", 
-                                     completer=ProjectCompleter([p for p in all_projects if p not in selected_projects])).strip()
-                
-                if not search_input:
-                    # 直接回车,打开已选项目
-                    break
-                
-                # 搜索匹配(排除已选)
-                # 精确匹配别名或名称
-                exact_match = None
-                for p in all_projects:
-                    if p not in selected_projects:
-                        if (p.get('alias', '').lower() == search_input.lower() or 
-                            p['name'].lower() == search_input.lower()):
-                            exact_match = p
-                            break
-                
-                if exact_match:
-                    # 精确匹配,直接添加
-                    selected_projects.append(exact_match)
-                    continue
-                
-                # 模糊匹配
-                search_lower = search_input.lower()
-                matched = [p for p in all_projects 
-                          if (search_lower in p['name'].lower() or 
-                              search_lower in p.get('alias', '').lower() or
-                              search_lower in p.get('remark', '').lower())
-                          and p not in selected_projects]
-                
-                if not matched:
-                    print(f"\n❌ 找不到匹配 '{search_input}' 的未选项目")
-                    input("\n按回车继续...")
-                    continue
-                elif len(matched) == 1:
-                    # 只有1个匹配,直接添加
-                    selected_projects.append(matched[0])
-                    continue
-                else:
-                    # 多个匹配,显示选择列表
-                    os.system('cls' if os.name == 'nt' else 'clear')
-                    print_banner(f"🔍 搜索: {search_input} (共 {len(matched)} 个)", 70)
-                    
-                    if selected_projects:
-                        print(f"\n✅ 已选择: {', '.join([p['name'] for p in selected_projects])}\n")
-                    
-                    choices = [(self.format_project_display(p), p) for p in matched]
-                    
-                    questions = [
-                        inquirer.List('project',
-                                    message="↑↓ 选择项目,回车添加",
-                                    choices=choices,
-                                    carousel=True)
-                    ]
-                    
-                    answer = inquirer.prompt(questions, theme=self.theme)
-                    
-                    if answer and answer['project']:
-                        selected_projects.append(answer['project'])
-            
-            except KeyboardInterrupt:
-                print("\n\n❌ 已取消")
-                return
-            except EOFError:
-                break
+        # 预测接下来要打开的项目排在最前(过滤时保持这个顺序)
+        predicted = self.store.predicted()
+        if predicted:
+            ids = {id(p) for p in predicted}
+            all_projects = predicted + [p for p in all_projects if id(p) not in ids]
+        
+        selected_projects = self.pick_projects("🚀 批量选择项目 - Tab 多选,Enter 确认", all_projects,
+                                               initial_query=keyword)
+        if selected_projects is None:
+            print("\n❌ 已取消")
+            return
         
         # 打开选中的项目
         if not selected_projects:
@@ -1002,35 +986,36 @@ class ProjectManager:
             return
         
         # 确认并打开
-        os.system('cls' if os.name == 'nt' else 'clear')
+        clear_screen()
         print_banner(f"📋 确认打开 {len(selected_projects)} 个项目", 70)
         
-        print("\n✅ 将要打开的项目:\n")
+        screen.print("\n✅ 将要打开的项目:\n")
         for i, p in enumerate(selected_projects, 1):
-            ide_emoji = IDE_ICONS.get(p.get('ide', 'idea'), '📁')
-            alias_display = f"({p.get('alias', '')})" if p.get('alias') and p.get('alias') != p['name'] else ""
-            remark = f"- {p.get('remark', '')}" if p.get('remark') else ""
-            print(f"  {i}. {ide_emoji} {p['name']}{alias_display} {remark}")
+            ide_emoji = IDE_ICONS.get(p.ide, '📁')
+            alias_display = f"({p.alias})" if p.alias and p.alias != p.name else ""
+            remark = f"- {p.remark}" if p.remark else ""
+            screen.print(f"  {i}. {ide_emoji} {p.name}{alias_display} {remark}")
         
-        print("\n" + "─" * 70)
+        print_separator(newline=True)
+        screen.flush()
         confirm = input("\n按回车开始打开所有项目 (输入 n 取消): ").strip().lower()
         
+        # 后面的逐项输出长度不定,屏幕可能滚动,下一帧整屏重画
+        screen.invalidate()
         if confirm != 'n':
-            print(f"\n🚀 正在打开 {len(selected_projects)} 个项目...\n")
+            print(f"\n🚀 正在打开 {len(selected_projects)} 个项目...\n", flush=True)
+            
+            # 全部启动后一起等宽限期,启动后立即出错退出的算失败(统一保存一次配置)
+            results = self.launcher.launch_many(selected_projects)
             
             success_count = 0
-            for i, project in enumerate(selected_projects, 1):
-                ide_emoji = IDE_ICONS.get(project.get('ide', 'idea'), '📁')
-                print(f"[{i}/{len(selected_projects)}] {ide_emoji} {project['name']}...", end=" ", flush=True)
-                
-                if self.open_project_silent(project):
-                    print("✅")
+            for i, (project, error) in enumerate(results, 1):
+                ide_emoji = IDE_ICONS.get(project.ide, '📁')
+                if error is None:
+                    print(f"[{i}/{len(results)}] {ide_emoji} {project.name}... ✅")
                     success_count += 1
                 else:
-                    print("❌")
-            
-            # 保存配置(统一保存一次)
-            self.save_config()
+                    print(f"[{i}/{len(results)}] {ide_emoji} {project.name}... ❌ {error}")
             
             print(f"\n✅ 成功打开 {success_count}/{len(selected_projects)} 个项目!")
         else:
@@ -1039,7 +1024,7 @@ class ProjectManager:
         input("\n按回车继续...")
     
     def quick_open(self, keyword=None, multi_select=False):
-        """快速打开 - 带实时搜索过滤"""
+        """快速打开 - 全屏实时过滤选择(keyword 为初始过滤条件)"""
         projects = self.get_sorted_projects()
         
         if not projects:
@@ -1047,163 +1032,124 @@ class ProjectManager:
             input("\n按回车继续...")
             return
         
-        # 如果没有提供关键词且支持实时搜索
-        if not keyword and HAS_PROMPT_TOOLKIT:
-            self._interactive_search(projects, multi_select)
-        else:
-            # 传统模式:先过滤再选择
-            if keyword:
-                keyword_lower = keyword.lower()
-                filtered = [p for p in projects 
-                           if keyword_lower in p['name'].lower() 
-                           or keyword_lower in p.get('alias', '').lower()
-                           or keyword_lower in p.get('remark', '').lower()]
-                
-                if not filtered:
-                    print(f"\n❌ 找不到匹配 '{keyword}' 的项目")
-                    input("\n按回车继续...")
-                    return
-                
-                projects = filtered
-            
-            self._select_and_open(projects, keyword, multi_select)
+        if keyword and not self.filter_projects(keyword, projects):
+            print(f"\n❌ 找不到匹配 '{keyword}' 的项目")
+            input("\n按回车继续...")
+            return
+        
+        self._select_and_open(projects, keyword, multi_select)
     
-    def _interactive_search(self, all_projects, multi_select=False):
-        """交互式实时搜索"""
-        from prompt_toolkit.shortcuts import input_dialog
-        from prompt_toolkit.styles import Style
-        from prompt_toolkit.formatted_text import HTML
+    def find_file(self, fragment=None):
+        """按文件名找项目 - 在所有项目的文件索引中搜索,选中后打开所属项目"""
+        projects = self.get_sorted_projects()
         
-        while True:
-            os.system('cls' if os.name == 'nt' else 'clear')
+        if not projects:
+            print("\n📭 还没有项目")
+            input("\n按回车继续...")
+            return
+        
+        try:
+            if not fragment:
+                fragment = input("\n🔎 文件名: ").strip()
+            if not fragment:
+                return
             
-            print_banner("🚀 快速打开 - 实时搜索", 70)
+            index = FileIndex(FILE_INDEX_FILE)
+            paths = [p.path for p in projects]
             
-            # 显示所有项目
-            pinned = [p for p in all_projects if p.get('pinned', False)]
-            unpinned = [p for p in all_projects if not p.get('pinned', False)]
+            # 先补建缺失的项目,直接查已有索引;查不到再做一次增量更新
+            if index.missing(paths):
+                print("⏳ 正在建立文件索引...")
+                index.update(paths, check_all=False)
+            by_path = {p.path: p for p in projects}
+            hits = index.search(fragment, roots=by_path)
+            if not hits and index.update(paths):
+                hits = index.search(fragment, roots=by_path)
             
-            if pinned:
-                print("\n⭐ 置顶项目:")
-                for i, p in enumerate(pinned[:5], 1):
-                    print(f"  {self.format_project_display(p)}")
+            if not hits:
+                print(f"\n❌ 找不到文件名包含 '{fragment}' 的文件")
+                input("\n按回车继续...")
+                return
             
-            if unpinned:
-                print("\n📌 全部项目:" if pinned else "\n📌 项目列表:")
-                for i, p in enumerate(unpinned[:10], 1):
-                    print(f"  {self.format_project_display(p)}")
-                
-                if len(unpinned) > 10:
-                    print(f"  ... 还有 {len(unpinned) - 10} 个项目")
+            choices = []
+            for path, rel in hits:
+                p = by_path[path]
+                ide = IDE_ICONS.get(p.ide, '📁')
+                choices.append((f"{ide} {p.display_name}  ›  {rel}", p))
             
-            print("\n" + "─" * 70)
-            print("💡 输入关键词过滤 | 留空查看全部 | Ctrl+C 退出")
-            print("─" * 70)
+            print_banner(f"🔎 文件: {fragment} (共 {len(hits)} 个)", 70)
+            questions = [
+                inquirer.List('project',
+                            message="选择文件,回车打开所属项目",
+                            choices=choices,
+                            carousel=True)
+            ]
+            answer = inquirer.prompt(questions, theme=self.theme)
             
-            try:
-                keyword = prompt("\n🔍 搜索: ", completer=ProjectCompleter(all_projects)).strip()
-                
-                # 过滤项目
-                if keyword:
-                    keyword_lower = keyword.lower()
-                    filtered = [p for p in all_projects 
-                               if keyword_lower in p['name'].lower() 
-                               or keyword_lower in p.get('alias', '').lower()
-                               or keyword_lower in p.get('remark', '').lower()]
-                    
-                    if not filtered:
-                        print(f"\n❌ 找不到匹配 '{keyword}' 的项目")
-                        input("\n按回车继续...")
-                        continue
-                    
-                    projects = filtered
-                else:
-                    projects = all_projects
-                
-                # 选择并打开
-                self._select_and_open(projects, keyword, multi_select)
-                break
-                
-            except KeyboardInterrupt:
-                print("\n\n❌ 已取消")
-                break
-            except EOFError:
-                projects = all_projects
-                self._select_and_open(projects, None, multi_select)
-                break
+            if answer and answer['project']:
+                self.open_project(answer['project'])
+                input("\n按回车继续...")
+        
+        except KeyboardInterrupt:
+            print("\n\n❌ 已取消")
     
-    def _select_and_open(self, projects, keyword=None, multi_select=False):
-        """选择并打开项目 - 支持连续选择累加"""
-        selected_projects = []
-        all_projects = self.get_sorted_projects()  # 获取所有项目用于搜索
+    def export_projects(self, target=None):
+        """导出为 NDJSON(每行一个项目),不指定文件时写到标准输出"""
+        projects = self.config['projects']
+        if not target or target == '-':
+            count = transfer.export_projects(projects, sys.stdout)
+            sys.stdout.flush()
+            print(f"✅ 已导出 {count} 个项目", file=sys.stderr)
+            return
         
-        while True:
-            os.system('cls' if os.name == 'nt' else 'clear')
-            print_banner("🚀 选择项目", 70)
-            
-            # 显示已选择的项目
-            if selected_projects:
-                print(f"\n✅ 已选择 {len(selected_projects)} 个项目:")
-                for i, p in enumerate(selected_projects, 1):
-                    ide_emoji = IDE_ICONS.get(p.get('ide', 'idea'), '📁')
-                    print(f"  {i}. {ide_emoji} {p['name']}")
-                print("\n" + "─" * 70)
-            
-            # 提示
-            print("\n💡 输入项目名称搜索 | 留空完成选择并打开 | Ctrl+C 退出\n")
-            
-            try:
-                # 输入搜索关键词,带自动补全
-                search_input = prompt("🔍 搜索项目: ", 
-                                     completer=ProjectCompleter(all_projects)).strip()
-                
-                if not search_input:
-                    # 留空表示完成选择
-                    break
-                
-                # 搜索匹配的项目
-                search_lower = search_input.lower()
-                matched = [p for p in all_projects 
-                          if (search_lower in p['name'].lower() or 
-                              search_lower in p.get('alias', '').lower() or
-                              search_lower in p.get('remark', '').lower())
-                          and p not in selected_projects]  # 排除已选
-                
-                if not matched:
-                    print(f"\n❌ 找不到匹配 '{search_input}' 的项目")
-                    input("\n按回车继续...")
-                    continue
-                
-                # 显示匹配结果并选择
-                os.system('cls' if os.name == 'nt' else 'clear')
-                print_banner(f"🔍 搜索: {search_input} (共 {len(matched)} 个)", 70)
-                
-                if selected_projects:
-                    print(f"\n✅ 已选择: ", end="")
-                    print(", ".join([p['name'] for p in selected_projects]))
-                    print()
-                
-                choices = [(self.format_project_display(p), p) for p in matched]
-                
-                questions = [
-                    inquirer.List('project',
-                                message="选择一个项目添加到列表",
-                                choices=choices,
-                                carousel=True)
-                ]
-                
-                answer = inquirer.prompt(questions, theme=self.theme)
-                
-                if answer and answer['project']:
-                    # 添加到已选列表
-                    selected_projects.append(answer['project'])
-                    # 不需要 input,直接循环回到开始,会显示已选项目
-            
-            except KeyboardInterrupt:
-                print("\n\n❌ 已取消")
-                return
-            except EOFError:
-                break
+        try:
+            with open(target, 'w', encoding='utf-8', newline='\n') as f:
+                count = transfer.export_projects(projects, f)
+        except OSError as e:
+            print(f"❌ 导出失败: {e}")
+            return
+        print(f"✅ 已导出 {count} 个项目到 {target}")
+    
+    def import_projects(self, source=None):
+        """从 NDJSON 导入(不指定文件或为 - 时读标准输入),按路径去重合并,最后只保存一次"""
+        try:
+            if not source or source == '-':
+                if sys.stdin.isatty():
+                    print("💡 用法: open import <文件.ndjson>  或  cat 文件 | open import")
+                    return
+                stream = open(sys.stdin.fileno(), 'r', encoding='utf-8', closefd=False)
+            else:
+                stream = open(source, 'r', encoding='utf-8')
+        except OSError as e:
+            print(f"❌ 无法读取: {e}")
+            return
+        
+        with stream, self.store.lock:
+            result = transfer.import_projects(stream, self.config['projects'],
+                                              self.config['settings']['default_ide'])
+            for project in result.added + result.merged:
+                self.store.changed(project)
+        if result.added or result.merged:
+            self.save_config()
+            self.store.flush()
+        
+        print(f"✅ 新增 {len(result.added)} 个, 合并 {len(result.merged)} 个")
+        if result.errors:
+            print(f"⚠️  跳过 {len(result.errors)} 行:")
+            for lineno, error in result.errors[:10]:
+                print(f"   第 {lineno} 行: {error}")
+        if result.alias_conflicts:
+            print(f"⚠️  {len(result.alias_conflicts)} 个别名已被其他项目使用,未采用:")
+            for lineno, alias in result.alias_conflicts[:10]:
+                print(f"   第 {lineno} 行: {alias}")
+    
+    def _select_and_open(self, projects, keyword=None, multi_select=False):
+        """选择并打开项目 - 选中的项目一批启动,统一等宽限期并记录"""
+        selected_projects = self.pick_projects("🚀 选择项目 - Tab 多选,Enter 确认", projects,
+                                               initial_query=keyword or '')
+        if selected_projects is None:
+            print("\n❌ 已取消")
+            return
         
         # 完成选择,开始打开
         if not selected_projects:
@@ -1211,45 +1157,81 @@ class ProjectManager:
             input("\n按回车继续...")
             return
         
-        os.system('cls' if os.name == 'nt' else 'clear')
+        clear_screen()
         print_banner(f"📋 确认打开 {len(selected_projects)} 个项目", 70)
         
-        print("\n✅ 将要打开的项目:\n")
+        screen.print("\n✅ 将要打开的项目:\n")
         for i, p in enumerate(selected_projects, 1):
-            ide_emoji = IDE_ICONS.get(p.get('ide', 'idea'), '📁')
-            print(f"  {i}. {ide_emoji} {p['name']} - {p.get('remark', '')}")
+            ide_emoji = IDE_ICONS.get(p.ide, '📁')
+            screen.print(f"  {i}. {ide_emoji} {p.name} - {p.remark}")
         
-        print("\n" + "─" * 70)
+        print_separator(newline=True)
+        screen.flush()
         confirm = input("\n按回车开始打开所有项目 (输入 n 取消): ").strip().lower()
         
+        # 后面的逐项输出长度不定,屏幕可能滚动,下一帧整屏重画
+        screen.invalidate()
         if confirm != 'n':
-            print(f"\n🚀 正在打开 {len(selected_projects)} 个项目...\n")
-            for i, project in enumerate(selected_projects, 1):
-                print(f"[{i}/{len(selected_projects)}] 打开 {project['name']}...")
-                self.open_project(project)
+            print(f"\n🚀 正在打开 {len(selected_projects)} 个项目...\n", flush=True)
+            results = self.launcher.launch_many(selected_projects)
+            
+            success_count = 0
+            for i, (project, error) in enumerate(results, 1):
+                ide_emoji = IDE_ICONS.get(project.ide, '📁')
+                if error is None:
+                    print(f"[{i}/{len(results)}] {ide_emoji} {project.name}... ✅")
+                    success_count += 1
+                else:
+                    print(f"[{i}/{len(results)}] {ide_emoji} {project.name}... ❌ {error}")
             
-            print(f"\n✅ 已打开 {len(selected_projects)} 个项目!")
+            print(f"\n✅ 成功打开 {success_count}/{len(selected_projects)} 个项目!")
         else:
             print("\n❌ 已取消")
         
         input("\n按回车继续...")
 
 
+def print_completions(shell):
+    """输出补全脚本;补全缓存还没生成时先加载一次项目把它写出来"""
+    script = completion_script(shell.lower(), LOOKUPS_FILE)
+    if script is None:
+        print(f"💡 用法: open completions {'|'.join(SHELLS)}", file=sys.stderr)
+        return
+    if not LOOKUPS_FILE.exists():
+        ProjectStore()
+    sys.stdout.write(script)
+    if sys.stdout.isatty():
+        print(f"\n💡 保存到补全目录即可生效,例如: {COMPLETION_TARGETS[shell.lower()]}", file=sys.stderr)
+
+
 def main():
     if not HAS_INQUIRER:
         return
     
-    manager = ProjectManager()
-    
     args = sys.argv[1:]
     
+    # open completions bash|zsh|fish - 输出 Shell 补全脚本
+    if args and args[0].lower() == 'completions':
+        print_completions(args[1] if len(args) > 1 else '')
+        return
+    
+    manager = ProjectManager()
+    try:
+        run_command(manager, args)
+    finally:
+        # 线程池自己的退出钩子在 atexit 之前执行,会把排队的 Git 查询全部跑完,所以这里先取消
+        manager.git.close()
+
+
+def run_command(manager, args):
+    """快捷命令,没有参数时进入主菜单"""
     # 快捷命令
     if args:
         cmd = args[0].lower()
         
         if cmd == 'list' or cmd == 'ls':
-            # open list/ls - 批量选择打开
-            manager.quick_open_batch()
+            # open list/ls [关键词] - 批量选择打开
+            manager.quick_open_batch(' '.join(args[1:]))
             return
         elif cmd == 'remove' or cmd == 'rm' or cmd == 'del':
             # open rm/remove/del - 批量删除项目
@@ -1262,8 +1244,21 @@ def main():
         elif cmd == 'config':
             manager.open_config()
             return
+        elif cmd == 'find':
+            # open find <文件名片段> - 找到文件所在项目并打开
+            manager.find_file(' '.join(args[1:]))
+            return
         elif cmd == 'stats':
-            manager.show_stats()
+            # open stats size - 按大小列出全部项目
+            manager.show_stats(show_all_sizes=len(args) > 1 and args[1].lower() == 'size')
+            return
+        elif cmd == 'export':
+            # open export [文件] - 导出 NDJSON(默认输出到标准输出)
+            manager.export_projects(args[1] if len(args) > 1 else None)
+            return
+        elif cmd == 'import':
+            # open import [文件] - 导入 NDJSON(默认读标准输入)
+            manager.import_projects(args[1] if len(args) > 1 else None)
             return
         elif cmd == 'style' or cmd == 'theme':
             manager.change_theme()
@@ -1277,18 +1272,37 @@ def main():
 📖 基本用法:
 
   open                启动交互式主菜单
-  open list           批量选择打开项目
+  open list [关键词]   批量选择打开项目(可带初始过滤)
   open ls             同 list (简写)
   open rm             批量删除项目
   open add            添加当前目录为项目
   open style          更换主题风格
+  open find <文件名>   找到文件所在的项目并打开
+  open -              用上次的 IDE 重新打开最近一个项目
+  open recent [数量]   列出最近打开的项目(默认 10 个)
   open stats          查看统计信息
+  open stats size     按磁盘占用列出全部项目
+  open export [文件]   导出项目为 NDJSON(默认输出到屏幕,可重定向)
+  open import [文件]   从 NDJSON 导入项目(也可从管道读入)
   open config         打开配置文件
+  open serve [端口]    启动本地 JSON-RPC 服务(默认 127.0.0.1:7391)
+  open completions <shell>  输出 bash/zsh/fish 补全脚本(Tab 补全项目别名)
+  open cd <查询>       切换到最匹配的项目目录(需先加载 open init 的 shell 函数)
+  open init <shell>   输出 bash/zsh/fish 的 shell 集成函数
+
+🤖 脚本模式 (任意命令加 --json 或 --no-interactive):
+
+  open ls [查询] --json     按主菜单顺序逐行输出项目(JSON Lines)
+  open stats --json         输出统计汇总(stats size 每个项目一行)
+  open find <文件名> --json  每个命中的文件一行
+  open add [路径] --json    按默认值添加项目,输出新项目
+  不清屏、不等回车,出错时输出 {"error": ...} 并返回非零退出码
 
 💡 交互式操作:
 
   主菜单模式 (open):
   • 使用 ↑↓ 方向键选择项目
+  • 项目很多时分页显示,可翻页或按首字母跳转
   • 按 Enter 进入项目操作菜单
   • 可以进行详细操作:
     - 打开项目(多种 IDE)
@@ -1299,28 +1313,29 @@ def main():
   批量选择模式 (open list / open ls):
   
   流程:
-  1. 显示所有项目(名称+别名+描述)
-  2. 输入项目名搜索 → ↑↓选择 → 回车添加
-  3. 显示已选: 1. xxx  2. yyy  3. zzz
-  4. 继续输入搜索下一个项目,或直接回车
-  5. 回车后确认并批量打开所有项目
+  1. 全屏显示所有项目,右侧是预览
+  2. 输入关键词 → 列表随每次按键实时过滤
+  3. ↑↓ 移动, Tab 选中/取消(可跨多次搜索累加)
+  4. Enter 确认(未选中时打开光标所在项目), Esc 取消
+  5. 确认后批量打开所有项目
   
   批量删除模式 (open rm):
   
   流程:
-  1. 显示所有项目列表
-  2. 输入项目名搜索 → ↑↓选择 → 回车添加到删除列表
-  3. 显示待删除: 1. xxx  2. yyy  3. zzz
-  4. 继续输入搜索下一个,或直接回车
-  5. 回车或输入 yes 确认删除(输入 n 取消)
+  1. 全屏显示所有项目列表
+  2. 输入关键词实时过滤, Tab 加入删除列表
+  3. Enter 确认选择
+  4. 回车或输入 yes 确认删除(输入 n 取消)
 
 🎯 特性:
 
-  • 实时补全: 输入时动态提示项目名
+  • 实时过滤: 每按一个键列表立即刷新
   • 连续选择: 逐个搜索累加项目
   • 智能排序: 按打开次数自动排序
   • 批量打开: 一次打开多个项目
   • 模糊搜索: 支持名称/别名/描述
+  • 分面筛选: ide:vscode tag:backend pinned:yes shop
+  • 全文兜底: 匹配不到时搜索 README 与项目描述
   • 多 IDE:   支持 IDEA/VSCode/WebStorm/Cursor
   • 颜色区分: 不同 IDE 不同颜色
   • 多种主题: 8种精美主题可选
@@ -1343,16 +1358,16 @@ def main():
 
   open ls (批量打开)
   步骤1: 看到所有项目列表
-  步骤2: 输入 shop → 选择 → 已选 1 个
-  步骤3: 输入 admin → 选择 → 已选 2 个
-  步骤4: 输入 api → 选择 → 已选 3 个
-  步骤5: 直接回车 → 确认 → 批量打开 3 个项目
+  步骤2: 输入 shop → Tab → 已选 1 个
+  步骤3: 改成 admin → Tab → 已选 2 个
+  步骤4: 改成 api → Tab → 已选 3 个
+  步骤5: Enter → 确认 → 批量打开 3 个项目
   
   open rm (批量删除)
   步骤1: 看到所有项目列表
-  步骤2: 输入 test → 选择 → 待删除 1 个
-  步骤3: 输入 demo → 选择 → 待删除 2 个
-  步骤4: 直接回车 → 直接回车或输入 yes → 删除完成
+  步骤2: 输入 test → Tab → 待删除 1 个
+  步骤3: 改成 demo → Tab → 待删除 2 个
+  步骤4: Enter → 直接回车或输入 yes → 删除完成
 
 配置文件: {config_file}
 
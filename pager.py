@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+📄 项目启动器 - 分页窗口
+大列表只处理当前页,翻页/按首字母跳转都不随列表长度变慢
+"""
+
+import bisect
+
+
+class Pager:
+    """列表分页窗口 - 记录当前页,提供当前页及前后缓冲区的切片"""
+    def __init__(self, items, page_size=20, buffer=5, key=None):
+        self.items = items
+        self.page_size = max(1, page_size)
+        self.buffer = buffer
+        self.key = key or str
+        self.page = 0
+        self._letters = None
+
+    def reset(self, items):
+        """换一批数据,尽量停留在原页码"""
+        self.items = items
+        self._letters = None
+        self.page = min(self.page, self.page_count - 1)
+
+    @property
+    def page_count(self):
+        return max(1, (len(self.items) + self.page_size - 1) // self.page_size)
+
+    @property
+    def start(self):
+        return self.page * self.page_size
+
+    def visible(self):
+        """当前页: [(序号, 元素)]"""
+        end = min(self.start + self.page_size, len(self.items))
+        return [(i, self.items[i]) for i in range(self.start, end)]
+
+    def window(self):
+        """当前页加前后缓冲区,用于预取(如 Git 状态),翻页时数据已就绪"""
+        begin = max(0, self.start - self.buffer)
+        end = min(self.start + self.page_size + self.buffer, len(self.items))
+        return self.items[begin:end]
+
+    def next_page(self):
+        self.page = (self.page + 1) % self.page_count
+
+    def prev_page(self):
+        self.page = (self.page - 1) % self.page_count
+
+    def _letter_index(self):
+        """首字母 -> 有序位置列表,只在数据变化后构建一次"""
+        if self._letters is None:
+            letters = {}
+            for i, item in enumerate(self.items):
+                text = self.key(item)
+                if text:
+                    letters.setdefault(text[0].lower(), []).append(i)
+            self._letters = letters
+        return self._letters
+
+    def jump_to_letter(self, letter):
+        """跳到当前页之后第一个以该字母开头的元素所在页(循环),返回其序号,找不到返回 None"""
+        positions = self._letter_index().get(letter[:1].lower())
+        if not positions:
+            return None
+        i = bisect.bisect_left(positions, self.start + self.page_size)
+        target = positions[i] if i < len(positions) else positions[0]
+        self.page = target // self.page_size
+        return target
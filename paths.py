@@ -0,0 +1,30 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+📁 项目启动器 - 配置/缓存文件路径
+只依赖 pathlib,open.py 画启动快照前就可以导入
+"""
+
+from pathlib import Path
+
+CONFIG_DIR = Path.home() / '.project-manager'
+CONFIG_FILE = CONFIG_DIR / 'projects.json'
+IDE_CONFIG_FILE = CONFIG_DIR / 'ide_config.json'
+MENU_SNAPSHOT_FILE = CONFIG_DIR / 'menu_snapshot.json'
+GIT_CACHE_FILE = CONFIG_DIR / 'git_cache.json'
+STATS_CACHE_FILE = CONFIG_DIR / 'stats_cache.json'
+FILE_INDEX_FILE = CONFIG_DIR / 'file_index.bin'
+TEXT_INDEX_FILE = CONFIG_DIR / 'text_index.json'
+REGISTRY_INDEX_FILE = CONFIG_DIR / 'registry_index.json'
+REGISTRY_DETAIL_FILE = CONFIG_DIR / 'registry_detail.jsonl'
+USAGE_FILE = CONFIG_DIR / 'usage.json'
+LOOKUPS_FILE = CONFIG_DIR / 'completions.txt'
+JUMP_FILE = CONFIG_DIR / 'jump.tsv'
+MRU_FILE = CONFIG_DIR / 'mru.json'
+PREDICT_FILE = CONFIG_DIR / 'predict.json'
+LAUNCH_LOG_FILE = CONFIG_DIR / 'launches.ndjson'
+RPC_TOKEN_FILE = CONFIG_DIR / 'rpc_token'
+
+# 脚本目录下的 IDE 配置(优先于用户目录)
+SCRIPT_DIR = Path(__file__).parent
+LOCAL_IDE_CONFIG = SCRIPT_DIR / 'config.json'
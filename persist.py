@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+💾 项目启动器 - 落盘工具
+原子写入: 先写同目录临时文件再 os.replace,写到一半崩溃也不会留下半个 JSON
+延迟写回: 连续修改只标记脏,防抖到期/退出/收到信号时合并成一次写入
+"""
+
+import os
+import json
+import atexit
+import signal
+import tempfile
+import threading
+
+# 默认防抖时间(秒)
+DEBOUNCE = 0.5
+
+
+# 当前 umask,新建文件的权限与普通 open() 一致
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def atomic_write(path, data):
+    """原子写入文件(str 按 UTF-8 编码),保留原文件权限"""
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    directory = os.path.dirname(os.fspath(path)) or '.'
+    try:
+        mode = os.stat(path).st_mode & 0o777
+    except OSError:
+        mode = 0o666 & ~_UMASK
+    fd, tmp = tempfile.mkstemp(prefix='.tmp-', dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp, mode)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def atomic_write_json(path, obj, **kwargs):
+    """原子写入 JSON,kwargs 透传给 json.dumps"""
+    kwargs.setdefault('ensure_ascii', False)
+    atomic_write(path, json.dumps(obj, **kwargs))
+
+
+class DebouncedWriter:
+    """
+    延迟写回
+    mark_dirty() 只记一笔并(重新)计时,delay 秒内没有新的修改才真正调用 write();
+    flush() 立即写回未落盘的修改,进程退出和收到 SIGTERM/SIGHUP 时自动 flush
+    防抖到期的写回在后台线程里执行: 修改数据的一方要持有同一把 lock(可由调用方传入),
+    写回时就不会读到改到一半的数据
+    """
+    def __init__(self, write, delay=DEBOUNCE, lock=None):
+        self.write = write
+        self.delay = delay
+        self._dirty = False
+        self._timer = None
+        # 写回期间一直持有;调用方持有它时可以确定这段时间不会发生写回
+        self.lock = lock if lock is not None else threading.RLock()
+        atexit.register(self.flush)
+        self._install_signal_handlers()
+
+    def mark_dirty(self):
+        """标记有修改,重新开始防抖计时"""
+        with self.lock:
+            self._dirty = True
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(self.delay, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    @property
+    def dirty(self):
+        return self._dirty
+
+    def flush(self):
+        """立即写回(没有修改时什么都不做)"""
+        with self.lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._dirty:
+                return
+            self._dirty = False
+            try:
+                self.write()
+            except OSError:
+                self._dirty = True
+
+    def _install_signal_handlers(self):
+        """被 kill/关闭终端时先写回再退出(只接管仍是默认处理的信号)"""
+        if threading.current_thread() is not threading.main_thread():
+            return
+        for name in ('SIGTERM', 'SIGHUP'):
+            signum = getattr(signal, name, None)
+            if signum is None or signal.getsignal(signum) is not signal.SIG_DFL:
+                continue
+            signal.signal(signum, self._on_signal)
+
+    def _on_signal(self, signum, frame):
+        self.flush()
+        raise SystemExit(128 + signum)
@@ -0,0 +1,212 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+🎯 项目启动器 - 全屏实时过滤选择器
+基于 prompt_toolkit: 每按一个键就重新过滤,支持多选和预览窗格,
+排序在后台线程里进行,输入不会被卡住
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from prompt_toolkit.application import Application
+from prompt_toolkit.buffer import Buffer
+from prompt_toolkit.key_binding import KeyBindings
+from prompt_toolkit.layout import Layout, HSplit, VSplit, Window
+from prompt_toolkit.layout.controls import BufferControl, FormattedTextControl
+from prompt_toolkit.layout.dimension import Dimension
+from prompt_toolkit.styles import Style
+
+# 输入防抖(秒): 连续快速输入时只对最后一次排序
+DEBOUNCE = 0.03
+
+STYLE = Style.from_dict({
+    'title': 'bold',
+    'prompt': 'ansicyan bold',
+    'cursor-row': 'reverse',
+    'selected': 'ansigreen bold',
+    'dim': 'ansibrightblack',
+    'preview': '',
+    'status': 'ansibrightblack',
+})
+
+
+class ProjectPicker:
+    """
+    全屏选择器
+    search(query) -> 排好序的候选列表(在后台线程调用)
+    render_row(item) -> 单行文本, render_preview(item) -> 多行预览文本
+    """
+    def __init__(self, items, search, render_row, render_preview=None,
+                 title='', multi_select=True, initial_query=''):
+        self.items = list(items)
+        self.search = search
+        self.render_row = render_row
+        self.render_preview = render_preview
+        self.title = title
+        self.multi_select = multi_select
+
+        self.results = self.items
+        self.cursor = 0
+        self.offset = 0
+        self.selected = []
+        self._selected_ids = set()
+        self._task = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='picker')
+
+        self.buffer = Buffer(multiline=False)
+        self.buffer.text = initial_query
+        self.buffer.cursor_position = len(initial_query)
+        self.buffer.on_text_changed += self._on_text_changed
+        self.app = self._build_app()
+
+    # ---------- 布局 ----------
+
+    def _build_app(self):
+        results = Window(FormattedTextControl(self._render_results), wrap_lines=False)
+        body = [results]
+        if self.render_preview:
+            body += [
+                Window(width=1, char='│', style='class:dim'),
+                Window(FormattedTextControl(self._render_preview), width=Dimension(weight=2),
+                       wrap_lines=True, style='class:preview'),
+            ]
+            results.width = Dimension(weight=3)
+
+        hint = "↑↓ 移动 | PgUp/PgDn 翻页 | " + ("Tab 多选 | " if self.multi_select else "") + "Enter 确认 | Esc 取消"
+        layout = Layout(HSplit([
+            Window(FormattedTextControl(lambda: [('class:title', self.title)]), height=1),
+            VSplit([
+                Window(FormattedTextControl([('class:prompt', '🔍 ')]), width=3),
+                Window(BufferControl(self.buffer), height=1),
+            ], height=1),
+            Window(height=1, char='─', style='class:dim'),
+            VSplit(body),
+            Window(FormattedTextControl(self._render_status), height=1, style='class:status'),
+            Window(FormattedTextControl(hint), height=1, style='class:status'),
+        ]), focused_element=self.buffer)
+
+        return Application(layout=layout, key_bindings=self._build_keys(), style=STYLE,
+                           full_screen=True, mouse_support=False)
+
+    def _build_keys(self):
+        kb = KeyBindings()
+
+        @kb.add('up')
+        @kb.add('c-p')
+        def _(event):
+            self._move(-1)
+
+        @kb.add('down')
+        @kb.add('c-n')
+        def _(event):
+            self._move(1)
+
+        @kb.add('pageup')
+        def _(event):
+            self._move(-self._page_height())
+
+        @kb.add('pagedown')
+        def _(event):
+            self._move(self._page_height())
+
+        if self.multi_select:
+            @kb.add('tab')
+            def _(event):
+                self._toggle()
+                self._move(1)
+
+        @kb.add('enter')
+        def _(event):
+            if not self.selected and self.results:
+                self._toggle()
+            event.app.exit(result=list(self.selected))
+
+        @kb.add('escape', eager=True)
+        @kb.add('c-c')
+        def _(event):
+            event.app.exit(result=None)
+
+        return kb
+
+    # ---------- 渲染 ----------
+
+    def _page_height(self):
+        return max(1, self.app.output.get_size().rows - 6)
+
+    def _render_results(self):
+        if not self.results:
+            return [('class:dim', '  (没有匹配的项目)')]
+        height = self._page_height()
+        # 只渲染可见行: 光标始终保持在窗口内
+        if self.cursor < self.offset:
+            self.offset = self.cursor
+        elif self.cursor >= self.offset + height:
+            self.offset = self.cursor - height + 1
+
+        fragments = []
+        for i in range(self.offset, min(self.offset + height, len(self.results))):
+            item = self.results[i]
+            mark = '● ' if id(item) in self._selected_ids else '  '
+            style = 'class:cursor-row' if i == self.cursor else ''
+            if mark.strip() and i != self.cursor:
+                style = 'class:selected'
+            fragments.append((style, f"{'❯' if i == self.cursor else ' '}{mark}{self.render_row(item)}\n"))
+        return fragments
+
+    def _render_preview(self):
+        if not self.results:
+            return ''
+        return self.render_preview(self.results[self.cursor])
+
+    def _render_status(self):
+        text = f" {len(self.results)}/{len(self.items)} 个"
+        if self.selected:
+            text += f" | 已选 {len(self.selected)} 个"
+        return text
+
+    # ---------- 交互 ----------
+
+    def _move(self, delta):
+        if self.results:
+            self.cursor = max(0, min(len(self.results) - 1, self.cursor + delta))
+
+    def _toggle(self):
+        if not self.results:
+            return
+        item = self.results[self.cursor]
+        if id(item) in self._selected_ids:
+            self._selected_ids.discard(id(item))
+            self.selected.remove(item)
+        else:
+            self._selected_ids.add(id(item))
+            self.selected.append(item)
+
+    def _on_text_changed(self, buffer):
+        """每次输入都重新排序: 取消上一次尚未开始的排序,在后台线程算完再刷新"""
+        if self._task is not None:
+            self._task.cancel()
+        self._task = self.app.create_background_task(self._rerank(buffer.text))
+
+    async def _rerank(self, query):
+        await asyncio.sleep(DEBOUNCE)
+        loop = asyncio.get_running_loop()
+        results = await loop.run_in_executor(self._executor, self._search, query)
+        if query != self.buffer.text:
+            return
+        self.results = results
+        self.cursor = 0
+        self.offset = 0
+        self.app.invalidate()
+
+    def _search(self, query):
+        return self.search(query) if query.strip() else self.items
+
+    def run(self):
+        """运行选择器,返回选中的列表;取消返回 None"""
+        try:
+            if self.buffer.text:
+                self.results = self._search(self.buffer.text)
+            return self.app.run()
+        finally:
+            self._executor.shutdown(wait=False)
@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+🔮 项目启动器 - 预测下一个要打开的项目
+两张计数表,随每次打开增量更新并写入 predict.json:
+  next:  一阶马尔可夫转移 {上一个项目: {下一个项目: 次数}}(间隔超过 SESSION_GAP 不算连续)
+  hours: 按一天中的小时 {0-23: {项目: 次数}}
+预测时按 转移概率 × MARKOV_WEIGHT + 当前小时(含相邻小时)概率 × HOUR_WEIGHT 排序
+"""
+
+import json
+import time
+from datetime import datetime
+
+# 两次打开间隔超过 4 小时就不算同一串操作
+SESSION_GAP = 4 * 3600
+MARKOV_WEIGHT = 0.7
+HOUR_WEIGHT = 0.3
+# 相邻小时的权重(9 点常开的项目 8 点/10 点也可能打开)
+NEIGHBOR_HOUR_WEIGHT = 0.5
+# 一行计数合计超过上限时整体减半(旧习惯逐渐淡出,表的大小也有上限)
+ROW_LIMIT = 64
+# 至少出现过这么多次才参与预测
+MIN_COUNT = 2
+MIN_SCORE = 0.1
+
+
+class TransitionModel:
+    """{'last': [路径, 时间戳], 'next': {路径: {路径: 次数}}, 'hours': {'0'-'23': {路径: 次数}}}"""
+    def __init__(self, model_file):
+        self.model_file = model_file
+        self.load()
+
+    def load(self):
+        """从磁盘读入(文件不存在或损坏时为空)"""
+        try:
+            with open(self.model_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            data = {}
+        self.last = data.get('last')
+        self.next = data.get('next', {})
+        self.hours = data.get('hours', {})
+
+    def save(self):
+        from persist import atomic_write_json
+        atomic_write_json(self.model_file, {'last': self.last, 'next': self.next, 'hours': self.hours},
+                          separators=(',', ':'))
+
+    def record(self, path, when=None):
+        """记一次打开: 上一个项目 -> 这个项目 的转移,以及这个小时的计数"""
+        when = when or time.time()
+        previous = self._previous(when)
+        if previous and previous != path:
+            _bump(self.next.setdefault(previous, {}), path)
+        _bump(self.hours.setdefault(str(datetime.fromtimestamp(when).hour), {}), path)
+        self.last = [path, int(when)]
+
+    def discard(self, path):
+        """项目被删除"""
+        self.next.pop(path, None)
+        for row in list(self.next.values()) + list(self.hours.values()):
+            row.pop(path, None)
+        if self.last and self.last[0] == path:
+            self.last = None
+
+    def _previous(self, now):
+        """同一串操作里的上一个项目"""
+        if self.last and now - self.last[1] < SESSION_GAP:
+            return self.last[0]
+        return None
+
+    def predict(self, limit=3, now=None):
+        """最可能接着打开的项目 [(路径, 分数)],刚打开的那个除外"""
+        now = now or time.time()
+        previous = self._previous(now)
+        scores = {}
+        if previous:
+            for path, p in _probabilities(self.next.get(previous, {})):
+                scores[path] = p * MARKOV_WEIGHT
+
+        hour = datetime.fromtimestamp(now).hour
+        hour_counts = {}
+        for offset, weight in ((0, 1.0), (-1, NEIGHBOR_HOUR_WEIGHT), (1, NEIGHBOR_HOUR_WEIGHT)):
+            for path, count in self.hours.get(str((hour + offset) % 24), {}).items():
+                hour_counts[path] = hour_counts.get(path, 0) + count * weight
+        # 没有可用的转移时,小时分布占全部权重
+        hour_weight = HOUR_WEIGHT if scores else 1.0
+        for path, p in _probabilities(hour_counts):
+            scores[path] = scores.get(path, 0) + p * hour_weight
+
+        scores.pop(previous, None)
+        ranked = sorted(((path, score) for path, score in scores.items() if score >= MIN_SCORE),
+                        key=lambda x: x[1], reverse=True)
+        return ranked[:limit]
+
+
+def _bump(row, path):
+    row[path] = row.get(path, 0) + 1
+    if sum(row.values()) > ROW_LIMIT:
+        for key in list(row):
+            row[key] /= 2
+            if row[key] < 0.5:
+                del row[key]
+
+
+def _probabilities(counts):
+    """计数 -> [(路径, 占比)],次数不足 MIN_COUNT 的不参与"""
+    total = sum(counts.values())
+    return [(path, count / total) for path, count in counts.items() if count >= MIN_COUNT]
@@ -0,0 +1,220 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+📦 项目启动器 - 项目记录
+用 __slots__ 的轻量对象代替每个项目一个 dict: 默认值在加载时一次补齐,
+小写搜索键随记录保存,读写仍兼容原来的 projects.json 格式;
+描述/创建时间等冷字段单独存放,可以延迟加载(见 registry.py)
+"""
+
+import sys
+
+# projects.json 中每个项目的字段(按写回顺序)
+FIELD_NAMES = ('name', 'alias', 'path', 'ide', 'remark', 'tags',
+               'pinned', 'open_count', 'last_opened', 'created_at')
+
+
+def _lower(text):
+    """已经是小写时复用原字符串,不额外占内存"""
+    lowered = text.lower()
+    return text if lowered == text else lowered
+
+
+class ProjectDetail:
+    """冷数据: 描述/创建时间/未知字段,菜单列表用不到,可以按需再加载"""
+    __slots__ = ('remark', 'remark_lower', 'created_at', 'extra')
+
+    def __init__(self, remark='', created_at=None, extra=None):
+        self.remark = remark
+        self.remark_lower = _lower(remark)
+        self.created_at = created_at
+        self.extra = extra
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data.get('remark') or '', data.get('created_at'), data.get('extra'))
+
+
+class Project:
+    """
+    单个项目记录
+    热字段(名称/别名/路径/IDE/标签/置顶/打开次数/最近打开)直接存在槽里;
+    冷字段在 ProjectDetail 里,从分离存储加载时第一次访问才读取
+    """
+    __slots__ = ('name', 'alias', 'path', 'ide', 'tags', 'pinned', 'open_count', 'last_opened',
+                 'name_lower', 'alias_lower', '_detail', '_load_detail')
+
+    def __init__(self, name='', alias='', path='', ide='idea', remark='', tags=(),
+                 pinned=False, open_count=0, last_opened=None, created_at=None, extra=None):
+        self.name = name
+        self.alias = alias
+        self.path = path
+        # IDE 取值只有几种,驻留后所有记录共用同一个字符串
+        self.ide = sys.intern(ide)
+        self.tags = tuple(tags)
+        self.pinned = pinned
+        self.open_count = open_count
+        # 跳转表/排序按它算新近度,放在热字段里,不为它加载冷数据
+        self.last_opened = last_opened
+        # 不认识的字段原样保留(extra),写回时不丢
+        self._detail = ProjectDetail(remark, created_at, extra)
+        self._load_detail = None
+        self.refresh_keys()
+
+    @classmethod
+    def lazy(cls, name, alias, path, ide, tags, pinned, open_count, last_opened, load_detail):
+        """只带热字段创建,冷字段在第一次访问时调用 load_detail() 取得"""
+        project = cls.__new__(cls)
+        project.name = name
+        project.alias = alias
+        project.path = path
+        project.ide = sys.intern(ide)
+        project.tags = tuple(tags)
+        project.pinned = pinned
+        project.open_count = open_count
+        project.last_opened = last_opened
+        project._detail = None
+        project._load_detail = load_detail
+        project.refresh_keys()
+        return project
+
+    @property
+    def detail(self):
+        """冷字段(按需加载)"""
+        detail = self._detail
+        if detail is None:
+            load = self._load_detail
+            if load is None:
+                # 另一个线程(后台写回)刚刚加载完
+                return self._detail
+            detail = self._detail = ProjectDetail.from_dict(load())
+            self._load_detail = None
+        return detail
+
+    @property
+    def pending_detail(self):
+        """冷字段还没加载时返回加载函数,否则返回 None"""
+        return self._load_detail if self._detail is None else None
+
+    @property
+    def remark(self):
+        return self.detail.remark
+
+    @remark.setter
+    def remark(self, value):
+        detail = self.detail
+        detail.remark = value
+        detail.remark_lower = _lower(value)
+
+    @property
+    def remark_lower(self):
+        return self.detail.remark_lower
+
+    @property
+    def created_at(self):
+        return self.detail.created_at
+
+    @created_at.setter
+    def created_at(self, value):
+        self.detail.created_at = value
+
+    @property
+    def extra(self):
+        return self.detail.extra
+
+    def refresh_keys(self):
+        """重新计算小写搜索键(名称/别名修改后调用;描述的小写键随描述一起更新)"""
+        self.name_lower = _lower(self.name)
+        self.alias_lower = _lower(self.alias)
+
+    def update(self, **fields):
+        """批量修改字段并刷新搜索键"""
+        for key, value in fields.items():
+            if key == 'tags':
+                value = tuple(value)
+            elif key == 'ide':
+                value = sys.intern(value)
+            setattr(self, key, value)
+        self.refresh_keys()
+
+    @property
+    def display_name(self):
+        """列表里显示的名字: 别名优先"""
+        return self.alias or self.name
+
+    def matches(self, keyword_lower):
+        """名称/别名/描述是否包含关键词(关键词需已转小写)"""
+        return (keyword_lower in self.name_lower
+                or keyword_lower in self.alias_lower
+                or keyword_lower in self.remark_lower)
+
+    @classmethod
+    def from_dict(cls, data, default_ide='idea'):
+        """从 projects.json 的一项创建,缺失字段在这里一次补齐"""
+        extra = {key: value for key, value in data.items() if key not in FIELD_NAMES} or None
+        return cls(
+            name=data.get('name') or '',
+            alias=data.get('alias') or '',
+            path=data.get('path') or '',
+            ide=data.get('ide') or default_ide,
+            remark=data.get('remark') or '',
+            tags=data.get('tags') or (),
+            pinned=bool(data.get('pinned', False)),
+            open_count=data.get('open_count') or 0,
+            last_opened=data.get('last_opened'),
+            created_at=data.get('created_at'),
+            extra=extra,
+        )
+
+    def to_dict(self, keep_detail=True):
+        """
+        转回 projects.json 的格式
+        keep_detail=False 时冷字段只读不缓存(导出等一次性遍历,内存不随项目数增长)
+        """
+        ref = None if keep_detail else self.pending_detail
+        detail = ProjectDetail.from_dict(ref()) if ref else self.detail
+        data = {
+            'name': self.name,
+            'alias': self.alias,
+            'path': self.path,
+            'ide': self.ide,
+            'remark': detail.remark,
+            'tags': list(self.tags),
+            'pinned': self.pinned,
+            'open_count': self.open_count,
+        }
+        if self.last_opened is not None:
+            data['last_opened'] = self.last_opened
+        if detail.created_at is not None:
+            data['created_at'] = detail.created_at
+        if detail.extra:
+            data.update(detail.extra)
+        return data
+
+    def hot_record(self):
+        """热索引中的一条: [名称, 别名, 路径, IDE, 标签, 置顶, 打开次数, 最近打开]"""
+        return [self.name, self.alias, self.path, self.ide, list(self.tags), self.pinned, self.open_count,
+                self.last_opened]
+
+    def detail_dict(self):
+        """冷数据(写入明细文件)"""
+        detail = self.detail
+        data = {'remark': detail.remark}
+        if detail.created_at is not None:
+            data['created_at'] = detail.created_at
+        if detail.extra:
+            data['extra'] = detail.extra
+        return data
+
+    def __repr__(self):
+        return f"Project({self.name!r}, path={self.path!r})"
+
+
+def load_projects(items, default_ide='idea'):
+    """projects.json 的项目列表 -> [Project]"""
+    return [Project.from_dict(item, default_ide) for item in items]
+
+
+def dump_projects(projects):
+    """[Project] -> 可写入 projects.json 的列表"""
+    return [project.to_dict() for project in projects]
@@ -0,0 +1,187 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+📦 项目启动器 - 目录扫描
+基于 os.scandir 的并行目录遍历,统计项目大小/文件数/语言分布,
+结果按目录指纹缓存,目录没变就不再重复扫描
+"""
+
+import os
+import json
+import time
+import queue
+from concurrent.futures import ThreadPoolExecutor
+
+from persist import atomic_write_json
+
+# 并发上限 / 缓存兜底有效期(秒,指纹只看顶层目录,深层改动靠它兜底)
+MAX_WORKERS = 16
+CACHE_TTL = 86400
+
+# 默认忽略的目录: 版本控制 / IDE / 依赖 / 构建产物 / 缓存
+IGNORE_DIRS = {
+    '.git', '.svn', '.hg',
+    '.idea', '.vscode', '.vs',
+    'node_modules', 'bower_components', '.venv', 'venv',
+    'target', 'build', 'dist', 'out', 'bin', 'obj', '.gradle', '.next', '.nuxt',
+    '__pycache__', '.pytest_cache', '.mypy_cache', '.tox', '.cache', 'coverage',
+}
+
+# 扩展名 -> 语言
+LANGUAGES = {
+    '.py': 'Python', '.pyi': 'Python',
+    '.java': 'Java', '.kt': 'Kotlin', '.kts': 'Kotlin', '.scala': 'Scala', '.groovy': 'Groovy',
+    '.js': 'JavaScript', '.mjs': 'JavaScript', '.cjs': 'JavaScript', '.jsx': 'JavaScript',
+    '.ts': 'TypeScript', '.tsx': 'TypeScript', '.vue': 'Vue', '.svelte': 'Svelte',
+    '.html': 'HTML', '.htm': 'HTML', '.css': 'CSS', '.scss': 'CSS', '.less': 'CSS',
+    '.go': 'Go', '.rs': 'Rust', '.c': 'C', '.h': 'C',
+    '.cpp': 'C++', '.cc': 'C++', '.cxx': 'C++', '.hpp': 'C++',
+    '.cs': 'C#', '.php': 'PHP', '.rb': 'Ruby', '.swift': 'Swift', '.dart': 'Dart',
+    '.sh': 'Shell', '.bat': 'Batch', '.ps1': 'PowerShell',
+    '.sql': 'SQL', '.xml': 'XML', '.json': 'JSON', '.yml': 'YAML', '.yaml': 'YAML',
+    '.md': 'Markdown',
+}
+
+
+def _scan_dir(path, ignore):
+    """列出单个目录: 返回 ([(文件名, 大小)], [子目录路径])"""
+    files = []
+    subdirs = []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in ignore:
+                            subdirs.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        files.append((entry.name, entry.stat(follow_symlinks=False).st_size))
+                except OSError:
+                    pass
+    except OSError:
+        pass
+    return files, subdirs
+
+
+def walk(roots, visit, ignore=IGNORE_DIRS, max_workers=MAX_WORKERS):
+    """
+    并行遍历多个目录树,每个目录是一个任务,大项目也能吃满线程池
+    visit(root, dirpath, files) 在调用线程中依次回调,无需加锁
+    """
+    roots = list(roots)
+    if not roots:
+        return
+    results = queue.Queue()
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='scan') as executor:
+        def submit(root, path):
+            future = executor.submit(_scan_dir, path, ignore)
+            future.add_done_callback(lambda f: results.put((root, path, f)))
+
+        for root in roots:
+            submit(root, root)
+        outstanding = len(roots)
+
+        while outstanding:
+            root, path, future = results.get()
+            outstanding -= 1
+            files, subdirs = future.result()
+            visit(root, path, files)
+            for subdir in subdirs:
+                submit(root, subdir)
+                outstanding += 1
+
+
+def dir_fingerprint(path, ignore=IGNORE_DIRS):
+    """目录指纹: 根目录与一级子目录的 mtime,增删文件/目录都会改变它"""
+    try:
+        parts = [os.stat(path).st_mtime]
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.name not in ignore and entry.is_dir(follow_symlinks=False):
+                    parts.append(entry.stat(follow_symlinks=False).st_mtime)
+    except OSError:
+        return None
+    return f"{len(parts)}:{max(parts)}:{sum(parts)}"
+
+
+def format_size(size):
+    """字节数格式化为 1.2 GB 这样的可读形式"""
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == 'B' else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} TB"
+
+
+def _language(name):
+    return LANGUAGES.get(os.path.splitext(name)[1].lower())
+
+
+class StatsCache:
+    """项目统计缓存 - 指纹不变且未过期的项目直接复用上次结果"""
+    def __init__(self, cache_file, ttl=CACHE_TTL):
+        self.cache_file = cache_file
+        self.ttl = ttl
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f)
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def save(self):
+        """保存缓存文件"""
+        try:
+            atomic_write_json(self.cache_file, self.entries)
+        except OSError:
+            pass
+
+    def collect(self, paths):
+        """返回 {路径: 统计},只重新扫描指纹变化的项目"""
+        now = time.time()
+        stale = {}
+        missing = []
+        for path in paths:
+            fp = dir_fingerprint(path)
+            if fp is None:
+                # 目录已经不存在: 丢掉旧的统计,结果里也不再出现
+                missing.append(path)
+                continue
+            entry = self.entries.get(path)
+            if entry and entry.get('fp') == fp and now - entry.get('at', 0) < self.ttl:
+                continue
+            stale[path] = fp
+
+        if stale:
+            fresh = {path: {'size': 0, 'files': 0, 'dirs': 0, 'languages': {}} for path in stale}
+
+            def visit(root, dirpath, files):
+                stats = fresh[root]
+                stats['dirs'] += 1
+                for name, size in files:
+                    stats['size'] += size
+                    stats['files'] += 1
+                    lang = _language(name)
+                    if lang:
+                        counts = stats['languages'].setdefault(lang, [0, 0])
+                        counts[0] += 1
+                        counts[1] += size
+
+            walk(stale, visit)
+            for path, stats in fresh.items():
+                self.entries[path] = {'fp': stale[path], 'at': now, 'stats': stats}
+        dropped = [path for path in missing if self.entries.pop(path, None) is not None]
+        if stale or dropped:
+            self.save()
+
+        return {path: self.entries[path]['stats'] for path in paths if path in self.entries}
+
+
+def top_languages(stats, limit=3):
+    """按代码字节数取占比最高的几种语言: [(语言, 百分比)]"""
+    languages = stats.get('languages', {})
+    total = sum(size for _, size in languages.values())
+    if not total:
+        return []
+    ranked = sorted(languages.items(), key=lambda x: x[1][1], reverse=True)[:limit]
+    return [(lang, size * 100 / total) for lang, (_, size) in ranked]
@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+🗂️ 项目启动器 - 分离存储(热索引 + 冷明细)
+projects.json 仍是唯一的真实数据(可以手动编辑),这里是它的派生缓存:
+  registry_index.json   热索引: 设置 + 每个项目的名称/别名/路径/IDE/标签/置顶/打开次数/最近打开 + 明细位置
+  registry_detail.jsonl 冷明细: 每行一个项目的描述/创建时间/未知字段
+启动时只解析热索引,明细文件用 mmap 映射,某个项目的冷字段第一次被访问时才切片解析
+projects.json 被改过(mtime/大小对不上)时缓存失效,回退到完整解析并重建
+"""
+
+import os
+import json
+import mmap
+
+from persist import atomic_write, atomic_write_json
+from project import Project
+
+REGISTRY_VERSION = 2
+
+
+def _stat_key(path):
+    """用于判断 projects.json 是否变化: [mtime_ns, 大小]"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+class _DetailRef:
+    """明细文件中一个项目的位置;调用时解析成 dict"""
+    __slots__ = ('data', 'offset', 'length')
+
+    def __init__(self, data, offset, length):
+        self.data = data
+        self.offset = offset
+        self.length = length
+
+    def raw(self):
+        return self.data[self.offset:self.offset + self.length]
+
+    def __call__(self):
+        return json.loads(self.raw())
+
+
+class Registry:
+    """热索引/冷明细的读写"""
+    def __init__(self, index_file, detail_file, config_file):
+        self.index_file = index_file
+        self.detail_file = detail_file
+        self.config_file = config_file
+        self._mmap = None
+
+    def load(self):
+        """
+        从热索引加载配置: 返回 {..设置.., 'projects': [Project]},缓存不可用返回 None
+        项目的冷字段延迟到第一次访问时从 mmap 中读取
+        """
+        try:
+            with open(self.index_file, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if index.get('version') != REGISTRY_VERSION or index.get('source') != _stat_key(self.config_file):
+            return None
+
+        try:
+            with open(self.detail_file, 'rb') as f:
+                if os.fstat(f.fileno()).st_size != index.get('detail_size'):
+                    return None
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if index['detail_size'] else b''
+        except (OSError, ValueError):
+            return None
+        self.close()
+        self._mmap = mm
+
+        projects = [Project.lazy(name, alias, path, ide, tags, pinned, open_count, last_opened,
+                                 _DetailRef(mm, offset, length))
+                    for name, alias, path, ide, tags, pinned, open_count, last_opened, offset, length
+                    in index['projects']]
+        config = index['base']
+        config['projects'] = projects
+        return config
+
+    def save(self, config):
+        """projects.json 写完之后调用: 重建热索引和冷明细"""
+        projects = config['projects']
+        if os.name == 'nt':
+            # Windows 下被映射的文件不能替换: 先把还没读的冷字段全部读进来,再释放映射
+            for project in projects:
+                project.detail
+            self.close()
+
+        chunks = []
+        records = []
+        offset = 0
+        for project in projects:
+            ref = project.pending_detail
+            if isinstance(ref, _DetailRef) and ref.data is self._mmap:
+                # 没被访问过的冷字段不必解析,直接从映射里原样拷过去
+                chunk = ref.raw() + b'\n'
+            else:
+                chunk = json.dumps(project.detail_dict(), ensure_ascii=False).encode('utf-8') + b'\n'
+            records.append(project.hot_record() + [offset, len(chunk) - 1])
+            chunks.append(chunk)
+            offset += len(chunk)
+
+        base = {key: value for key, value in config.items() if key != 'projects'}
+        try:
+            atomic_write(self.detail_file, b''.join(chunks))
+            atomic_write_json(self.index_file, {
+                'version': REGISTRY_VERSION,
+                'source': _stat_key(self.config_file),
+                'detail_size': offset,
+                'base': base,
+                'projects': records,
+            }, separators=(',', ':'))
+        except OSError:
+            pass
+
+    def close(self):
+        """释放明细文件的映射(已经读出的冷字段不受影响)"""
+        if self._mmap:
+            self._mmap.close()
+        self._mmap = None
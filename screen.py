@@ -0,0 +1,146 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+🖥️ 项目启动器 - 差量终端渲染
+记住上一帧的内容,重绘时用 ANSI 光标控制只重写变化的行,
+代替每次 os.system('cls'/'clear') 起一个 shell 整屏重画
+"""
+
+import os
+import sys
+import shutil
+import unicodedata
+
+# 帧之后还会有提示/菜单输出(inquirer 最多显示 13 个选项),
+# 上一帧加上这部分超过终端高度时屏幕可能已滚动,只能整屏重画
+PROMPT_RESERVE = 20
+
+CURSOR_HOME = '\033[H'
+CLEAR_SCREEN = '\033[H\033[2J'
+CLEAR_EOL = '\033[K'
+CLEAR_EOS = '\033[J'
+
+
+def _char_width(ch):
+    if unicodedata.combining(ch) or ch in '\u200d\ufe0f':
+        return 0
+    return 2 if unicodedata.east_asian_width(ch) in ('W', 'F') else 1
+
+
+def display_width(text):
+    """终端显示宽度: 中日韩全角字符与 emoji 占两列,ANSI 颜色码不占宽度"""
+    width = 0
+    in_escape = False
+    for ch in text:
+        if in_escape:
+            if ch.isalpha():
+                in_escape = False
+            continue
+        if ch == '\033':
+            in_escape = True
+            continue
+        width += _char_width(ch)
+    return width
+
+
+def truncate(text, width, ellipsis='…'):
+    """按显示宽度截断纯文本(不含颜色码),超出时以省略号结尾"""
+    if display_width(text) <= width:
+        return text
+    limit = width - display_width(ellipsis)
+    used = 0
+    for i, ch in enumerate(text):
+        used += _char_width(ch)
+        if used > limit:
+            return text[:i] + ellipsis
+    return text
+
+
+def pad(text, width):
+    """按显示宽度右侧补空格(代替 f'{text:<width}',中文不会错位)"""
+    return text + ' ' * max(0, width - display_width(text))
+
+
+def _enable_windows_ansi():
+    """Windows 10+ 控制台默认不解析 ANSI 控制码,需要打开虚拟终端模式"""
+    try:
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)
+        mode = ctypes.c_uint32()
+        if kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            kernel32.SetConsoleMode(handle, mode.value | 0x0004)
+            return True
+    except Exception:
+        pass
+    return False
+
+
+class Screen:
+    """
+    差量渲染器
+    clear() 开始新的一帧, print() 写入帧缓冲, flush() 与上一帧逐行比较后输出差异
+    在等待输入(inquirer/input/prompt)之前必须 flush()
+    """
+    def __init__(self, stream=None):
+        self.stream = stream or sys.stdout
+        self.enabled = hasattr(self.stream, 'isatty') and self.stream.isatty()
+        if self.enabled and os.name == 'nt':
+            self.enabled = _enable_windows_ansi()
+        self._prev = None
+        self._frame = None
+        # 最近一次输出的帧(按行),供菜单快照等复用
+        self.last_frame = []
+
+    def clear(self):
+        """开始新的一帧(此时还不输出任何内容)"""
+        self.flush()
+        self._frame = []
+
+    def print(self, *args, sep=' ', end='\n', flush=False):
+        """写入当前帧;不在帧中时等同于 print"""
+        if self._frame is None:
+            print(*args, sep=sep, end=end, flush=flush)
+            return
+        self._frame.append(sep.join(str(arg) for arg in args) + end)
+        if flush:
+            self.flush()
+
+    def invalidate(self):
+        """下一帧整屏重画(例如输出了大量内容之后)"""
+        self._prev = None
+
+    def flush(self):
+        """把当前帧输出到终端,只重写和上一帧不同的行"""
+        if self._frame is None:
+            return
+        lines = ''.join(self._frame).split('\n')
+        self._frame = None
+        self.last_frame = lines
+
+        if not self.enabled:
+            self.stream.write('\n'.join(lines))
+            self.stream.flush()
+            return
+
+        size = shutil.get_terminal_size()
+        prev = self._prev
+        if (prev is None
+                or len(prev) + PROMPT_RESERVE > size.lines
+                or any(display_width(line) >= size.columns for line in lines)):
+            # 整屏重画(首次/可能已滚动/有折行)
+            out = [CLEAR_SCREEN, '\n'.join(line + CLEAR_EOL for line in lines)]
+        else:
+            out = [CURSOR_HOME]
+            last = len(lines) - 1
+            for i, line in enumerate(lines):
+                if i < len(prev) and prev[i] == line and i != last:
+                    out.append('\n')
+                else:
+                    out.append(line + CLEAR_EOL + ('\n' if i != last else ''))
+        # 清掉旧帧多出来的行和上次留下的提示区
+        out.append(CLEAR_EOS)
+
+        self.stream.write(''.join(out))
+        self.stream.flush()
+        self._prev = lines
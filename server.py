@@ -0,0 +1,268 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+🔌 项目启动器 - 本地 JSON-RPC 服务(open serve [端口])
+JSON-RPC 2.0 over HTTP/1.1: 只监听 127.0.0.1,连接保持(keep-alive),支持批量请求;
+编辑器插件/启动器连上之后每次按键的查询都在内存索引里完成,不必每次启动一个 open 进程
+每次请求前检查 projects.json 的 mtime/大小,被外部修改过就重新加载
+请求必须带 X-Promanager-Token 头(值在 ~/.project-manager/rpc_token,仅本用户可读),
+Host 头必须是 127.0.0.1:端口 或 localhost:端口(网页通过 DNS 重绑定指向本机时 Host 是它自己的域名)
+
+方法(params 为对象):
+  search {query?, limit?}        -> [项目]          按主菜单顺序,query 语法同筛选
+  open   {path | query, ide?}    -> 项目            打开并记一次打开
+  pin    {path, pinned?}         -> 项目            pinned 省略时切换
+  stats  {}                      -> 统计汇总
+"""
+
+import os
+import sys
+import hmac
+import json
+import secrets
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from core import ProjectStore, ProjectSearch, Launcher, LaunchError, project_record
+from paths import RPC_TOKEN_FILE
+
+DEFAULT_PORT = 7391
+SEARCH_LIMIT = 20
+TOKEN_HEADER = 'X-Promanager-Token'
+
+# JSON-RPC 2.0 错误码
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+# 应用错误: 项目不存在 / 打开失败
+PROJECT_NOT_FOUND = -32001
+LAUNCH_FAILED = -32002
+
+
+class RpcError(Exception):
+    """以 JSON-RPC 错误返回给调用方"""
+    def __init__(self, code, message):
+        super().__init__(message)
+        self.code = code
+
+
+def _error(req_id, code, message):
+    return {'jsonrpc': '2.0', 'id': req_id, 'error': {'code': code, 'message': message}}
+
+
+class ProjectService:
+    """RPC 方法的实现;请求串行执行(共享一把锁),查询都走内存中的排序/分面缓存"""
+    def __init__(self, store=None):
+        self.store = store or ProjectStore()
+        self.search = ProjectSearch(self.store)
+        self.launcher = Launcher(self.store)
+        self.lock = threading.Lock()
+        self.methods = {
+            'search': self.rpc_search,
+            'open': self.rpc_open,
+            'pin': self.rpc_pin,
+            'stats': self.rpc_stats,
+        }
+        self._warm()
+
+    def _warm(self):
+        """常驻进程一次读入所有冷字段(描述参与关键词匹配)并建好容错索引,避免第一轮查询现做"""
+        for project in self.store.projects:
+            project.detail
+        self.search.fuzzy_index()
+
+    def handle(self, payload):
+        """处理一个已解析的请求体: 返回响应(对象或列表),全是通知时返回 None"""
+        if isinstance(payload, list) and not payload:
+            return _error(None, INVALID_REQUEST, '空的批量请求')
+        with self.lock:
+            if self.store.reload_if_changed():
+                self._warm()
+            if not isinstance(payload, list):
+                return self._call(payload)
+            responses = [response for response in map(self._call, payload) if response is not None]
+        return responses or None
+
+    def _call(self, request):
+        """执行一个调用;通知(没有 id)不返回响应"""
+        if not isinstance(request, dict) or request.get('jsonrpc') != '2.0' \
+                or not isinstance(request.get('method'), str):
+            req_id = request.get('id') if isinstance(request, dict) else None
+            return _error(req_id, INVALID_REQUEST, '无效的请求')
+
+        req_id = request.get('id')
+        try:
+            method = self.methods.get(request['method'])
+            if method is None:
+                raise RpcError(METHOD_NOT_FOUND, f"没有这个方法: {request['method']}")
+            params = request.get('params', {})
+            if not isinstance(params, dict):
+                raise RpcError(INVALID_PARAMS, 'params 必须是对象')
+            result = method(params)
+        except RpcError as e:
+            response = _error(req_id, e.code, str(e))
+        except Exception as e:
+            response = _error(req_id, INTERNAL_ERROR, str(e))
+        else:
+            response = {'jsonrpc': '2.0', 'id': req_id, 'result': result}
+        return response if 'id' in request else None
+
+    def _find(self, params):
+        """按 path 精确查找,否则取 query 的第一个结果"""
+        path = params.get('path')
+        if path:
+            project = self.store.path_index().get(path)
+        elif params.get('query'):
+            matches = self.search.filter(str(params['query']), limit=1)
+            project = matches[0] if matches else None
+        else:
+            raise RpcError(INVALID_PARAMS, '需要 path 或 query')
+        if project is None:
+            raise RpcError(PROJECT_NOT_FOUND, f"找不到项目: {path or params['query']}")
+        return project
+
+    def rpc_search(self, params):
+        query = str(params.get('query') or '')
+        try:
+            limit = int(params.get('limit', SEARCH_LIMIT))
+        except (TypeError, ValueError):
+            raise RpcError(INVALID_PARAMS, 'limit 必须是整数')
+        projects = self.search.filter(query, limit=max(0, limit))
+        return [project_record(p) for p in projects]
+
+    def rpc_open(self, params):
+        project = self._find(params)
+        try:
+            # 不等宽限期(请求串行执行),启动后立即退出的情况只记入遥测
+            self.launcher.launch(project, params.get('ide'), wait=False)
+        except LaunchError as e:
+            raise RpcError(LAUNCH_FAILED, str(e))
+        return project_record(project)
+
+    def rpc_pin(self, params):
+        if not params.get('path'):
+            raise RpcError(INVALID_PARAMS, '需要 path')
+        project = self._find(params)
+        pinned = params.get('pinned')
+        with self.store.lock:
+            project.pinned = (not project.pinned) if pinned is None else bool(pinned)
+            self.store.changed(project)
+            self.store.save()
+        return project_record(project)
+
+    def rpc_stats(self, params):
+        return self.store.stats()
+
+
+class RpcHandler(BaseHTTPRequestHandler):
+    """POST 一个 JSON-RPC 请求体(单个或批量),响应同样是 JSON"""
+    protocol_version = 'HTTP/1.1'
+    server_version = 'promanager-rpc'
+    # 响应头和响应体分两次写出,开着 Nagle 算法时保持连接的每个请求都要多等一个延迟确认(~40ms)
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        length = self.headers.get('Content-Length')
+        if length is None or not length.isdigit():
+            # 不知道请求体在哪结束,这个连接不能再复用
+            self.close_connection = True
+            self._send(411, None)
+            return
+        # 先读完请求体,连接才能接着处理下一个请求
+        body = self.rfile.read(int(length))
+        if self.headers.get('Host') not in self.server.allowed_hosts:
+            self._send(403, None)
+            return
+        if not hmac.compare_digest(self.headers.get(TOKEN_HEADER, '').encode('utf-8'),
+                                   self.server.token.encode('utf-8')):
+            self._send(401, None)
+            return
+        # 只接受 application/json: 浏览器页面不能不经预检就跨站发这种请求
+        if self.headers.get_content_type() != 'application/json':
+            self._send(415, None)
+            return
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            response = _error(None, PARSE_ERROR, '请求不是合法的 JSON')
+        else:
+            response = self.server.service.handle(payload)
+        self._send(200 if response is not None else 204, response)
+
+    def _send(self, status, response):
+        body = b'' if response is None else json.dumps(response, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        if body:
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        """不逐条打印访问日志"""
+
+
+class RpcServer(ThreadingHTTPServer):
+    """每个连接一个线程,连接可以复用;只绑定本机地址,只接受带令牌、Host 为本机的请求"""
+    def __init__(self, service, token, port=DEFAULT_PORT, host='127.0.0.1'):
+        super().__init__((host, port), RpcHandler)
+        self.service = service
+        self.token = token
+        port = self.server_address[1]
+        self.allowed_hosts = {f'127.0.0.1:{port}', f'localhost:{port}'}
+
+
+def load_token(token_file=RPC_TOKEN_FILE):
+    """读取本机的访问令牌,第一次使用时生成(文件权限 0600,只有本用户可读)"""
+    try:
+        with open(token_file, 'r', encoding='utf-8') as f:
+            token = f.read().strip()
+        if token:
+            return token
+    except FileNotFoundError:
+        pass
+    token = secrets.token_urlsafe(32)
+    os.makedirs(os.path.dirname(token_file), exist_ok=True)
+    fd = os.open(token_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    # 文件原来就存在(空文件)时 O_CREAT 不改权限
+    os.chmod(token_file, 0o600)
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        f.write(token + '\n')
+    return token
+
+
+def main(args):
+    """open serve [端口] - 端口为 0 时由系统分配"""
+    try:
+        port = int(args[0]) if args else DEFAULT_PORT
+    except ValueError:
+        print(f"❌ 无效的端口: {args[0]}")
+        return 2
+
+    try:
+        token = load_token()
+    except OSError as e:
+        print(f"❌ 无法读取访问令牌 {RPC_TOKEN_FILE}: {e}")
+        return 1
+
+    service = ProjectService()
+    try:
+        server = RpcServer(service, token, port)
+    except OSError as e:
+        print(f"❌ 无法监听端口 {port}: {e}")
+        return 1
+
+    host, port = server.server_address[:2]
+    print(f"🔌 JSON-RPC 服务已启动: http://{host}:{port}/  (方法: search/open/pin/stats, Ctrl+C 停止)")
+    print(f"🔑 请求需带 {TOKEN_HEADER} 头,令牌在 {RPC_TOKEN_FILE}")
+    sys.stdout.flush()
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 服务已停止")
+    finally:
+        server.server_close()
+        service.store.flush()
+    return 0
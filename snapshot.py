@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+⚡ 项目启动器 - 主菜单快照
+退出时保存主菜单第一页已渲染好的文字,下次冷启动在加载 inquirer 之前先画出来,
+等 ProjectManager 初始化完成后再由真正的交互菜单接管
+本模块只依赖标准库(和同样轻量的 persist),保证能在最早的时机导入
+"""
+
+import os
+import json
+
+from persist import atomic_write_json
+
+SNAPSHOT_VERSION = 1
+# 快照最多保存的项目行数
+MAX_ROWS = 40
+# 给 inquirer 提示行和底部操作留出的行数
+FOOTER_RESERVE = 4
+
+
+class MenuSnapshot:
+    """
+    主菜单快照
+    frame: 标题/汇总等帧内容(经由 Screen 输出,可与真实菜单做差量重绘)
+    rows:  菜单前 N 行(已格式化),order: 这些行对应的项目路径顺序
+    """
+    def __init__(self, snapshot_file, config_file):
+        self.snapshot_file = snapshot_file
+        self.config_file = config_file
+        self.data = None
+        # 最近一次 update() 时的配置版本
+        self.revision = None
+        self._dirty = False
+
+    def _config_mtime(self):
+        try:
+            return os.stat(self.config_file).st_mtime_ns
+        except OSError:
+            return None
+
+    def load(self):
+        """读取快照;配置文件在快照之后被改过(项目增删/改名)则视为过期"""
+        try:
+            with open(self.snapshot_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if data.get('version') != SNAPSHOT_VERSION or data.get('config_mtime') != self._config_mtime():
+            return None
+        self.data = data
+        return data
+
+    def paint(self, screen, size):
+        """立即画出快照,返回是否画了"""
+        data = self.load()
+        if not data:
+            return False
+        frame = data.get('frame', [])
+        rows = data.get('rows', [])[:max(0, size.lines - len(frame) - FOOTER_RESERVE)]
+
+        screen.clear()
+        screen.print('\n'.join(frame), end='')
+        screen.flush()
+        # 项目行不算在帧里: 真实菜单接管时帧部分按行比较,这些行由 inquirer 重画
+        screen.stream.write('\n'.join(rows))
+        screen.stream.flush()
+        return True
+
+    def update(self, frame, rows, order, revision=None):
+        """记录最新一次渲染的主菜单(revision 为渲染时的配置版本),和上次保存的一样则不标记写回"""
+        rows = rows[:MAX_ROWS]
+        order = order[:MAX_ROWS]
+        self.revision = revision
+        current = self.data or {}
+        if current.get('frame') == frame and current.get('rows') == rows and current.get('order') == order:
+            return
+        self.data = {'version': SNAPSHOT_VERSION, 'frame': frame, 'rows': rows, 'order': order}
+        self._dirty = True
+
+    def save(self, revision=None):
+        """
+        写回快照(退出时、配置写回之后调用);记下配置文件的 mtime 用于下次判断是否过期
+        配置在渲染之后又改过(revision 不同)时,这些行已经不是配置文件里的样子,不写
+        """
+        if self.data is None or revision != self.revision:
+            return
+        mtime = self._config_mtime()
+        if not self._dirty and self.data.get('config_mtime') == mtime:
+            return
+        self.data['config_mtime'] = mtime
+        try:
+            atomic_write_json(self.snapshot_file, self.data)
+            self._dirty = False
+        except OSError:
+            pass
@@ -0,0 +1,194 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+🩺 项目启动器 - 启动监督
+LaunchSupervisor 负责启动 IDE 进程: 记录 Popen 耗时,宽限期(GRACE_PERIOD)内盯住子进程,
+启动后立即以非零退出码退出(JDK 不对/路径错误)就算打开失败,而不是照样提示 "已打开";
+回收线程只在宽限期内轮询,过了宽限期仍在运行的交给一个阻塞在 wait() 上的线程回收,
+常驻进程(交互菜单/RPC 服务)里不会留下僵尸进程,也不会在 IDE 运行期间一直轮询
+每次启动的结果写一行到 launches.ndjson,open stats 按 IDE 汇总
+"""
+
+import json
+import time
+import shutil
+import threading
+import subprocess
+
+import metrics
+
+# 宽限期(秒): 这段时间内以非零退出码退出视为启动失败
+GRACE_PERIOD = 1.0
+# 宽限期内回收线程的轮询间隔(秒)
+POLL_INTERVAL = 0.05
+# 遥测文件超过这个大小时只保留后一半
+TELEMETRY_MAX_BYTES = 1 << 20
+
+# 启动结果
+SPAWN_FAILED = 'spawn_failed'   # 进程没能启动
+EARLY_EXIT = 'early_exit'       # 宽限期内以非零退出码退出
+HANDOFF = 'handoff'             # 宽限期内正常退出(交给已经运行的 IDE 实例)
+RUNNING = 'running'             # 过了宽限期仍在运行
+
+
+class LaunchError(Exception):
+    """项目打不开: 没有配置 IDE 路径,启动进程失败,或启动后立即出错退出"""
+
+
+class Launch:
+    """一次启动: 进程、Popen 耗时与宽限期结束时的结果(settled 之前 outcome 为 None)"""
+    __slots__ = ('ide', 'path', 'proc', 'at', 'started', 'spawn_ms', 'outcome', 'code', 'settled')
+
+    def __init__(self, ide, path, proc, spawn_ms):
+        self.ide = ide
+        self.path = path
+        self.proc = proc
+        self.at = time.time()
+        self.started = time.monotonic()
+        self.spawn_ms = spawn_ms
+        self.outcome = None
+        self.code = None
+        self.settled = threading.Event()
+
+    def error(self):
+        """启动失败时的说明,否则为 None"""
+        if self.outcome == EARLY_EXIT:
+            return f"{self.ide.upper()} 启动后立即退出(退出码 {self.code})"
+        return None
+
+
+class LaunchSupervisor:
+    """启动 IDE 并在后台线程里盯住/回收子进程"""
+    def __init__(self, telemetry_file, grace=GRACE_PERIOD):
+        self.telemetry_file = telemetry_file
+        self.grace = grace
+        self._lock = threading.Lock()
+        # 还在宽限期内的启动
+        self._pending = []
+        self._thread = None
+
+    def spawn(self, ide, ide_path, path):
+        """启动 IDE 打开目录(不等待),返回 Launch;进程没能启动时抛出 LaunchError"""
+        if not ide_path:
+            raise LaunchError(f"未配置 {ide.upper()} 路径")
+        start = time.perf_counter()
+        try:
+            # 不经过 shell(列表参数配 shell=True 在 POSIX 上会丢掉目录参数);
+            # 只写了命令名的(cursor)按 PATH/PATHEXT 找到完整路径,Windows 下的 cursor.cmd 也能直接启动
+            proc = subprocess.Popen([shutil.which(ide_path) or ide_path, path],
+                                    stdout=subprocess.DEVNULL,
+                                    stderr=subprocess.DEVNULL)
+        except Exception as e:
+            spawn_ms = (time.perf_counter() - start) * 1000
+            self._record({'at': int(time.time()), 'ide': ide, 'path': path, 'spawn_ms': round(spawn_ms, 2),
+                          'outcome': SPAWN_FAILED, 'error': str(e)})
+            raise LaunchError(str(e)) from e
+
+        elapsed = time.perf_counter() - start
+        metrics.observe('promanager_launch_spawn_seconds', elapsed, (('ide', ide),))
+        launch = Launch(ide, path, proc, elapsed * 1000)
+        with self._lock:
+            self._pending.append(launch)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._watch, name='launch-reaper', daemon=True)
+                self._thread.start()
+        return launch
+
+    def settle(self, launches):
+        """等这些启动都过了宽限期(或提前退出);多个启动共用同一个截止时间"""
+        deadline = time.monotonic() + self.grace + 1
+        for launch in launches:
+            launch.settled.wait(max(0, deadline - time.monotonic()))
+
+    def _watch(self):
+        """回收线程: 宽限期内判定启动结果,仍在运行的交给阻塞在 wait() 上的线程回收;宽限期内没有启动时退出"""
+        while True:
+            time.sleep(POLL_INTERVAL)
+            settled = []
+            with self._lock:
+                now = time.monotonic()
+                pending = []
+                for launch in self._pending:
+                    code = launch.proc.poll()
+                    if code is not None:
+                        launch.outcome, launch.code = (EARLY_EXIT if code else HANDOFF), code
+                    elif now - launch.started >= self.grace:
+                        launch.outcome = RUNNING
+                        threading.Thread(target=launch.proc.wait, name='launch-wait', daemon=True).start()
+                    else:
+                        pending.append(launch)
+                        continue
+                    settled.append(launch)
+                self._pending = pending
+                if not self._pending:
+                    self._thread = None
+
+            for launch in settled:
+                self._record({'at': int(launch.at), 'ide': launch.ide, 'path': launch.path,
+                              'spawn_ms': round(launch.spawn_ms, 2), 'outcome': launch.outcome,
+                              'code': launch.code})
+                launch.settled.set()
+            if self._thread is None:
+                return
+
+    def _record(self, entry):
+        """追加一行遥测(单次 write 的追加写入,不 fsync);文件过大时截掉前一半"""
+        metrics.inc('promanager_launches', (('ide', entry['ide']), ('outcome', entry['outcome'])))
+        line = json.dumps(entry, ensure_ascii=False, separators=(',', ':')) + '\n'
+        try:
+            with open(self.telemetry_file, 'a', encoding='utf-8') as f:
+                f.write(line)
+                size = f.tell()
+            if size > TELEMETRY_MAX_BYTES:
+                _truncate_head(self.telemetry_file)
+        except OSError:
+            pass
+
+
+def _truncate_head(telemetry_file):
+    """只保留后一半的记录"""
+    from persist import atomic_write
+    with open(telemetry_file, 'r', encoding='utf-8') as f:
+        lines = f.readlines()
+    atomic_write(telemetry_file, ''.join(lines[len(lines) // 2:]))
+
+
+def read_telemetry(telemetry_file):
+    """全部启动记录(跳过损坏的行)"""
+    entries = []
+    try:
+        with open(telemetry_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entries.append(json.loads(line))
+                except ValueError:
+                    continue
+    except OSError:
+        pass
+    return entries
+
+
+def summarize(entries):
+    """按 IDE 汇总: {ide: {launches, failed, handoff, spawn_ms_p50, spawn_ms_p95}}"""
+    by_ide = {}
+    for entry in entries:
+        by_ide.setdefault(entry.get('ide') or '?', []).append(entry)
+
+    summary = {}
+    for ide, items in sorted(by_ide.items()):
+        latencies = sorted(e['spawn_ms'] for e in items if isinstance(e.get('spawn_ms'), (int, float)))
+        summary[ide] = {
+            'launches': len(items),
+            'failed': sum(1 for e in items if e.get('outcome') in (SPAWN_FAILED, EARLY_EXIT)),
+            'handoff': sum(1 for e in items if e.get('outcome') == HANDOFF),
+            'spawn_ms_p50': _percentile(latencies, 0.5),
+            'spawn_ms_p95': _percentile(latencies, 0.95),
+        }
+    return summary
+
+
+def _percentile(values, q):
+    """已排序列表的分位数(最近秩),空列表为 None"""
+    if not values:
+        return None
+    return values[min(len(values) - 1, max(0, int(round(q * len(values))) - 1))]
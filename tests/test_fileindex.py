@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+"""文件名索引: 只匹配文件名部分,已删除的项目不出现在结果里"""
+
+from fileindex import FileIndex
+
+
+def make_index(tmp_path, tree):
+    """tree: {项目名: [相对路径, ...]},返回 (索引, {项目名: 项目路径})"""
+    roots = {}
+    for name, files in tree.items():
+        root = tmp_path / name
+        for rel in files:
+            target = root / rel
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_text('')
+        roots[name] = str(root)
+    index = FileIndex(str(tmp_path / 'files.idx'))
+    index.update(list(roots.values()))
+    return index, roots
+
+
+def test_matches_basename_after_directory_hit(tmp_path):
+    index, roots = make_index(tmp_path, {'app': ['shop/shop.py', 'shop/cart.py']})
+    assert index.search('shop') == [(roots['app'], 'shop/shop.py')]
+
+
+def test_directory_only_hit_is_ignored(tmp_path):
+    index, _ = make_index(tmp_path, {'app': ['shop/cart.py']})
+    assert index.search('shop') == []
+
+
+def test_fragment_with_slash_matches_directories(tmp_path):
+    index, roots = make_index(tmp_path, {'app': ['shop/cart.py']})
+    assert index.search('shop/ca') == [(roots['app'], 'shop/cart.py')]
+
+
+def test_roots_skip_unregistered_projects(tmp_path):
+    index, roots = make_index(tmp_path, {'app': ['main.py'], 'old': ['main.py']})
+    hits = index.search('main', roots={roots['app']})
+    assert hits == [(roots['app'], 'main.py')]
+
+
+def test_index_survives_reload(tmp_path):
+    index, roots = make_index(tmp_path, {'app': ['README.md']})
+    reloaded = FileIndex(index.index_file)
+    assert reloaded.search('readme') == [(roots['app'], 'README.md')]
@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+"""RPC 服务: 只接受带令牌、Host 为本机地址的请求"""
+
+import os
+import re
+import sys
+import json
+import stat
+import threading
+import subprocess
+import http.client
+
+import pytest
+
+from server import RpcServer, load_token, TOKEN_HEADER
+
+TOKEN = 'test-token'
+
+
+class EchoService:
+    """代替 ProjectService: 原样返回请求"""
+    def handle(self, payload):
+        return {'jsonrpc': '2.0', 'id': payload.get('id'), 'result': payload.get('params')}
+
+
+@pytest.fixture
+def server():
+    server = RpcServer(EchoService(), TOKEN, port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def post(server, headers):
+    port = server.server_address[1]
+    conn = http.client.HTTPConnection('127.0.0.1', port, timeout=5)
+    body = json.dumps({'jsonrpc': '2.0', 'id': 1, 'method': 'search', 'params': {'query': 'x'}})
+    conn.request('POST', '/', body=body, headers=dict({'Content-Type': 'application/json'}, **headers))
+    response = conn.getresponse()
+    data = response.read()
+    conn.close()
+    return response.status, data
+
+
+def test_accepts_token_and_local_host(server):
+    port = server.server_address[1]
+    for host in (f'127.0.0.1:{port}', f'localhost:{port}'):
+        status, data = post(server, {'Host': host, TOKEN_HEADER: TOKEN})
+        assert status == 200
+        assert json.loads(data)['result'] == {'query': 'x'}
+
+
+def test_rejects_missing_or_wrong_token(server):
+    host = f'127.0.0.1:{server.server_address[1]}'
+    assert post(server, {'Host': host})[0] == 401
+    assert post(server, {'Host': host, TOKEN_HEADER: 'nope'})[0] == 401
+
+
+def test_rejects_rebound_host(server):
+    port = server.server_address[1]
+    for host in (f'evil.example:{port}', 'localhost', f'127.0.0.1:{port + 1}'):
+        assert post(server, {'Host': host, TOKEN_HEADER: TOKEN})[0] == 403
+
+
+def test_token_file_is_private_and_stable(tmp_path):
+    token_file = str(tmp_path / 'rpc_token')
+    token = load_token(token_file)
+    assert token and load_token(token_file) == token
+    if os.name == 'posix':
+        assert stat.S_IMODE(os.stat(token_file).st_mode) == 0o600
+
+
+# ---- 真实的 ProjectService: 在临时 HOME 下启动 open serve ----
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def write_config(home, projects):
+    config_dir = home / '.project-manager'
+    config_dir.mkdir(exist_ok=True)
+    data = {'settings': {'default_ide': 'idea', 'theme': 'default'}, 'projects': projects}
+    (config_dir / 'projects.json').write_text(json.dumps(data, ensure_ascii=False, indent=2))
+
+
+def make_project(root, name, readme='', **fields):
+    path = root / name
+    path.mkdir()
+    if readme:
+        (path / 'README.md').write_text(readme)
+    return dict({'name': name, 'alias': '', 'path': str(path), 'ide': 'idea', 'remark': '',
+                 'tags': [], 'pinned': False, 'open_count': 0}, **fields)
+
+
+@pytest.fixture
+def live(tmp_path):
+    """(调用函数, 临时 HOME, 项目根目录);IDE 是立即正常退出的脚本"""
+    if os.name != 'posix':
+        pytest.skip('假 IDE 依赖 #! 脚本')
+    if os.path.exists(os.path.join(REPO, 'config.json')):
+        pytest.skip('本地 config.json 会覆盖测试用的 IDE 路径')
+    home = tmp_path / 'home'
+    home.mkdir()
+    root = tmp_path / 'projects'
+    root.mkdir()
+    ide = tmp_path / 'ide'
+    ide.write_text(f"#!{sys.executable}\nimport sys\n")
+    ide.chmod(0o755)
+    write_config(home, [
+        make_project(root, 'shop', alias='sp', tags=['backend'], open_count=3),
+        make_project(root, 'admin', readme='Dashboard for warehouse inventory'),
+    ])
+    config_dir = home / '.project-manager'
+    (config_dir / 'ide_config.json').write_text(json.dumps({'ide_paths': {'idea': str(ide)},
+                                                            'default_ide': 'idea'}))
+
+    env = dict(os.environ, HOME=str(home))
+    proc = subprocess.Popen([sys.executable, os.path.join(REPO, 'open.py'), 'serve', '0'],
+                            env=env, stdout=subprocess.PIPE, text=True)
+    try:
+        line = proc.stdout.readline()
+        port = int(re.search(r':(\d+)/', line).group(1))
+        token = (config_dir / 'rpc_token').read_text().strip()
+        conn = http.client.HTTPConnection('127.0.0.1', port, timeout=10)
+
+        def call(payload):
+            body = payload if isinstance(payload, str) else json.dumps(payload)
+            conn.request('POST', '/', body=body,
+                         headers={'Content-Type': 'application/json', TOKEN_HEADER: token})
+            response = conn.getresponse()
+            data = response.read()
+            return response.status, (json.loads(data) if data else None)
+
+        yield call, home, root
+        conn.close()
+    finally:
+        proc.terminate()
+        proc.wait(10)
+
+
+def request(method, params=None, req_id=1):
+    payload = {'jsonrpc': '2.0', 'method': method, 'params': params or {}}
+    if req_id is not None:
+        payload['id'] = req_id
+    return payload
+
+
+def test_search_open_pin_stats(live):
+    call, home, root = live
+    status, response = call(request('search', {'query': 'tag:backend'}))
+    assert status == 200
+    assert [p['name'] for p in response['result']] == ['shop']
+
+    # 名称/别名匹配不到时用 README 全文兜底
+    _, response = call(request('search', {'query': 'warehouse'}))
+    assert [p['name'] for p in response['result']] == ['admin']
+
+    _, response = call(request('open', {'query': 'sp'}))
+    assert response['result']['open_count'] == 4
+
+    path = str(root / 'admin')
+    _, response = call(request('pin', {'path': path}))
+    assert response['result']['pinned'] is True
+    _, response = call(request('search', {'query': 'pinned:yes'}))
+    assert [p['path'] for p in response['result']] == [path]
+
+    _, response = call(request('stats'))
+    assert response['result']['total'] == 2
+    assert response['result']['total_opens'] == 4
+
+
+def test_batch_and_notifications(live):
+    call, _, _ = live
+    status, response = call([request('search', {'query': 'shop'}, 1),
+                             request('stats', req_id=None),
+                             request('stats', req_id=2)])
+    assert status == 200
+    assert [r['id'] for r in response] == [1, 2]
+
+    # 只有通知: 没有响应体
+    assert call(request('stats', req_id=None)) == (204, None)
+    assert call([request('stats', req_id=None)]) == (204, None)
+
+
+def test_error_codes(live):
+    call, _, _ = live
+    assert call('{oops')[1]['error']['code'] == -32700
+    assert call([])[1]['error']['code'] == -32600
+    assert call({'id': 1, 'method': 'search'})[1]['error']['code'] == -32600
+    assert call(request('nope'))[1]['error']['code'] == -32601
+    assert call(request('search', {'limit': 'x'}))[1]['error']['code'] == -32602
+    assert call(request('pin', {}))[1]['error']['code'] == -32602
+    assert call(request('open', {'path': '/no/such/project'}))[1]['error']['code'] == -32001
+
+
+def test_external_edit_is_reloaded(live):
+    call, home, root = live
+    assert call(request('search', {'query': 'tag:backend'}))[1]['result']
+    # 全文索引先建好,重新加载后要跟着刷新
+    assert call(request('search', {'query': 'warehouse'}))[1]['result']
+    # 另一个进程改了 projects.json(新增带 README 的项目、去掉标签)
+    write_config(home, [
+        make_project(root, 'billing', readme='Invoices and payment reconciliation service'),
+        dict(make_project(root, 'shop2'), name='shop'),
+    ])
+    _, response = call(request('search', {'query': 'tag:backend'}))
+    assert response['result'] == []
+    _, response = call(request('search', {'query': 'reconciliation'}))
+    assert [p['name'] for p in response['result']] == ['billing']
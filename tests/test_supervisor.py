@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""启动监督: 宽限期内的退出码决定启动结果,目录参数原样传给 IDE"""
+
+import os
+import sys
+import json
+
+import pytest
+
+from supervisor import (LaunchSupervisor, LaunchError, read_telemetry, summarize,
+                        EARLY_EXIT, HANDOFF, RUNNING, SPAWN_FAILED)
+
+
+def fake_ide(tmp_path, name, body):
+    """写一个假的 IDE 可执行文件(用当前 Python 解释器运行)"""
+    script = tmp_path / name
+    script.write_text(f"#!{sys.executable}\nimport sys, time\n{body}\n")
+    script.chmod(0o755)
+    return str(script)
+
+
+pytestmark = pytest.mark.skipif(os.name != 'posix', reason='假 IDE 依赖 #! 脚本')
+
+
+@pytest.fixture
+def supervisor(tmp_path):
+    return LaunchSupervisor(str(tmp_path / 'launches.ndjson'), grace=0.3)
+
+
+def launch(supervisor, ide_path, path='/tmp/project'):
+    result = supervisor.spawn('cursor', ide_path, path)
+    supervisor.settle([result])
+    return result
+
+
+def test_directory_reaches_the_ide(tmp_path, supervisor):
+    out = tmp_path / 'argv.json'
+    ide = fake_ide(tmp_path, 'cursor', f"import json; json.dump(sys.argv[1:], open({str(out)!r}, 'w'))")
+    result = launch(supervisor, ide, '/tmp/my project')
+    assert result.outcome == HANDOFF
+    assert json.loads(out.read_text()) == ['/tmp/my project']
+
+
+def test_early_exit_is_an_error(tmp_path, supervisor):
+    result = launch(supervisor, fake_ide(tmp_path, 'crash', 'sys.exit(3)'))
+    assert result.outcome == EARLY_EXIT and result.code == 3
+    assert result.error()
+
+
+def test_long_running_ide_is_running(tmp_path, supervisor):
+    result = launch(supervisor, fake_ide(tmp_path, 'slow', 'time.sleep(1)'))
+    assert result.outcome == RUNNING and result.error() is None
+
+
+def test_missing_executable_raises_and_is_recorded(tmp_path, supervisor):
+    with pytest.raises(LaunchError):
+        supervisor.spawn('idea', str(tmp_path / 'missing'), '/tmp/project')
+    entries = read_telemetry(supervisor.telemetry_file)
+    assert [e['outcome'] for e in entries] == [SPAWN_FAILED]
+    assert summarize(entries)['idea']['failed'] == 1
+
+
+def test_unconfigured_path_raises(supervisor):
+    with pytest.raises(LaunchError):
+        supervisor.spawn('idea', '', '/tmp/project')
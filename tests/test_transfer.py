@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+"""NDJSON 导入: 坏行跳过并报告,标签与新增/编辑项目一样规范化"""
+
+import json
+
+from project import Project
+from transfer import import_projects
+
+
+def lines(*records):
+    return [r if isinstance(r, str) else json.dumps(r, ensure_ascii=False) for r in records]
+
+
+def test_mixed_valid_and_invalid_lines():
+    projects = []
+    result = import_projects(lines(
+        {'path': '/x/a', 'name': 'a'},
+        '{not json',
+        {'path': '/x/b', 'name': 5},
+        {'path': '/x/c', 'alias': ['c']},
+        {'path': '/x/d', 'tags': {'a': 1}},
+        {'path': '/x/e', 'tags': ['web', 3]},
+        {'name': 'no path'},
+        {'path': '/x/f', 'open_count': 'many'},
+        {'path': '/x/g', 'ide': 'vscode'},
+    ), projects)
+    assert [p.path for p in projects] == ['/x/a', '/x/g']
+    assert [p.path for p in result.added] == ['/x/a', '/x/g']
+    assert [lineno for lineno, _ in result.errors] == [2, 3, 4, 5, 6, 7, 8]
+
+
+def test_tags_are_normalized():
+    projects = []
+    import_projects(lines(
+        {'path': '/x/a', 'tags': ['Backend', ' web ', 'backend']},
+        {'path': '/x/b', 'tags': 'Backend, API'},
+    ), projects)
+    assert projects[0].tags == ('backend', 'web')
+    assert projects[1].tags == ('backend', 'api')
+
+
+def test_merged_tags_are_normalized():
+    projects = [Project(name='a', path='/x/a', tags=['web'])]
+    result = import_projects(lines({'path': '/x/a', 'tags': 'Backend', 'open_count': 2}), projects)
+    assert result.merged == projects
+    assert projects[0].tags == ('web', 'backend')
+    assert projects[0].open_count == 2
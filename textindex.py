@@ -0,0 +1,155 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+📖 项目启动器 - 全文索引
+把每个项目的 README 和清单文件(package.json / pom.xml / pyproject.toml ...)里的描述
+建成本地倒排索引,按 TF-IDF 排序;按文件 mtime 增量刷新
+"""
+
+import os
+import re
+import json
+import math
+from concurrent.futures import ThreadPoolExecutor
+
+from persist import atomic_write_json
+
+MAX_WORKERS = 8
+# README 只读前 64KB,足够覆盖介绍部分
+MAX_README_BYTES = 64 * 1024
+
+README_NAMES = {'readme', 'readme.md', 'readme.rst', 'readme.txt', 'readme.markdown', 'readme_cn.md', 'readme.zh-cn.md'}
+MANIFEST_NAMES = {'package.json', 'composer.json', 'pom.xml', 'pyproject.toml', 'setup.cfg', 'setup.py', 'cargo.toml', 'build.gradle'}
+
+STOP_WORDS = {
+    'the', 'and', 'for', 'with', 'this', 'that', 'you', 'are', 'can', 'from', 'your', 'use', 'will',
+    'not', 'all', 'have', 'has', 'but', 'its', 'our', 'into', 'was', 'how', 'run', 'see', 'also',
+}
+
+_WORD_RE = re.compile(r'[a-z0-9]+|[一-鿿]+')
+_MANIFEST_PATTERNS = [
+    re.compile(r'"(?:description|keywords)"\s*:\s*(".*?"|\[.*?\])', re.S),
+    re.compile(r'<(?:description|name)>(.*?)</(?:description|name)>', re.S),
+    re.compile(r'^\s*(?:description|keywords)\s*=\s*(.+)$', re.M),
+    re.compile(r'description\s*=\s*[\'"](.+?)[\'"]'),
+]
+
+
+def tokenize(text):
+    """英文/数字按单词切分,中文按相邻两字切分(单字保留)"""
+    tokens = []
+    for word in _WORD_RE.findall(text.lower()):
+        if '一' <= word[0] <= '鿿':
+            if len(word) == 1:
+                tokens.append(word)
+            else:
+                tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+        elif len(word) > 1 and word not in STOP_WORDS:
+            tokens.append(word)
+    return tokens
+
+
+def _source_files(path):
+    """项目根目录下参与索引的文件: {文件名: mtime}"""
+    sources = {}
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                name = entry.name.lower()
+                if name in README_NAMES or name in MANIFEST_NAMES:
+                    try:
+                        if entry.is_file():
+                            sources[entry.name] = entry.stat().st_mtime
+                    except OSError:
+                        pass
+    except OSError:
+        pass
+    return sources
+
+
+def _read_document(path, names):
+    """读取 README 全文(截断)与清单文件中的描述字段,返回词频"""
+    parts = []
+    for name in names:
+        try:
+            with open(os.path.join(path, name), 'r', encoding='utf-8', errors='replace') as f:
+                text = f.read(MAX_README_BYTES)
+        except OSError:
+            continue
+        if name.lower() in README_NAMES:
+            parts.append(text)
+        else:
+            for pattern in _MANIFEST_PATTERNS:
+                parts.extend(pattern.findall(text))
+
+    tf = {}
+    for token in tokenize('\n'.join(parts)):
+        tf[token] = tf.get(token, 0) + 1
+    return tf
+
+
+class TextIndex:
+    """README/描述全文索引 - 倒排表 + TF-IDF"""
+    def __init__(self, index_file, max_workers=MAX_WORKERS):
+        self.index_file = index_file
+        self.max_workers = max_workers
+        self.docs = {}
+        self._postings = None
+        try:
+            with open(index_file, 'r', encoding='utf-8') as f:
+                self.docs = json.load(f)
+        except (OSError, ValueError):
+            self.docs = {}
+
+    def save(self):
+        """保存索引"""
+        try:
+            atomic_write_json(self.index_file, self.docs, separators=(',', ':'))
+        except OSError:
+            pass
+
+    def refresh(self, paths):
+        """增量刷新: 源文件 mtime 有变化的项目才重新读取,返回刷新的项目数"""
+        registered = set(paths)
+        removed = [path for path in self.docs if path not in registered]
+        for path in removed:
+            del self.docs[path]
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='text-index') as executor:
+            sources = dict(zip(paths, executor.map(_source_files, paths)))
+            stale = [path for path in paths
+                     if self.docs.get(path, {}).get('mtimes') != sources[path]]
+            docs = executor.map(lambda path: _read_document(path, sorted(sources[path])), stale)
+            for path, tf in zip(stale, docs):
+                self.docs[path] = {'mtimes': sources[path], 'tf': tf, 'len': sum(tf.values())}
+
+        if stale or removed:
+            self._postings = None
+            self.save()
+        return len(stale)
+
+    def _build_postings(self):
+        """倒排表: 词 -> {项目路径: 词频}"""
+        postings = {}
+        for path, doc in self.docs.items():
+            for term, count in doc['tf'].items():
+                postings.setdefault(term, {})[path] = count
+        self._postings = postings
+
+    def search(self, query, limit=20):
+        """TF-IDF 排序搜索,返回 [(项目路径, 得分)]"""
+        if self._postings is None:
+            self._build_postings()
+        terms = set(tokenize(query))
+        total = len(self.docs)
+        scores = {}
+        for term in terms:
+            posting = self._postings.get(term)
+            if not posting:
+                continue
+            idf = math.log((total + 1) / len(posting)) + 1
+            for path, count in posting.items():
+                length = self.docs[path]['len'] or 1
+                scores[path] = scores.get(path, 0) + (count / math.sqrt(length)) * idf
+        ranked = sorted(scores.items(), key=lambda x: x[1], reverse=True)
+        return ranked[:limit]
@@ -5,8 +5,13 @@
 灵感来自: Oh My Zsh, Starship, Powerlevel10k 等流行主题
 """
 
+from collections import namedtuple
+
 from inquirer.themes import Theme
 
+# 编译后的调色板: 渲染时直接取字段,不再逐行 getattr;不可变,可作为缓存键
+Palette = namedtuple('Palette', ['name', 'accent_color', 'text_color', 'dim_color'])
+
 
 class DefaultTheme(Theme):
     """默认主题 - 柔和的蓝紫色"""
@@ -162,8 +167,24 @@ THEME_DESCRIPTIONS = {
 }
 
 
+_PALETTES = {}
+
+
+def compile_palette(theme):
+    """把主题的自定义颜色编译成调色板,同一主题只编译一次"""
+    name = type(theme).__name__
+    palette = _PALETTES.get(name)
+    if palette is None:
+        palette = Palette(name,
+                          getattr(theme, 'accent_color', '\033[95m'),
+                          getattr(theme, 'text_color', '\033[37m'),
+                          getattr(theme, 'dim_color', '\033[90m'))
+        _PALETTES[name] = palette
+    return palette
+
+
 def get_theme(theme_name='default'):
-    """获取主题实例"""
+    """获取主题实例(调色板用 compile_palette(theme) 取得)"""
     theme_class = THEMES.get(theme_name.lower(), DefaultTheme)
     return theme_class()
 
@@ -0,0 +1,153 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+📤 项目启动器 - NDJSON 导入导出
+每行一个项目(与 projects.json 中的一项格式相同),逐行读写,内存占用与文件大小无关
+导入按规范化后的路径去重: 已有的项目合并计数,新项目追加,最后由调用方统一保存一次
+"""
+
+import os
+import json
+
+from project import Project
+from facets import parse_tags
+
+# 必须是字符串的字段(可以省略或为 null)
+TEXT_FIELDS = ('name', 'alias', 'ide', 'remark', 'last_opened', 'created_at')
+
+
+def normalize_path(path):
+    """用于去重的路径键: 展开 ~、转绝对路径、去掉末尾分隔符,Windows 下不区分大小写"""
+    path = os.path.abspath(os.path.expanduser(path))
+    return os.path.normcase(path.rstrip('\\/') or path)
+
+
+def export_projects(projects, out):
+    """逐行写出,返回导出的项目数"""
+    count = 0
+    for project in projects:
+        out.write(json.dumps(project.to_dict(keep_detail=False), ensure_ascii=False))
+        out.write('\n')
+        count += 1
+    return count
+
+
+class ImportResult:
+    """导入结果"""
+    def __init__(self):
+        self.added = []
+        self.merged = []
+        self.errors = []
+        # (行号, 别名): 与已有项目重复、没有采用的别名
+        self.alias_conflicts = []
+
+
+def _check_record(record):
+    """
+    检查一行导入记录的字段类型,不对时抛出 ValueError;
+    标签与新增/编辑项目一样经过 parse_tags(去空白、转小写、去重),可以是列表或逗号分隔的字符串
+    """
+    if not isinstance(record, dict):
+        raise ValueError('不是 JSON 对象')
+    path = record.get('path')
+    if not isinstance(path, str) or not path:
+        raise ValueError('缺少 path')
+    for field in TEXT_FIELDS:
+        if record.get(field) is not None and not isinstance(record[field], str):
+            raise ValueError(f'{field} 必须是字符串')
+    tags = record.get('tags')
+    if tags is None:
+        tags = []
+    elif isinstance(tags, str):
+        tags = parse_tags(tags)
+    elif isinstance(tags, list) and all(isinstance(tag, str) for tag in tags):
+        tags = parse_tags(','.join(tags))
+    else:
+        raise ValueError('tags 必须是字符串列表或逗号分隔的字符串')
+    record['tags'] = tags
+    count = record.get('open_count') or 0
+    if isinstance(count, bool) or not isinstance(count, (int, float, str)):
+        raise ValueError('open_count 必须是数字')
+    record['open_count'] = int(count)
+
+
+def _merge(project, record, aliases):
+    """
+    把导入记录合并进已有项目: 次数相加,时间取较新/较早,标签取并集,空字段补齐
+    补的别名已被其他项目占用时不补,返回这个别名(否则返回 None)
+    """
+    project.open_count += record['open_count']
+    project.pinned = project.pinned or bool(record.get('pinned', False))
+    tags = list(project.tags)
+    for tag in record['tags']:
+        if tag not in tags:
+            tags.append(tag)
+    fields = {'tags': tags}
+    conflict = None
+    if not project.alias and record.get('alias'):
+        if record['alias'] in aliases:
+            conflict = record['alias']
+        else:
+            fields['alias'] = record['alias']
+            aliases.add(record['alias'])
+    if not project.remark and record.get('remark'):
+        fields['remark'] = record['remark']
+    project.update(**fields)
+
+    last_opened = record.get('last_opened')
+    if last_opened and (not project.last_opened or last_opened > project.last_opened):
+        project.last_opened = last_opened
+    created_at = record.get('created_at')
+    if created_at and (not project.created_at or created_at < project.created_at):
+        project.created_at = created_at
+    return conflict
+
+
+def import_projects(lines, projects, default_ide='idea'):
+    """
+    逐行导入到 projects(原地追加/合并),返回 ImportResult
+    同一批里重复的路径也会合并;别名与已有项目冲突时不采用,记入 alias_conflicts
+    """
+    result = ImportResult()
+    by_path = {normalize_path(p.path): p for p in projects if p.path}
+    aliases = {p.alias for p in projects if p.alias}
+    touched = set()
+
+    for lineno, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+            _check_record(record)
+            path = record['path']
+            key = normalize_path(path)
+            project = by_path.get(key)
+            if project is None:
+                record['path'] = os.path.abspath(os.path.expanduser(path))
+                record['name'] = record.get('name') or os.path.basename(record['path']) or record['path']
+                new_project = Project.from_dict(record, default_ide)
+        except (ValueError, TypeError) as e:
+            result.errors.append((lineno, str(e)))
+            continue
+
+        if project is not None:
+            conflict = _merge(project, record, aliases)
+            if conflict:
+                result.alias_conflicts.append((lineno, conflict))
+            if id(project) not in touched:
+                touched.add(id(project))
+                result.merged.append(project)
+            continue
+
+        project = new_project
+        if project.alias in aliases:
+            result.alias_conflicts.append((lineno, project.alias))
+            project.update(alias='')
+        elif project.alias:
+            aliases.add(project.alias)
+        projects.append(project)
+        by_path[key] = project
+        touched.add(id(project))
+        result.added.append(project)
+    return result